@@ -0,0 +1,99 @@
+"""
+Day arithmetic, differences, sorting and hashing on the ordinal representation.
+
+Compares against the original approach, which went through datetime.date
+for every + / - and built (year, month, day) tuples for every comparison
+and hash. Month steps are compared against the Gregorian round-trip that
+callers wrote before add_months existed.
+
+Run from the repo root:
+    python -m benchmarks.bench_arithmetic
+"""
+import random
+import timeit
+from datetime import date, timedelta
+
+from gaian_calendar import GaianDate
+from gaian_calendar._convert import gregorian_to_gaian, is_leap_year
+
+
+# ---------------------------------------------------------------------------
+# Original implementation (for comparison only)
+# ---------------------------------------------------------------------------
+
+def _legacy_add(d: GaianDate, delta: timedelta) -> GaianDate:
+    return GaianDate(*gregorian_to_gaian(d.to_gregorian() + delta))
+
+
+def _legacy_sub(a: GaianDate, b: GaianDate) -> timedelta:
+    return a.to_gregorian() - b.to_gregorian()
+
+
+def _legacy_key(d: GaianDate) -> tuple[int, int, int]:
+    return (d.year, d.month, d.day)
+
+
+def _legacy_add_months(d: GaianDate, months: int) -> GaianDate:
+    year, month = d.year, d.month + months
+    while month > (14 if is_leap_year(year) else 13):
+        month -= 14 if is_leap_year(year) else 13
+        year += 1
+    day = min(d.day, 7) if month == 14 else d.day
+    doy = (month - 1) * 28 + day - 1
+    greg = date.fromisocalendar(year - 10_000, doy // 7 + 1, doy % 7 + 1)
+    return GaianDate(*gregorian_to_gaian(greg))
+
+
+class _LegacyOrder:
+    """Wraps a date with the original tuple-building __lt__."""
+
+    __slots__ = ("d",)
+
+    def __init__(self, d: GaianDate) -> None:
+        self.d = d
+
+    def __lt__(self, other: "_LegacyOrder") -> bool:
+        a, b = self.d, other.d
+        return (a.year, a.month, a.day) < (b.year, b.month, b.day)
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def _best(stmt, number: int) -> float:
+    """Best-of-5 time per call, in nanoseconds."""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main(number: int = 100_000, size: int = 100_000) -> None:
+    a = GaianDate(12026, 3, 15)
+    b = GaianDate(12020, 7, 1)
+    week = timedelta(weeks=1)
+    rng = random.Random(0)
+    dates = [GaianDate.fromordinal(rng.randrange(700_000, 750_000)) for _ in range(size)]
+
+    cases = [
+        ("date + timedelta", lambda: _legacy_add(a, week), lambda: a + week),
+        ("date - date", lambda: _legacy_sub(a, b), lambda: a - b),
+        ("date < date", lambda: _legacy_key(a) < _legacy_key(b), lambda: a < b),
+        ("add_months(1)", lambda: _legacy_add_months(a, 1), lambda: a.add_months(1)),
+        ("add_months(40)", lambda: _legacy_add_months(a, 40), lambda: a.add_months(40)),
+        ("hash(date)", lambda: hash(_legacy_key(a)), lambda: hash(a)),
+    ]
+    print(f"{'operation':<30}{'legacy ns':>12}{'current ns':>12}{'speedup':>10}")
+    for name, legacy, current in cases:
+        before = _best(legacy, number)
+        after = _best(current, number)
+        print(f"{name:<30}{before:>12.0f}{after:>12.0f}{before / after:>9.2f}x")
+
+    # Sorting through __lt__ pays a Python call per comparison; the integer
+    # key is the fast path for large lists.
+    before = _best(lambda: sorted(dates, key=_LegacyOrder), 1) / size
+    for name, key in (("sort", None), ("sort key=toordinal", GaianDate.toordinal)):
+        after = _best(lambda: sorted(dates, key=key), 1) / size
+        print(f"{name + ' (per item)':<30}{before:>12.0f}{after:>12.0f}{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Per-construction cost of GaianDate with the precomputed year table.
+
+Compares the current validation/conversion path against the original
+implementation, which called date(y, 12, 28).isocalendar() for every leap
+check and date.isocalendar() / date.fromisocalendar() for every conversion.
+
+Run from the repo root:
+    python -m benchmarks.bench_construction
+"""
+import timeit
+from datetime import date
+
+from gaian_calendar import GaianDate
+from gaian_calendar._convert import gregorian_to_gaian, gaian_to_gregorian, validate_date
+
+
+# ---------------------------------------------------------------------------
+# Original implementation (for comparison only)
+# ---------------------------------------------------------------------------
+
+def _legacy_is_leap_year(gaian_year: int) -> bool:
+    return date(gaian_year - 10_000, 12, 28).isocalendar()[1] == 53
+
+
+def _legacy_validate_date(year: int, month: int, day: int) -> None:
+    if year < 10_001 or year > 19_999:
+        raise ValueError(year)
+    max_month = 14 if _legacy_is_leap_year(year) else 13
+    if month < 1 or month > max_month:
+        raise ValueError(month)
+    if day < 1 or day > (7 if month == 14 else 28):
+        raise ValueError(day)
+
+
+def _legacy_gregorian_to_gaian(d: date) -> tuple[int, int, int]:
+    iso_year, iso_week, iso_weekday = d.isocalendar()
+    return iso_year + 10_000, (iso_week - 1) // 4 + 1, (iso_week - 1) % 4 * 7 + iso_weekday
+
+
+def _legacy_gaian_to_gregorian(year: int, month: int, day: int) -> date:
+    iso_week = (month - 1) * 4 + (day - 1) // 7 + 1
+    return date.fromisocalendar(year - 10_000, iso_week, (day - 1) % 7 + 1)
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def _best(stmt, number: int) -> float:
+    """Best-of-5 time per call, in nanoseconds."""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main(number: int = 200_000) -> None:
+    greg = date(2026, 7, 4)
+    cases = [
+        ("validate_date",
+         lambda: _legacy_validate_date(12026, 3, 15),
+         lambda: validate_date(12026, 3, 15)),
+        ("gregorian_to_gaian",
+         lambda: _legacy_gregorian_to_gaian(greg),
+         lambda: gregorian_to_gaian(greg)),
+        ("gaian_to_gregorian",
+         lambda: _legacy_gaian_to_gregorian(12026, 3, 15),
+         lambda: gaian_to_gregorian(12026, 3, 15)),
+        ("GaianDate(...) + validation",
+         lambda: (_legacy_validate_date(12026, 3, 15), GaianDate.__new__(GaianDate)),
+         lambda: GaianDate(12026, 3, 15)),
+    ]
+    print(f"{'operation':<30}{'legacy ns':>12}{'current ns':>12}{'speedup':>10}")
+    for name, legacy, current in cases:
+        before = _best(legacy, number)
+        after = _best(current, number)
+        print(f"{name:<30}{before:>12.0f}{after:>12.0f}{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
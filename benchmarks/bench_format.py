@@ -0,0 +1,109 @@
+"""
+Formatting with compiled, cached patterns versus the original per-call scan.
+
+The original format_date ran a token regex's findall() and a 16-branch
+if/elif chain on every call, resolving month and weekday dicts up front.
+
+Run from the repo root:
+    python -m benchmarks.bench_format
+"""
+import re
+import timeit
+
+from gaian_calendar import GaianDate, format_many
+from gaian_calendar._convert import day_of_week, day_of_year
+from gaian_calendar._data import get_month, get_weekday, number_word, ordinal
+from gaian_calendar._format import _TOKENS
+
+PATTERNS = [
+    "MMMM d, yyyy GE",
+    "yyyy-MM-dd",
+    "WWWW, MMMM d, yyyy GE",
+    "MMM* DDD",
+    "dddd of MMMM",
+]
+
+
+# ---------------------------------------------------------------------------
+# Original implementation (for comparison only)
+# ---------------------------------------------------------------------------
+
+_TOKEN_PATTERN = re.compile(
+    "(" + "|".join(re.escape(t) for t in _TOKENS) + r"|.)",
+    re.DOTALL,
+)
+
+
+def _legacy_format_date(year: int, month: int, day: int, pattern: str) -> str:
+    month_data = get_month(month)
+    weekday_data = get_weekday(day_of_week(day))
+    doy = day_of_year(month, day)
+    parts = []
+    for token in _TOKEN_PATTERN.findall(pattern):
+        if token == "yyyy":
+            parts.append(str(year))
+        elif token == "yy":
+            parts.append(f"{(year - 10_000) % 100:02d}")
+        elif token == "MMMM":
+            parts.append(month_data["name"])
+        elif token == "MMM*":
+            parts.append(month_data["symbol"])
+        elif token == "MMM":
+            parts.append(month_data["abbrev"])
+        elif token == "MM":
+            parts.append(f"{month:02d}")
+        elif token == "M":
+            parts.append(str(month))
+        elif token == "dddd":
+            parts.append(number_word(day))
+        elif token == "ddd":
+            parts.append(ordinal(day))
+        elif token == "dd":
+            parts.append(f"{day:02d}")
+        elif token == "d":
+            parts.append(str(day))
+        elif token == "WWWW":
+            parts.append(weekday_data["name"])
+        elif token == "WWW":
+            parts.append(weekday_data["abbrev"])
+        elif token == "W":
+            parts.append(weekday_data["symbol"])
+        elif token == "DDD":
+            parts.append(f"{doy:03d}")
+        else:
+            parts.append(token)
+    return "".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def _best(stmt, number: int) -> float:
+    """Best-of-5 time per call, in nanoseconds."""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main(number: int = 100_000) -> None:
+    d = GaianDate(12026, 3, 15)
+    print(f"{'pattern':<30}{'legacy ns':>12}{'current ns':>12}{'speedup':>10}")
+    for pattern in PATTERNS:
+        assert _legacy_format_date(12026, 3, 15, pattern) == d.format(pattern)
+        before = _best(lambda: _legacy_format_date(12026, 3, 15, pattern), number)
+        after = _best(lambda: d.format(pattern), number)
+        print(f"{pattern:<30}{before:>12.0f}{after:>12.0f}{before / after:>9.2f}x")
+    before = _best(lambda: _legacy_format_date(12026, 3, 15, "MMMM d, yyyy GE"), number)
+    after = _best(lambda: str(d), number)
+    print(f"{'str(date)':<30}{before:>12.0f}{after:>12.0f}{before / after:>9.2f}x")
+
+    # Bulk: per-row GaianDate construction + format versus format_many over tuples
+    rows = [(12020 + i % 10, i % 13 + 1, i % 28 + 1) for i in range(number)]
+    for pattern in PATTERNS[:3]:
+        before = _best(lambda: [GaianDate(*row).format(pattern) for row in rows], 1) / number
+        after = _best(lambda: list(format_many(pattern, rows)), 1) / number
+        label = f"format_many {pattern}"
+        print(f"{label[:29]:<30}{before:>12.0f}{after:>12.0f}{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
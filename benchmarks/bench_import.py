@@ -0,0 +1,71 @@
+"""
+Import-time budget for `import gaian_calendar`.
+
+Runs a fresh interpreter with -X importtime several times and reports the
+best cumulative time of the gaian_calendar package, plus every module it
+loads that a bare interpreter does not. Exits non-zero if the best time is
+over the budget or a module that must stay lazy was imported, so it can
+guard CI against regressions.
+
+The default budget leaves headroom for slow, shared CI machines; on a
+typical workstation the import takes a few milliseconds. The module check
+is the stricter guard: it does not depend on machine speed.
+
+Run from the repo root:
+    python -m benchmarks.bench_import [--max-ms 30] [--runs 20]
+"""
+import argparse
+import subprocess
+import sys
+
+# Must only load when their feature is used
+FORBIDDEN = (
+    "re", "typing", "numpy",
+    "gaian_calendar._parse", "gaian_calendar._grid",
+    "gaian_calendar.daterange", "gaian_calendar._vectorized",
+    "gaian_calendar.recurrence",
+)
+
+
+def _importtime(code: str) -> dict[str, tuple[int, int]]:
+    """Return {module: (self_us, cumulative_us)} for one fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-ms", type=float, default=30.0, help="budget for the best run")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    baseline = set(_importtime("pass"))
+    runs = [_importtime("import gaian_calendar") for _ in range(args.runs)]
+    best = min(run["gaian_calendar"][1] for run in runs) / 1000
+    extra = sorted(set(runs[0]) - baseline)
+
+    print(f"import gaian_calendar: best {best:.2f} ms of {args.runs} runs (budget {args.max_ms:.2f} ms)")
+    print(f"modules loaded ({len(extra)}): {', '.join(extra)}")
+
+    failed = False
+    if best > args.max_ms:
+        print(f"FAIL: over budget by {best - args.max_ms:.2f} ms")
+        failed = True
+    for name in FORBIDDEN:
+        if name in runs[0]:
+            print(f"FAIL: {name} is imported eagerly")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Scaling of convert_parallel across worker processes.
+
+Writes a temporary file of ISO dates and converts it with 1, 2, … workers
+(up to the CPU count, or --workers), reading byte ranges in the workers and
+returning packed ordinal arrays. A plain single-process loop over
+gregorian_to_gaian is the baseline; efficiency is speedup / workers.
+
+Run from the repo root:
+    python -m benchmarks.bench_parallel [--lines 2000000] [--workers 1 2 4]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+from gaian_calendar import convert_parallel
+from gaian_calendar._convert import gregorian_to_gaian
+
+
+def _write_dates(path: str, lines: int) -> None:
+    rng = random.Random(2026)
+    start = date(1990, 1, 1)
+    with open(path, "w") as f:
+        for _ in range(lines):
+            f.write(f"{(start + timedelta(rng.randrange(20_000))).isoformat()}\n")
+
+
+def _serial(path: str) -> int:
+    count = 0
+    with open(path) as f:
+        for line in f:
+            gregorian_to_gaian(date.fromisoformat(line[:10]))
+            count += 1
+    return count
+
+
+def _parallel(path: str, workers: int, chunk_size: int) -> int:
+    return sum(len(chunk) for chunk in convert_parallel(
+        path, workers=workers, chunk_size=chunk_size, packed=True))
+
+
+def _best(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return min(times)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=2_000_000)
+    parser.add_argument("--workers", type=int, nargs="+")
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    cpus = os.cpu_count() or 1
+    counts = args.workers or sorted({1, *(2 ** k for k in range(1, cpus.bit_length())), cpus})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dates.txt")
+        _write_dates(path, args.lines)
+        print(f"{args.lines:,} lines, {cpus} CPUs, chunk size {args.chunk_size:,}")
+        baseline = _best(lambda: _serial(path), args.repeat)
+        print(f"{'workers':>8} {'seconds':>9} {'dates/s':>12} {'speedup':>8} {'efficiency':>11}")
+        print(f"{'serial':>8} {baseline:9.3f} {args.lines / baseline:12,.0f} {1:8.2f}x {'':>11}")
+        for workers in counts:
+            seconds = _best(lambda: _parallel(path, workers, args.chunk_size), args.repeat)
+            speedup = baseline / seconds
+            print(f"{workers:>8} {seconds:9.3f} {args.lines / seconds:12,.0f} "
+                  f"{speedup:8.2f}x {speedup / workers:10.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
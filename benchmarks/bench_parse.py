@@ -0,0 +1,79 @@
+"""
+GaianDate.parse / parse_many versus the original implementation.
+
+The original parse compiled its three regexes through re.fullmatch with
+string patterns on each call and constructed every result through the
+validating constructor.
+
+Run from the repo root:
+    python -m benchmarks.bench_parse
+"""
+import random
+import re
+import timeit
+
+from gaian_calendar import GaianDate, parse_many
+from gaian_calendar._data import get_month_by_name
+from gaian_calendar._parse import parse_fields
+
+SHAPES = {
+    "iso": "12026-03-15",
+    "slash": "3/15/12026",
+    "named": "Aquarius 15, 12026",
+    "named GE": "Aquarius 15, 12026 GE",
+}
+
+
+# ---------------------------------------------------------------------------
+# Original implementation (for comparison only)
+# ---------------------------------------------------------------------------
+
+def _legacy_parse(s: str) -> GaianDate:
+    s = s.strip().rstrip(" GE").strip().rstrip(",").strip()
+    m = re.fullmatch(r"(\d{5})-(\d{1,2})-(\d{1,2})", s)
+    if m:
+        return GaianDate(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+    m = re.fullmatch(r"(\d{1,2})/(\d{1,2})/(\d{5})", s)
+    if m:
+        return GaianDate(int(m.group(3)), int(m.group(1)), int(m.group(2)))
+    m = re.fullmatch(r"([A-Za-z]+)\s+(\d{1,2}),?\s*(\d{5})", s)
+    if m:
+        return GaianDate(int(m.group(3)), get_month_by_name(m.group(1))["number"], int(m.group(2)))
+    raise ValueError(s)
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def _best(stmt, number: int) -> float:
+    """Best-of-5 time per call, in nanoseconds."""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main(number: int = 50_000) -> None:
+    print(f"{'case':<30}{'legacy ns':>12}{'current ns':>12}{'speedup':>10}")
+    for name, text in SHAPES.items():
+        before = _best(lambda: _legacy_parse(text), number)
+        after = _best(lambda: GaianDate.parse(text), number)
+        print(f"{name + ' (repeated)':<30}{before:>12.0f}{after:>12.0f}{before / after:>9.2f}x")
+
+    # Distinct strings: every call misses the cache
+    rng = random.Random(0)
+    for name, pattern in (("iso", "yyyy-MM-dd"), ("named", "MMMM d, yyyy GE")):
+        strings = [
+            GaianDate.fromordinal(rng.randrange(700_000, 750_000)).format(pattern)
+            for _ in range(number)
+        ]
+
+        def current():
+            parse_fields.cache_clear()
+            return list(parse_many(strings))
+
+        before = _best(lambda: [_legacy_parse(s) for s in strings], 1) / number
+        after = _best(current, 1) / number
+        print(f"{'parse_many ' + name + ' (distinct)':<30}{before:>12.0f}{after:>12.0f}{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Recurrence rules for a scheduling pass.
+
+The legacy path is what callers wrote before GaianRule existed: step day
+by day from the rule's start, testing each date against the rule's month,
+day-of-month and weekday filters. Each case evaluates many distinct rules
+(random months, days and weekdays), as a scheduler does.
+
+Run from the repo root:
+    python -m benchmarks.bench_recurrence [--rules 500]
+"""
+import argparse
+import itertools
+import random
+import timeit
+
+from gaian_calendar import GaianDate, GaianRule
+
+
+def _legacy(start: GaianDate, months, days, weekdays):
+    """Yield matching dates by testing every day from ``start``."""
+    ordinal = start.toordinal()
+    while True:
+        d = GaianDate.fromordinal(ordinal)
+        if d.month in months and d.day in days and d.day_of_week in weekdays:
+            yield d
+        ordinal += 1
+
+
+def _legacy_after(start, filters, when: GaianDate) -> GaianDate:
+    return next(d for d in _legacy(start, *filters) if d > when)
+
+
+def _best(stmt, number: int) -> float:
+    """Best-of-5 time per call, in nanoseconds."""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main(size: int = 500) -> None:
+    rng = random.Random(0)
+    start = GaianDate(12026, 1, 1)
+    when = GaianDate(12026, 9, 10)
+    specs = []
+    for _ in range(size):
+        # Every rule has a Friday, so each case finds its occurrences
+        days = set(rng.sample(range(1, 29), 3)) | {rng.choice((5, 12, 19, 26))}
+        weekdays = {5, rng.randint(1, 7)}
+        specs.append((set(rng.sample(range(1, 15), 5)), days, weekdays))
+
+    def build(months, days, weekdays):
+        return GaianRule("monthly", start, months=months, days=days, weekdays=weekdays)
+
+    rules = [build(*spec) for spec in specs]
+    fridays = GaianRule("weekly", start, weekdays=[5])
+
+    print(f"{'case (per rule)':<34}{'legacy ns':>12}{'current ns':>12}{'speedup':>10}")
+    cases = (
+        ("build + next after a date",
+         lambda: [_legacy_after(start, spec, when) for spec in specs],
+         lambda: [build(*spec).after(when) for spec in specs]),
+        ("100th occurrence",
+         lambda: [next(itertools.islice(_legacy(start, *spec), 100, None)) for spec in specs],
+         lambda: [rule[100] for rule in rules]),
+        ("first 20 Fridays in the rule",
+         lambda: [list(itertools.islice(_legacy(start, m, d, w & {5}), 20)) for m, d, w in specs],
+         lambda: [list(itertools.islice(rule & fridays, 20)) for rule in rules]),
+    )
+    for name, legacy, current in cases:
+        before = _best(legacy, 1) / size
+        after = _best(current, 1) / size
+        print(f"{name:<34}{before:>12.0f}{after:>12.0f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rules", type=int, default=500)
+    main(parser.parse_args().rules)
@@ -0,0 +1,273 @@
+"""
+Benchmark suite for the core operations, with machine-readable output.
+
+Times conversions, construction, formatting, parsing, timedelta
+arithmetic, recurrence and workday queries, sorting and hashing over n
+distinct inputs per case, and reports nanoseconds per item (best of
+--repeat runs). Inputs come from a fixed seed, so runs on different
+commits measure the same work.
+
+Run from the repo root:
+    python -m benchmarks.bench_suite                      # n = 1e3, 1e4, 1e5
+    python -m benchmarks.bench_suite --sizes 1e6,1e7      # needs several GB at 1e7
+    python -m benchmarks.bench_suite --json base.json     # save a baseline
+    python -m benchmarks.bench_suite --compare base.json  # fail on regressions
+
+With --compare, every case is matched to the baseline by (name, n) and the
+ratio current / baseline is printed; the exit status is 1 if any ratio is
+above --threshold (default 1.25, generous because timings are noisy).
+New fast paths get their own case names here, so they are tracked against
+the same baseline.
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+
+from gaian_calendar import GaianDate
+from gaian_calendar._convert import gaian_to_gregorian, gregorian_to_gaian
+from gaian_calendar._parse import parse_fields
+
+FORMAT_PATTERNS = {
+    "default": "MMMM d, yyyy GE",
+    "iso": "yyyy-MM-dd",
+    "long": "WWWW, MMMM d, yyyy GE",
+}
+
+PARSE_SHAPES = {
+    "iso": "yyyy-MM-dd",
+    "slash": "M/d/yyyy",
+    "named": "MMMM d, yyyy",
+    "named_ge": "MMMM d, yyyy GE",
+}
+
+# Gregorian ordinals of Gaian years 10001-19999 (ISO years 1-9999)
+_FIRST = date(1, 1, 1).toordinal() + 7
+_LAST = date(9999, 12, 24).toordinal()
+
+
+# ---------------------------------------------------------------------------
+# Cases: setup(n, rng) returns a zero-argument callable that does n items
+# ---------------------------------------------------------------------------
+
+def _ordinals(n: int, rng: random.Random) -> list[int]:
+    return [rng.randrange(_FIRST, _LAST) for _ in range(n)]
+
+
+def _dates(n: int, rng: random.Random) -> list[GaianDate]:
+    return [GaianDate.fromordinal(o) for o in _ordinals(n, rng)]
+
+
+def _setup_gregorian_to_gaian(n, rng):
+    gregorian = [date.fromordinal(o) for o in _ordinals(n, rng)]
+    return lambda: [gregorian_to_gaian(d) for d in gregorian]
+
+
+def _setup_gaian_to_gregorian(n, rng):
+    fields = [(d.year, d.month, d.day) for d in _dates(n, rng)]
+    return lambda: [gaian_to_gregorian(y, m, d) for y, m, d in fields]
+
+
+def _setup_from_timestamp(n, rng):
+    stamps = sorted((o - 719_163) * 86_400 + rng.randrange(86_400) for o in _ordinals(n, rng))
+    return lambda: [GaianDate.from_timestamp(t) for t in stamps]
+
+
+def _setup_init(n, rng):
+    fields = [(d.year, d.month, d.day) for d in _dates(n, rng)]
+    return lambda: [GaianDate(y, m, d) for y, m, d in fields]
+
+
+def _setup_format(pattern):
+    def setup(n, rng):
+        dates = _dates(n, rng)
+        return lambda: [d.format(pattern) for d in dates]
+    return setup
+
+
+def _setup_parse(pattern):
+    def setup(n, rng):
+        strings = [d.format(pattern) for d in _dates(n, rng)]
+
+        def run():
+            parse_fields.cache_clear()
+            return [GaianDate.parse(s) for s in strings]
+        return run
+    return setup
+
+
+def _setup_add(n, rng):
+    dates = _dates(n, rng)
+    deltas = [timedelta(days=rng.randrange(-365, 365)) for _ in range(n)]
+    return lambda: [d + delta for d, delta in zip(dates, deltas)]
+
+
+def _setup_datetime_add(n, rng):
+    from datetime import time as time_of_day
+    from gaian_calendar import GaianDateTime
+
+    stamps = [GaianDateTime.combine(d, time_of_day(rng.randrange(24), rng.randrange(60)))
+              for d in _dates(n, rng)]
+    deltas = [timedelta(minutes=rng.randrange(-10_000, 10_000)) for _ in range(n)]
+    return lambda: [t + delta for t, delta in zip(stamps, deltas)]
+
+
+def _setup_add_months(n, rng):
+    dates = _dates(n, rng)
+    months = [rng.randrange(-30, 30) for _ in range(n)]
+    return lambda: [d.add_months(k) for d, k in zip(dates, months)]
+
+
+def _setup_rule_after(n, rng):
+    from gaian_calendar import GaianRule
+
+    start = GaianDate(12026, 1, 1)
+    rules = [GaianRule("monthly", start, days=rng.sample(range(1, 29), 2)) for _ in range(n)]
+    dates = _dates(n, rng)
+    return lambda: [rule.after(d) for rule, d in zip(rules, dates)]
+
+
+def _setup_add_workdays(n, rng):
+    from gaian_calendar import GaianHolidays, add_workdays
+
+    dates = _dates(n, rng)
+    holidays = GaianHolidays(_dates(200, rng))
+    # Step towards the middle of the range so no result falls outside it
+    counts = [rng.randrange(500) * (1 if d.year < 15_000 else -1) for d in dates]
+    return lambda: [add_workdays(d, k, holidays) for d, k in zip(dates, counts)]
+
+
+def _setup_subtract(n, rng):
+    dates = _dates(n, rng)
+    others = _dates(n, rng)
+    return lambda: [a - b for a, b in zip(dates, others)]
+
+
+def _setup_sort(n, rng):
+    dates = _dates(n, rng)
+    return lambda: sorted(dates)
+
+
+def _setup_sort_key(n, rng):
+    dates = _dates(n, rng)
+    return lambda: sorted(dates, key=GaianDate.toordinal)
+
+
+def _setup_hash(n, rng):
+    dates = _dates(n, rng)
+    return lambda: set(dates)
+
+
+CASES = {
+    "convert.gregorian_to_gaian": _setup_gregorian_to_gaian,
+    "convert.gaian_to_gregorian": _setup_gaian_to_gregorian,
+    "convert.from_timestamp": _setup_from_timestamp,
+    "date.init": _setup_init,
+    **{f"format.{name}": _setup_format(p) for name, p in FORMAT_PATTERNS.items()},
+    **{f"parse.{name}": _setup_parse(p) for name, p in PARSE_SHAPES.items()},
+    "arith.add_timedelta": _setup_add,
+    "arith.subtract": _setup_subtract,
+    "arith.add_months": _setup_add_months,
+    "arith.datetime_add": _setup_datetime_add,
+    "recur.after": _setup_rule_after,
+    "workdays.add": _setup_add_workdays,
+    "sort.lt": _setup_sort,
+    "sort.ordinal_key": _setup_sort_key,
+    "hash.set": _setup_hash,
+}
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def _size(text: str) -> int:
+    return int(float(text))
+
+
+def _commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def run(names, sizes, repeat: int) -> list[dict]:
+    results = []
+    for n in sizes:
+        for name in names:
+            fn = CASES[name](n, random.Random(0))
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                best = min(best, time.perf_counter() - start)
+            result = {"name": name, "n": n, "ns_per_item": best / n * 1e9, "best_s": best}
+            results.append(result)
+            print(f"{name:<30}{n:>10}{result['ns_per_item']:>12.0f} ns", file=sys.stderr)
+    return results
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> bool:
+    """Print current / baseline ratios; return True if any exceeds threshold."""
+    before = {(r["name"], r["n"]): r["ns_per_item"] for r in baseline["results"]}
+    regressed = False
+    print(f"{'case':<30}{'n':>10}{'base ns':>10}{'now ns':>10}{'ratio':>8}")
+    for r in results:
+        old = before.get((r["name"], r["n"]))
+        if old is None:
+            print(f"{r['name']:<30}{r['n']:>10}{'-':>10}{r['ns_per_item']:>10.0f}{'new':>8}")
+            continue
+        ratio = r["ns_per_item"] / old
+        flag = "  REGRESSION" if ratio > threshold else ""
+        regressed |= ratio > threshold
+        print(f"{r['name']:<30}{r['n']:>10}{old:>10.0f}{r['ns_per_item']:>10.0f}{ratio:>7.2f}x{flag}")
+    return regressed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the gaian_calendar core operations.")
+    parser.add_argument("--sizes", default="1e3,1e4,1e5", help="comma-separated n values")
+    parser.add_argument("--cases", default="", help="comma-separated case-name prefixes")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON ('-' for stdout)")
+    parser.add_argument("--compare", metavar="PATH", help="baseline JSON from an earlier --json run")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    prefixes = tuple(p for p in args.cases.split(",") if p)
+    names = [name for name in CASES if not prefixes or name.startswith(prefixes)]
+    sizes = [_size(s) for s in args.sizes.split(",")]
+    report = {
+        "meta": {
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "repeat": args.repeat,
+        },
+        "results": run(names, sizes, args.repeat),
+    }
+
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=1)
+        print()
+    elif args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=1)
+
+    if args.compare:
+        with open(args.compare) as f:
+            return 1 if compare(report["results"], json.load(f), args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
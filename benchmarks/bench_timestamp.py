@@ -0,0 +1,56 @@
+"""
+Unix timestamp → GaianDate for log ingestion.
+
+The legacy path is what callers wrote before from_timestamp existed:
+datetime.fromtimestamp(...).date(), then the original isocalendar()-based
+conversion. Timestamps are sorted and spread over about a month, as in a
+log file, so most lines share their day with the previous one.
+
+Run from the repo root:
+    python -m benchmarks.bench_timestamp
+"""
+import random
+import timeit
+from datetime import datetime, timezone
+
+from gaian_calendar import GaianDate
+
+
+def _legacy(ts: int) -> GaianDate:
+    d = datetime.fromtimestamp(ts, timezone.utc).date()
+    iso_year, iso_week, iso_weekday = d.isocalendar()
+    doy = (iso_week - 1) * 7 + iso_weekday - 1
+    return GaianDate(iso_year + 10_000, doy // 28 + 1, doy % 28 + 1)
+
+
+def _best(stmt, number: int) -> float:
+    """Best-of-5 time per call, in nanoseconds."""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main(size: int = 200_000) -> None:
+    rng = random.Random(0)
+    start = 1_773_014_400
+    stamps = sorted(start + rng.randrange(30 * 86_400) for _ in range(size))
+    scattered = [rng.randrange(0, 2_000_000_000) for _ in range(size)]
+    from_timestamp = GaianDate.from_timestamp
+
+    print(f"{'case (per timestamp)':<30}{'legacy ns':>12}{'current ns':>12}{'speedup':>10}")
+    for name, values in (("log order (same-day runs)", stamps), ("random days", scattered)):
+        before = _best(lambda: [_legacy(t) for t in values], 1) / size
+        after = _best(lambda: [from_timestamp(t) for t in values], 1) / size
+        print(f"{name:<30}{before:>12.0f}{after:>12.0f}{before / after:>9.2f}x")
+
+    try:
+        import numpy as np
+        from gaian_calendar import timestamps_to_gaian
+    except ImportError:
+        return
+    array = np.array(stamps, dtype=np.int64) * 1_000_000_000
+    before = _best(lambda: [_legacy(t) for t in stamps], 1) / size
+    after = _best(lambda: timestamps_to_gaian(array, unit="ns"), 1) / size
+    print(f"{'timestamps_to_gaian (ns)':<30}{before:>12.0f}{after:>12.1f}{before / after:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Workday arithmetic with and without a holiday calendar.
+
+The legacy path is what callers wrote before add_workdays existed: step
+one day at a time, skipping sabbath days (GaianWeekday.is_sabbath) and
+days found in a set of holidays.
+
+Run from the repo root:
+    python -m benchmarks.bench_workdays
+"""
+import random
+import timeit
+from datetime import timedelta
+
+from gaian_calendar import GaianDate, GaianHolidays, GaianWeekday, add_workdays, workdays_between
+
+_SABBATH = {n for n in range(1, 8) if GaianWeekday(n).is_sabbath}
+
+
+def _legacy_add(d: GaianDate, n: int, holidays: set) -> GaianDate:
+    one = timedelta(days=1)
+    while n:
+        d += one
+        if d.day_of_week not in _SABBATH and d not in holidays:
+            n -= 1
+    return d
+
+
+def _legacy_between(a: GaianDate, b: GaianDate, holidays: set) -> int:
+    count, one = 0, timedelta(days=1)
+    while a < b:
+        if a.day_of_week not in _SABBATH and a not in holidays:
+            count += 1
+        a += one
+    return count
+
+
+def _best(stmt, number: int) -> float:
+    """Best-of-5 time per call, in nanoseconds."""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main() -> None:
+    rng = random.Random(0)
+    start = GaianDate(12026, 1, 1)
+    decade = GaianDate(12036, 1, 1)
+    days = decade.toordinal() - start.toordinal()
+    holiday_list = [GaianDate.fromordinal(start.toordinal() + rng.randrange(days)) for _ in range(150)]
+    holiday_set, holidays = set(holiday_list), GaianHolidays(holiday_list)
+
+    print(f"{'case (per call)':<36}{'legacy ns':>14}{'current ns':>12}{'speedup':>10}")
+    cases = (
+        ("add 10,000 workdays", lambda: _legacy_add(start, 10_000, set()),
+         lambda: add_workdays(start, 10_000)),
+        ("add 20 workdays, 150 holidays", lambda: _legacy_add(start, 20, holiday_set),
+         lambda: add_workdays(start, 20, holidays)),
+        ("count across a decade, 150 holidays", lambda: _legacy_between(start, decade, holiday_set),
+         lambda: workdays_between(start, decade, holidays)),
+    )
+    for name, legacy, current in cases:
+        before = _best(legacy, 3)
+        after = _best(current, 10_000)
+        print(f"{name:<36}{before:>14.0f}{after:>12.0f}{before / after:>9.0f}x")
+
+    try:
+        import numpy as np
+        from gaian_calendar import add_workdays_array
+    except ImportError:
+        return
+    size = 100_000
+    ordinals = start.toordinal() + np.arange(size) % days
+    n = np.full(size, 20)
+    scalar = [GaianDate.fromordinal(int(o)) for o in ordinals]
+    before = _best(lambda: [add_workdays(d, 20, holidays) for d in scalar], 1) / size
+    after = _best(lambda: add_workdays_array(ordinals, n, holidays), 1) / size
+    print(f"{'add_workdays_array vs scalar (per date)':<36}{before:>14.0f}{after:>12.1f}{before / after:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,11 +11,88 @@ from .date import GaianDate
 from .month import GaianMonth
 from .weekday import GaianWeekday
 from ._convert import is_leap_year
+from ._format import GaianFormatter, format_many
 
 __all__ = [
     "GaianDate",
+    "GaianDateRange",
+    "GaianDateTime",
+    "GaianDelta",
     "GaianMonth",
+    "GaianRule",
+    "GaianRuleSet",
     "GaianWeekday",
     "is_leap_year",
+    "GaianFormatter",
+    "format_many",
+    "GaianHolidays",
+    "add_workdays",
+    "is_workday",
+    "workdays_between",
+    "GaianParser",
+    "parse_many",
+    "convert_parallel",
+    "pack_many",
+    "unpack_many",
+    "monthcalendar",
+    "yearcalendar",
+    "monthdatescalendar",
+    "yeardatescalendar",
     "__version__",
 ]
+
+# Public names from heavier submodules, imported on first access so that
+# `import gaian_calendar` stays cheap (_parse, for instance, pulls in re).
+_LAZY = {
+    "GaianDateRange": ".daterange",
+    "GaianDateTime": ".datetime",
+    "GaianDelta": ".delta",
+    "GaianHolidays": "._workdays",
+    "GaianParser": "._parse",
+    "GaianRule": ".recurrence",
+    "GaianRuleSet": ".recurrence",
+    "convert_parallel": "._parallel",
+    "pack_many": "._codec",
+    "unpack_many": "._codec",
+    "add_workdays": "._workdays",
+    "is_workday": "._workdays",
+    "workdays_between": "._workdays",
+    "parse_many": "._parse",
+    "monthcalendar": "._grid",
+    "yearcalendar": "._grid",
+    "monthdatescalendar": "._grid",
+    "yeardatescalendar": "._grid",
+}
+
+# Public names backed by optional dependencies (NumPy, pandas, pyarrow).
+# They are imported on first access and left out of __all__ so
+# `import *` never requires them.
+_OPTIONAL = {
+    "GaianDateArray": ".datearray",
+    "register_pandas_accessor": "._pandas",
+    "gregorian_to_gaian_arrow": "._arrow",
+    "gaian_to_gregorian_arrow": "._arrow",
+    "gregorian_to_gaian_batches": "._arrow",
+    "gaian_to_gregorian_batches": "._arrow",
+    "gregorian_to_gaian_array": "._vectorized",
+    "gaian_to_gregorian_array": "._vectorized",
+    "timestamps_to_gaian": "._vectorized",
+    "add_workdays_array": "._vectorized",
+    "workdays_between_array": "._vectorized",
+    "valid_date_mask": "._vectorized",
+    "validate_date_array": "._vectorized",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name) or _OPTIONAL.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_OPTIONAL))
@@ -0,0 +1,6 @@
+"""Entry point for ``python -m gaian_calendar``; see _cli for usage."""
+import sys
+
+from ._cli import main
+
+sys.exit(main())
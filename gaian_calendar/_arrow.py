@@ -0,0 +1,147 @@
+"""
+Apache Arrow conversions: Gaian year/month/day columns from and to
+``date32``, ``date64`` and ``timestamp`` columns.
+
+Requires pyarrow (``pip install GaianCalendar[arrow]``). Values move
+between Arrow buffers and NumPy arrays and are converted with the
+_vectorized arithmetic; no Python date objects are created. Nulls are
+kept as nulls.
+
+The *_batches functions work one RecordBatch at a time, so a large
+Parquet file can be converted with bounded memory::
+
+    import pyarrow.parquet as pq
+    source = pq.ParquetFile("events.parquet")
+    batches = gregorian_to_gaian_batches(source.iter_batches(), "day")
+    first = next(batches)
+    with pq.ParquetWriter("events_gaian.parquet", first.schema) as writer:
+        writer.write_batch(first)
+        for batch in batches:
+            writer.write_batch(batch)
+"""
+from __future__ import annotations
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError as exc:  # pragma: no cover - exercised only without pyarrow
+    raise ImportError(
+        "gaian_calendar Arrow functions require pyarrow: pip install GaianCalendar[arrow]"
+    ) from exc
+
+from ._convert import _UNITS_PER_DAY
+from ._vectorized import (
+    EPOCH_ORDINAL,
+    _check_ordinal_range,
+    _ordinals_to_fields,
+    gaian_to_gregorian_array,
+    np,
+)
+
+GAIAN_FIELD_NAMES = ("gaian_year", "gaian_month", "gaian_day")
+
+
+def _epoch_days(array) -> tuple[np.ndarray, np.ndarray]:
+    """int64 days since 1970-01-01 (0 where null) and the null mask."""
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    kind = array.type
+    if pa.types.is_date32(kind):
+        values, per_day = array.cast(pa.int32()), 1
+    elif pa.types.is_date64(kind):
+        values, per_day = array.cast(pa.int64()), _UNITS_PER_DAY["ms"]
+    elif pa.types.is_timestamp(kind):
+        if kind.tz is not None:
+            # Gaian dates follow the local wall-clock date
+            array = pc.local_timestamp(array)
+        values, per_day = array.cast(pa.int64()), _UNITS_PER_DAY[kind.unit]
+    else:
+        raise TypeError(f"Expected a date32, date64 or timestamp array, got {kind}")
+    nulls = array.is_null().to_numpy(zero_copy_only=False)
+    days = pc.fill_null(values, 0).to_numpy().astype(np.int64)
+    if per_day != 1:
+        days //= per_day  # floors times before midnight of negative days too
+    return days, nulls
+
+
+def _mask(nulls: np.ndarray):
+    return nulls if nulls.any() else None
+
+
+# ---------------------------------------------------------------------------
+# Column conversions
+# ---------------------------------------------------------------------------
+
+def gregorian_to_gaian_arrow(array) -> tuple[pa.Array, pa.Array, pa.Array]:
+    """
+    Convert a date32, date64 or timestamp Array (or ChunkedArray) to Gaian
+    year, month and day ``int32`` Arrays. Times are floored to their day,
+    and tz-aware timestamps use their local date. Nulls stay null; dates
+    outside years 10001–19999 raise ValueError.
+    """
+    days, nulls = _epoch_days(array)
+    ordinals = days + EPOCH_ORDINAL
+    ordinals[nulls] = EPOCH_ORDINAL
+    _check_ordinal_range(ordinals)
+    mask = _mask(nulls)
+    return tuple(
+        pa.array(values.astype(np.int32), type=pa.int32(), mask=mask)
+        for values in _ordinals_to_fields(ordinals)
+    )
+
+
+def gaian_to_gregorian_arrow(year, month, day) -> pa.Array:
+    """
+    Convert Gaian year, month and day integer Arrays to a ``date32`` Array.
+
+    A row is null where any of its inputs is null. Invalid dates raise
+    ValueError listing their indices.
+    """
+    columns = []
+    nulls = np.zeros(len(year), dtype=bool)
+    for column in (year, month, day):
+        if isinstance(column, pa.ChunkedArray):
+            column = column.combine_chunks()
+        nulls |= column.is_null().to_numpy(zero_copy_only=False)
+        columns.append(pc.fill_null(column, 0).to_numpy().astype(np.int64))
+    year, month, day = columns
+    # Null rows get a placeholder date so validation only sees real rows
+    year[nulls], month[nulls], day[nulls] = 12_000, 1, 1
+    days = gaian_to_gregorian_array(year, month, day).view(np.int64)
+    return pa.array(days.astype(np.int32), type=pa.date32(), mask=_mask(nulls))
+
+
+# ---------------------------------------------------------------------------
+# RecordBatch streams
+# ---------------------------------------------------------------------------
+
+def _iter_batches(batches):
+    if isinstance(batches, pa.Table):
+        return iter(batches.to_batches())
+    return iter(batches)
+
+
+def gregorian_to_gaian_batches(batches, column: str, names=GAIAN_FIELD_NAMES):
+    """
+    Yield each RecordBatch of ``batches`` (a RecordBatchReader, Table or
+    any iterable of batches) with Gaian year, month and day columns,
+    called ``names``, appended for the date or timestamp ``column``.
+    """
+    for batch in _iter_batches(batches):
+        fields = gregorian_to_gaian_arrow(batch.column(column))
+        yield pa.RecordBatch.from_arrays(
+            batch.columns + list(fields), names=batch.schema.names + list(names),
+        )
+
+
+def gaian_to_gregorian_batches(batches, columns=GAIAN_FIELD_NAMES, name: str = "date"):
+    """
+    Yield each RecordBatch with a ``date32`` column ``name`` appended,
+    computed from its Gaian year, month and day ``columns``.
+    """
+    year, month, day = columns
+    for batch in _iter_batches(batches):
+        dates = gaian_to_gregorian_arrow(batch.column(year), batch.column(month), batch.column(day))
+        yield pa.RecordBatch.from_arrays(
+            batch.columns + [dates], names=batch.schema.names + [name],
+        )
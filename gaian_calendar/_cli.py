@@ -0,0 +1,196 @@
+"""
+Command-line converter, run as ``python -m gaian_calendar``.
+
+    python -m gaian_calendar format [-p PATTERN] < gregorian.txt
+    python -m gaian_calendar parse  [-p PATTERN] < gaian.txt
+    python -m gaian_calendar format -c day --header < events.csv > out.csv
+
+``format`` reads Gregorian ISO dates (YYYY-MM-DD; anything after the
+first 10 characters, such as a time, is ignored) and writes Gaian dates
+in PATTERN (default yyyy-MM-dd). ``parse`` reads Gaian dates, in any shape
+GaianDate.parse accepts or strictly in PATTERN, and writes Gregorian ISO
+dates.
+
+Input is read and converted in chunks of lines through large buffers, so
+memory stays constant whatever the input size. With ``--jobs N`` chunks are
+converted by N worker processes, with at most 2N chunks in flight and the
+output kept in input order.
+"""
+from __future__ import annotations
+import argparse
+import csv
+import functools
+import io
+import itertools
+import sys
+from collections import namedtuple
+from datetime import date
+from ._parallel import ordered_map
+
+BUFFER_SIZE = 1 << 20     # bytes per read/write buffer
+CHUNK_LINES = 20_000      # lines (or CSV rows) per unit of work
+CACHE_SIZE = 1 << 16      # distinct values remembered per process
+
+# Everything a worker needs to convert a chunk; must stay picklable
+_Options = namedtuple("_Options", "mode pattern column delimiter coerce")
+
+
+class ConversionError(ValueError):
+    """A value that could not be converted, with its line or row number."""
+
+
+# ---------------------------------------------------------------------------
+# Value conversion
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def _converter(mode: str, pattern: str | None):
+    """Return a cached str -> str function for one mode and pattern."""
+    from ._convert import gaian_to_ordinal
+    from ._format import compile_pattern
+    from .date import GaianDate
+
+    if mode == "format":
+        formatter = compile_pattern(pattern or "yyyy-MM-dd")
+
+        def convert(text: str) -> str:
+            d = GaianDate.fromordinal(date.fromisoformat(text.strip()[:10]).toordinal())
+            return formatter.format(d.year, d.month, d.day)
+    else:
+        if pattern:
+            from ._parse import compile_parser
+            parse = compile_parser(pattern).parse
+        else:
+            from ._parse import parse_fields as parse
+
+        def convert(text: str) -> str:
+            return date.fromordinal(gaian_to_ordinal(*parse(text.strip()))).isoformat()
+
+    return functools.lru_cache(maxsize=CACHE_SIZE)(convert)
+
+
+def _convert_value(convert, text: str, coerce: bool, where: str) -> str:
+    try:
+        return convert(text)
+    except ValueError as exc:
+        if coerce:
+            return ""
+        raise ConversionError(f"{where}: cannot convert {text!r}: {exc}") from None
+
+
+def convert_chunk(first: int, items: list, options: _Options) -> str:
+    """
+    Convert one chunk and return its output text.
+
+    ``items`` are raw lines when ``options.column`` is None, otherwise CSV
+    rows (lists of fields); ``first`` is the 1-based number of the first.
+    """
+    convert = _converter(options.mode, options.pattern)
+    coerce = options.coerce
+    if options.column is None:
+        return "".join(
+            _convert_value(convert, line.rstrip("\r\n"), coerce, f"line {n}") + "\n"
+            for n, line in enumerate(items, first)
+        )
+    column = options.column
+    out = io.StringIO()
+    writer = csv.writer(out, delimiter=options.delimiter, lineterminator="\n")
+    for n, row in enumerate(items, first):
+        if column >= len(row):
+            raise ConversionError(f"row {n}: has no column {column}")
+        row[column] = _convert_value(convert, row[column], coerce, f"row {n}")
+        writer.writerow(row)
+    return out.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# Streaming
+# ---------------------------------------------------------------------------
+
+def _chunks(items, size: int):
+    """Yield (first item number, list of items) with at most ``size`` items each."""
+    items = iter(items)
+    first = 1
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return
+        yield first, chunk
+        first += len(chunk)
+
+
+def _column_index(column: str, header: list[str] | None) -> int:
+    if column.isdigit():
+        return int(column)
+    if header is None:
+        raise ConversionError(f"column {column!r} is a name; pass --header or a 0-based index")
+    try:
+        return header.index(column)
+    except ValueError:
+        raise ConversionError(f"no column named {column!r} in header {header}") from None
+
+
+def run(args, infile, outfile) -> None:
+    """Convert ``infile`` to ``outfile`` (text streams) per parsed ``args``."""
+    column = None
+    if args.column is None:
+        items = infile
+        if args.header:
+            outfile.write(next(infile, ""))
+    else:
+        items = csv.reader(infile, delimiter=args.delimiter)
+        header = next(items, None) if args.header else None
+        column = _column_index(args.column, header)
+        if header is not None:
+            csv.writer(outfile, delimiter=args.delimiter, lineterminator="\n").writerow(header)
+    options = _Options(args.mode, args.pattern, column, args.delimiter, args.errors == "coerce")
+    tasks = ((first, chunk, options) for first, chunk in _chunks(items, args.chunk_lines))
+    for text in ordered_map(convert_chunk, tasks, args.jobs):
+        outfile.write(text)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m gaian_calendar",
+        description="Convert dates between Gregorian ISO and the Gaian calendar, line by line.",
+    )
+    parser.add_argument("mode", choices=("format", "parse"),
+                        help="format: Gregorian ISO → Gaian; parse: Gaian → Gregorian ISO")
+    parser.add_argument("-p", "--pattern",
+                        help="Gaian pattern to write (format; default yyyy-MM-dd) or to read "
+                             "strictly (parse; default: any shape GaianDate.parse accepts)")
+    parser.add_argument("-c", "--column",
+                        help="treat input as CSV and convert this column (0-based index, "
+                             "or a name with --header); other columns pass through")
+    parser.add_argument("-d", "--delimiter", default=",", help="CSV delimiter (default ,)")
+    parser.add_argument("--header", action="store_true", help="copy the first line through unchanged")
+    parser.add_argument("--errors", choices=("raise", "coerce"), default="raise",
+                        help="raise: stop at the first bad value; coerce: write an empty value")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes (default 1)")
+    parser.add_argument("--chunk-lines", type=int, default=CHUNK_LINES, help=argparse.SUPPRESS)
+    parser.add_argument("-i", "--input", help="input file (default stdin)")
+    parser.add_argument("-o", "--output", help="output file (default stdout)")
+    return parser
+
+
+def _open(path: str | None, mode: str, std):
+    if path is None:
+        return open(std.fileno(), mode, buffering=BUFFER_SIZE, encoding="utf-8",
+                    newline="", closefd=False)
+    return open(path, mode, buffering=BUFFER_SIZE, encoding="utf-8", newline="")
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.jobs < 1:
+        print("gaian_calendar: --jobs must be at least 1", file=sys.stderr)
+        return 2
+    try:
+        with _open(args.input, "r", sys.stdin) as infile, _open(args.output, "w", sys.stdout) as outfile:
+            run(args, infile, outfile)
+    except ConversionError as exc:
+        print(f"gaian_calendar: {exc}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:  # e.g. piped into head
+        return 0
+    return 0
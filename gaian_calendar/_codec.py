@@ -0,0 +1,60 @@
+"""
+Compact binary encoding for Gaian dates.
+
+A date is stored as its day ordinal (the number GaianDate.toordinal()
+returns) in an unsigned 32-bit integer. Supported dates need at most 22
+bits. The byte form is always little-endian, so buffers written on one
+machine read back the same on any other.
+"""
+from __future__ import annotations
+import sys
+from array import array
+from .date import GaianDate
+
+PACKED_SIZE = 4  # bytes per date
+_SWAP = sys.byteorder != "little"
+
+# C only promises that 'I' is at least 2 bytes and 'L' at least 4, so pick
+# whichever unsigned typecode is exactly PACKED_SIZE bytes on this platform
+for _TYPECODE in "IL":
+    if array(_TYPECODE).itemsize == PACKED_SIZE:
+        break
+else:
+    raise ImportError(f"no unsigned array typecode is {PACKED_SIZE} bytes on this platform")
+
+
+def pack_many(dates) -> array:
+    """
+    Pack an iterable of GaianDates into an unsigned 32-bit array of day
+    ordinals (typecode 'I' on all common platforms).
+
+    Use ``.tobytes()`` on the result for the little-endian byte form.
+    """
+    packed = array(_TYPECODE, [d.toordinal() for d in dates])
+    if _SWAP:
+        packed.byteswap()
+    return packed
+
+
+def unpack_many(buffer) -> list[GaianDate]:
+    """
+    Inverse of pack_many(): accept the array it returned, or bytes,
+    bytearray or memoryview in the same little-endian layout.
+
+    Raises ValueError if the byte length is not a multiple of 4 or an
+    ordinal is outside the supported years.
+    """
+    if not isinstance(buffer, array):
+        data = memoryview(buffer).cast("B")
+        if len(data) % PACKED_SIZE:
+            raise ValueError(
+                f"Packed buffer length {len(data)} is not a multiple of {PACKED_SIZE}"
+            )
+        buffer = array(_TYPECODE)
+        buffer.frombytes(data)
+    elif buffer.typecode != _TYPECODE:
+        raise ValueError(f"Expected an array({_TYPECODE!r}), got typecode {buffer.typecode!r}")
+    if _SWAP:
+        buffer = array(_TYPECODE, buffer)
+        buffer.byteswap()
+    return list(map(GaianDate.fromordinal, buffer))
@@ -2,7 +2,40 @@
 Core Gaian Calendar arithmetic: conversions, validation, derived properties.
 All functions work with plain ints and datetime.date — no class dependencies.
 """
-from datetime import date
+from datetime import date, timedelta
+
+
+# ---------------------------------------------------------------------------
+# Year table
+# ---------------------------------------------------------------------------
+
+_MIN_YEAR = 10_001
+_MAX_YEAR = 19_999
+
+
+def _iso_year_start(iso_year: int) -> int:
+    """Return the proleptic Gregorian ordinal of Monday of ISO week 1."""
+    # Pure integer arithmetic: ISO week 1 is the week containing January 4th
+    y = iso_year - 1
+    jan4 = y * 365 + y // 4 - y // 100 + y // 400 + 4
+    return jan4 - (jan4 - 1) % 7
+
+
+# Gaian year → (is_leap, ordinal of Sagittarius 1, year length in days).
+# Filled lazily so importing the package does not pay for 9,999 years up front.
+_YEARS: dict[int, tuple[bool, int, int]] = {}
+
+
+def _year_info(gaian_year: int) -> tuple[bool, int, int]:
+    """Return (is_leap, ordinal of Sagittarius 1, length) for a Gaian year."""
+    info = _YEARS.get(gaian_year)
+    if info is None:
+        start = _iso_year_start(gaian_year - 10_000)
+        length = _iso_year_start(gaian_year - 9_999) - start
+        info = (length == 371, start, length)
+        if _MIN_YEAR <= gaian_year <= _MAX_YEAR:
+            _YEARS[gaian_year] = info
+    return info
 
 
 # ---------------------------------------------------------------------------
@@ -11,13 +44,115 @@ from datetime import date
 
 def _iso_weeks_in_year(iso_year: int) -> int:
     """Return 52 or 53: the number of ISO weeks in the given ISO week-year."""
-    # Dec 28 is always in the last real ISO week of the year (never week 1 of next)
-    return date(iso_year, 12, 28).isocalendar()[1]
+    return _year_info(iso_year + 10_000)[2] // 7
 
 
 def is_leap_year(gaian_year: int) -> bool:
     """Return True if the Gaian year has a Horus month (53 ISO weeks)."""
-    return _iso_weeks_in_year(gaian_year - 10_000) == 53
+    return (_YEARS.get(gaian_year) or _year_info(gaian_year))[0]
+
+
+def year_length(gaian_year: int) -> int:
+    """Return the number of days in the Gaian year: 364, or 371 in leap years."""
+    return _year_info(gaian_year)[2]
+
+
+def months_in_year(gaian_year: int) -> int:
+    """Return the number of months in the Gaian year: 13, or 14 with Horus."""
+    return 14 if (_YEARS.get(gaian_year) or _year_info(gaian_year))[0] else 13
+
+
+# ---------------------------------------------------------------------------
+# Absolute month numbering
+# ---------------------------------------------------------------------------
+
+# The ISO calendar repeats every 400 years (146,097 days is a whole number
+# of weeks), and each cycle holds 71 leap (53-week) years. Prefix counts for
+# one cycle make "how many Horus months came before year Y" O(1).
+_LEAP_PREFIX: list[int] = []
+
+
+def _leap_years_before(gaian_year: int) -> int:
+    """Number of leap years from 10001 up to (not including) gaian_year."""
+    if not _LEAP_PREFIX:
+        count = 0
+        _LEAP_PREFIX.append(0)
+        for year in range(10_001, 10_401):
+            count += _year_info(year)[0]
+            _LEAP_PREFIX.append(count)
+    cycles, rest = divmod(gaian_year - 10_001, 400)
+    return cycles * 71 + _LEAP_PREFIX[rest]
+
+
+def month_index(year: int, month: int) -> int:
+    """Return the number of months between Sagittarius 10001 and (year, month)."""
+    return (year - 10_001) * 13 + _leap_years_before(year) + month - 1
+
+
+def month_from_index(index: int) -> tuple[int, int]:
+    """Inverse of month_index: return the (gaian_year, month) for an absolute month."""
+    # 400 years hold 400 * 13 + 71 = 5271 months; the estimate is off by at most one
+    year = index * 400 // 5271 + 10_001
+    first = month_index(year, 1)
+    if first > index:
+        year -= 1
+        first = month_index(year, 1)
+    elif index - first >= months_in_year(year):
+        first += months_in_year(year)
+        year += 1
+    return year, index - first + 1
+
+
+# ---------------------------------------------------------------------------
+# Month and year arithmetic
+# ---------------------------------------------------------------------------
+
+def _check_year(year: int) -> None:
+    if year < _MIN_YEAR or year > _MAX_YEAR:
+        raise ValueError(f"Year {year} out of supported range (10001–19999)")
+
+
+def add_months(year: int, month: int, day: int, months: int) -> tuple[int, int, int]:
+    """
+    Move a valid Gaian date by whole months, keeping the day of month.
+
+    Horus counts as a month in leap years. Landing on Horus, which has 7
+    days, clamps a day above 7 to Horus 7 (the GaianDateRange rule).
+    """
+    target = month - 1 + months               # 0-based month, relative to year
+    if month != 14 and 0 <= target < 13:      # same year, Horus not involved
+        return year, target + 1, day
+    if -26 <= months <= 26:
+        # Short steps: walk at most a couple of year boundaries
+        while target < 0:
+            year -= 1
+            target += 14 if (_YEARS.get(year) or _year_info(year))[0] else 13
+        length = 14 if (_YEARS.get(year) or _year_info(year))[0] else 13
+        while target >= length:
+            target -= length
+            year += 1
+            length = 14 if (_YEARS.get(year) or _year_info(year))[0] else 13
+        month = target + 1
+    else:
+        year, month = month_from_index(month_index(year, month) + months)
+    _check_year(year)
+    if month == 14 and day > 7:
+        day = 7
+    return year, month, day
+
+
+def add_years(year: int, month: int, day: int, years: int) -> tuple[int, int, int]:
+    """
+    Move a valid Gaian date by whole years, keeping month and day.
+
+    A Horus date moved to a year without Horus becomes Ophiuchus 28, the
+    last day of that year.
+    """
+    year += years
+    _check_year(year)
+    if month == 14 and not (_YEARS.get(year) or _year_info(year))[0]:
+        return year, 13, 28
+    return year, month, day
 
 
 # ---------------------------------------------------------------------------
@@ -26,9 +161,9 @@ def is_leap_year(gaian_year: int) -> bool:
 
 def validate_date(year: int, month: int, day: int) -> None:
     """Raise ValueError if (year, month, day) is not a valid Gaian date."""
-    if year < 10_001 or year > 19_999:
+    if year < _MIN_YEAR or year > _MAX_YEAR:
         raise ValueError(f"Year {year} out of supported range (10001–19999)")
-    leap = is_leap_year(year)
+    leap = (_YEARS.get(year) or _year_info(year))[0]
     max_month = 14 if leap else 13
     if month < 1 or month > max_month:
         if month == 14 and not leap:
@@ -50,20 +185,84 @@ def validate_date(year: int, month: int, day: int) -> None:
 
 def gregorian_to_gaian(d: date) -> tuple[int, int, int]:
     """Convert a Gregorian date to a (gaian_year, month, day) tuple."""
-    iso_year, iso_week, iso_weekday = d.isocalendar()
-    month = (iso_week - 1) // 4 + 1          # 1–14
-    week_in_month = (iso_week - 1) % 4        # 0–3
-    day = week_in_month * 7 + iso_weekday     # 1–28 (or 1–7 for Horus)
-    gaian_year = iso_year + 10_000
-    return gaian_year, month, day
+    # The ISO week-year is the Gregorian year or one of its neighbours
+    year = d.year + 10_000
+    info = _YEARS.get(year) or _year_info(year)
+    doy = d.toordinal() - info[1]            # 0-based day of year
+    if doy < 0:
+        year -= 1
+        doy += _year_info(year)[2]
+    elif doy >= info[2]:
+        year += 1
+        doy -= info[2]
+    month = doy // 28 + 1                     # 1–14
+    day = doy % 28 + 1                        # 1–28 (or 1–7 for Horus)
+    return year, month, day
 
 
 def gaian_to_gregorian(year: int, month: int, day: int) -> date:
     """Convert a Gaian date to a Gregorian datetime.date."""
-    iso_year = year - 10_000
-    iso_week = (month - 1) * 4 + (day - 1) // 7 + 1   # 1–53
-    iso_weekday = (day - 1) % 7 + 1                    # 1–7
-    return date.fromisocalendar(iso_year, iso_week, iso_weekday)
+    validate_date(year, month, day)
+    return date.fromordinal(_YEARS[year][1] + (month - 1) * 28 + day - 1)
+
+
+# ---------------------------------------------------------------------------
+# Conversion: day ordinal ↔ Gaian
+# ---------------------------------------------------------------------------
+
+def gaian_to_ordinal(year: int, month: int, day: int) -> int:
+    """Return the proleptic Gregorian ordinal (as date.toordinal()) of a Gaian date."""
+    return (_YEARS.get(year) or _year_info(year))[1] + (month - 1) * 28 + day - 1
+
+
+def ordinal_to_gaian(ordinal: int) -> tuple[int, int, int]:
+    """Convert a proleptic Gregorian ordinal to a (gaian_year, month, day) tuple."""
+    # Estimate is exact or one year too late for every ordinal in date's range
+    year = (ordinal + 4) * 400 // 146_097 + 10_001
+    doy = ordinal - (_YEARS.get(year) or _year_info(year))[1]
+    if doy < 0:
+        year -= 1
+        doy += _year_info(year)[2]
+    return year, doy // 28 + 1, doy % 28 + 1
+
+
+# ---------------------------------------------------------------------------
+# Conversion: Unix timestamp → day
+# ---------------------------------------------------------------------------
+
+# date(1970, 1, 1).toordinal() — Unix time and datetime64 count days from here
+EPOCH_ORDINAL = 719_163
+
+# Timestamp units per day
+_UNITS_PER_DAY = {"s": 86_400, "ms": 86_400_000, "us": 86_400_000_000, "ns": 86_400_000_000_000}
+
+
+def _units_per_day(unit: str) -> int:
+    per_day = _UNITS_PER_DAY.get(unit)
+    if per_day is None:
+        raise ValueError(f"Unknown timestamp unit {unit!r}; expected 's', 'ms', 'us' or 'ns'")
+    return per_day
+
+
+def _offset_units(tz_offset: int | timedelta, per_day: int) -> int:
+    """A UTC offset (seconds east, or a timedelta) in timestamp units."""
+    if isinstance(tz_offset, timedelta):
+        return tz_offset // timedelta(microseconds=1) * per_day // 86_400_000_000
+    return tz_offset * per_day // 86_400
+
+
+def timestamp_days(ts: float, tz_offset: int | timedelta = 0, unit: str = "s") -> int:
+    """
+    Return the local day of a Unix timestamp as days since 1970-01-01.
+
+    ``ts`` counts ``unit`` ("s", "ms", "us" or "ns") since the epoch in
+    UTC; ``tz_offset`` is the fixed offset east of UTC, in seconds or as a
+    timedelta. Times before midnight floor to the previous day.
+    """
+    per_day = _units_per_day(unit)
+    if tz_offset:
+        ts += _offset_units(tz_offset, per_day)
+    return int(ts // per_day)
 
 
 # ---------------------------------------------------------------------------
@@ -1,6 +1,12 @@
 """
 Static data: month and weekday metadata for the Gaian Calendar.
+
+MONTHS and WEEKDAYS are the original lists of dicts. The same data is also
+held in compact tables indexed directly by number (index 0 unused):
+MONTH_TABLE / WEEKDAY_TABLE of named tuples, and parallel string tuples
+such as MONTH_NAMES, WEEKDAY_SYMBOLS, ORDINALS and NUMBER_WORDS.
 """
+from collections import namedtuple
 
 MONTHS: list[dict] = [
     {"number": 1,  "name": "Sagittarius", "abbrev": "Sag", "symbol": "♐", "element": "Fire",    "iso_weeks": (1,  4)},
@@ -54,6 +60,29 @@ def number_word(n: int) -> str:
         return _NUMBER_WORDS[n]
     raise ValueError(f"number_word only supports 1–28, got {n}")
 
+# ---------------------------------------------------------------------------
+# Compact tables indexed by number
+# ---------------------------------------------------------------------------
+
+MonthInfo = namedtuple("MonthInfo", "number name abbrev symbol element iso_weeks")
+WeekdayInfo = namedtuple("WeekdayInfo", "number name abbrev symbol planet")
+
+MONTH_TABLE: tuple = (None,) + tuple(
+    MonthInfo(**m) for m in MONTHS
+)
+WEEKDAY_TABLE: tuple = (None,) + tuple(
+    WeekdayInfo(**w) for w in WEEKDAYS
+)
+
+MONTH_NAMES: tuple[str, ...] = ("",) + tuple(m["name"] for m in MONTHS)
+MONTH_ABBREVS: tuple[str, ...] = ("",) + tuple(m["abbrev"] for m in MONTHS)
+MONTH_SYMBOLS: tuple[str, ...] = ("",) + tuple(m["symbol"] for m in MONTHS)
+WEEKDAY_NAMES: tuple[str, ...] = ("",) + tuple(w["name"] for w in WEEKDAYS)
+WEEKDAY_ABBREVS: tuple[str, ...] = ("",) + tuple(w["abbrev"] for w in WEEKDAYS)
+WEEKDAY_SYMBOLS: tuple[str, ...] = ("",) + tuple(w["symbol"] for w in WEEKDAYS)
+ORDINALS: tuple[str, ...] = ("",) + tuple(ordinal(n) for n in range(1, 29))
+NUMBER_WORDS: tuple[str, ...] = tuple(_NUMBER_WORDS)
+
 # Fast lookup maps
 _MONTH_BY_NUMBER: dict[int, dict] = {m["number"]: m for m in MONTHS}
 _MONTH_BY_NAME: dict[str, dict] = {}
@@ -18,12 +18,38 @@ Tokens (processed in order of decreasing length to avoid partial matches):
   W       Weekday symbol              ☽
   DDD     Day of year, zero-padded    071
   GE      Literal suffix              GE
+  '...'   Quoted literal text         'at' → at
+  ''      Literal single quote        '
+
+Time tokens, recognized only in datetime patterns (GaianDateTime.format,
+or GaianFormatter(pattern, time=True)) so existing date patterns keep
+their literal letters:
+  HH      Zero-padded hour (00–23)    09
+  H       Hour (0–23)                 9
+  hh      Zero-padded hour (01–12)    09
+  h       Hour (1–12)                 9
+  mm      Zero-padded minute          05
+  ss      Zero-padded second          07
+  SSSSSS  Microseconds                004200
+  SSS     Milliseconds                004
+  a       AM / PM                     AM
+  XXX     UTC offset (Z for UTC)      +05:30
 """
-import re
-from ._data import get_month, get_weekday, ordinal, number_word
-from ._convert import day_of_year, day_of_week
+import functools
+from datetime import timedelta
+from ._convert import is_leap_year
+from ._data import (
+    MONTH_ABBREVS,
+    MONTH_NAMES,
+    MONTH_SYMBOLS,
+    NUMBER_WORDS,
+    ORDINALS,
+    WEEKDAY_ABBREVS,
+    WEEKDAY_NAMES,
+    WEEKDAY_SYMBOLS,
+)
 
-# Ordered list of (token, handler) — longer tokens must come before shorter prefixes
+# Ordered list of tokens — longer tokens must come before shorter prefixes
 _TOKENS = [
     "yyyy", "yy",
     "MMMM", "MMM*", "MMM", "MM", "M",
@@ -33,56 +59,303 @@ _TOKENS = [
     "GE",
 ]
 
-# Build a regex that matches any token OR a single character (for literals)
-_TOKEN_PATTERN = re.compile(
-    "(" + "|".join(re.escape(t) for t in _TOKENS) + r"|.)",
-    re.DOTALL,
-)
+
+# Tokens of datetime patterns: the date tokens plus time-of-day fields
+_DATETIME_TOKENS = _TOKENS + [
+    "HH", "H", "hh", "h",
+    "mm", "ss",
+    "SSSSSS", "SSS",
+    "a",
+    "XXX",
+]
+
+
+def _tokenize(pattern: str, tokens: list[str] = _TOKENS) -> list[tuple[str, bool]]:
+    """
+    Split a pattern into (text, is_token) pairs: tokens, single literal
+    characters, and quoted literals — text between single quotes is copied
+    as is, and ``''`` stands for one quote.
+
+    A plain longest-match scan: patterns are compiled once and cached, so
+    this avoids importing and compiling a regex at package import time.
+    """
+    result = []
+    i, n = 0, len(pattern)
+    while i < n:
+        if pattern[i] == "'":
+            if pattern.startswith("''", i):
+                result.append(("'", False))
+                i += 2
+                continue
+            end = pattern.find("'", i + 1)
+            while pattern.startswith("''", end):
+                end = pattern.find("'", end + 2)
+            if end < 0:
+                raise ValueError(f"Unterminated quote in pattern {pattern!r}")
+            result.append((pattern[i + 1:end].replace("''", "'"), False))
+            i = end + 1
+            continue
+        for token in tokens:
+            if pattern.startswith(token, i):
+                result.append((token, True))
+                break
+        else:
+            token = pattern[i]
+            result.append((token, False))
+        i += len(token)
+    return result
+
+
+# token → function (year, month, day) -> str
+# Weekday is (day - 1) % 7 + 1 and day of year is (month - 1) * 28 + day,
+# both perpetual, so every field is a direct computation or tuple lookup.
+_FIELDS = {
+    "yyyy": lambda y, m, d: str(y),
+    "yy":   lambda y, m, d: f"{(y - 10_000) % 100:02d}",
+    "MMMM": lambda y, m, d: MONTH_NAMES[m],
+    "MMM*": lambda y, m, d: MONTH_SYMBOLS[m],
+    "MMM":  lambda y, m, d: MONTH_ABBREVS[m],
+    "MM":   lambda y, m, d: f"{m:02d}",
+    "M":    lambda y, m, d: str(m),
+    "dddd": lambda y, m, d: NUMBER_WORDS[d],
+    "ddd":  lambda y, m, d: ORDINALS[d],
+    "dd":   lambda y, m, d: f"{d:02d}",
+    "d":    lambda y, m, d: str(d),
+    "WWWW": lambda y, m, d: WEEKDAY_NAMES[(d - 1) % 7 + 1],
+    "WWW":  lambda y, m, d: WEEKDAY_ABBREVS[(d - 1) % 7 + 1],
+    "W":    lambda y, m, d: WEEKDAY_SYMBOLS[(d - 1) % 7 + 1],
+    "DDD":  lambda y, m, d: f"{(m - 1) * 28 + d:03d}",
+}
+
+
+def _utc_offset(offset) -> str:
+    """ISO 8601 offset: "Z", "+05:30", "-03:00:15"; "" for naive times."""
+    if offset is None:
+        return ""
+    seconds = offset // timedelta(seconds=1)
+    if not seconds:
+        return "Z"
+    sign = "-" if seconds < 0 else "+"
+    hours, rest = divmod(abs(seconds), 3600)
+    minutes, seconds = divmod(rest, 60)
+    text = f"{sign}{hours:02d}:{minutes:02d}"
+    return f"{text}:{seconds:02d}" if seconds else text
+
+
+# token → function (hour, minute, second, microsecond, utcoffset) -> str
+_TIME_FIELDS = {
+    "HH":     lambda h, m, s, us, off: f"{h:02d}",
+    "H":      lambda h, m, s, us, off: str(h),
+    "hh":     lambda h, m, s, us, off: f"{(h - 1) % 12 + 1:02d}",
+    "h":      lambda h, m, s, us, off: str((h - 1) % 12 + 1),
+    "mm":     lambda h, m, s, us, off: f"{m:02d}",
+    "ss":     lambda h, m, s, us, off: f"{s:02d}",
+    "SSSSSS": lambda h, m, s, us, off: f"{us:06d}",
+    "SSS":    lambda h, m, s, us, off: f"{us // 1000:03d}",
+    "a":      lambda h, m, s, us, off: "AM" if h < 12 else "PM",
+    "XXX":    lambda h, m, s, us, off: _utc_offset(off),
+}
+
+# Fields that depend on the year; everything else depends only on (month, day)
+_YEAR_TOKENS = frozenset({"yyyy", "yy"})
+
+
+class GaianFormatter:
+    """
+    A format pattern compiled once into literal text and field slots.
+
+    Formatting fills the slots with tuple lookups and joins the result, so a
+    formatter can be reused across any number of dates without rescanning
+    the pattern.
+    """
+
+    __slots__ = (
+        "_pattern", "_parts", "_slots", "_time_slots", "_year_slots", "_by_month_day", "_by_year",
+    )
+
+    def __init__(self, pattern: str, time: bool = False) -> None:
+        parts: list[str] = []
+        slots: list[tuple[int, object]] = []
+        time_slots: list[tuple[int, object]] = []
+        year_slots: list[int] = []
+        literal: list[str] = []
+        for token, is_token in _tokenize(pattern, _DATETIME_TOKENS if time else _TOKENS):
+            field = _FIELDS.get(token) if is_token else None
+            target = slots
+            if field is None and is_token and time:
+                field = _TIME_FIELDS.get(token)
+                target = time_slots
+            if field is None:
+                literal.append(token)  # literal text, or "GE"
+                continue
+            if literal:
+                parts.append("".join(literal))
+                literal = []
+            if token in _YEAR_TOKENS:
+                year_slots.append(len(slots))
+            target.append((len(parts), field))
+            parts.append("")
+        if literal:
+            parts.append("".join(literal))
+        self._pattern = pattern
+        self._parts = parts
+        self._slots = tuple(slots)
+        self._time_slots = tuple(time_slots) if time else None
+        self._year_slots = tuple(year_slots)
+        # Bulk-formatting tables, built on first use by format_many()
+        self._by_month_day: list | None = None
+        self._by_year: dict[int, tuple[str, ...]] = {}
+
+    @property
+    def pattern(self) -> str:
+        return self._pattern
+
+    def format(self, year: int, month: int, day: int) -> str:
+        """Format a Gaian (year, month, day). Fields are assumed to be valid."""
+        parts = self._parts.copy()
+        for index, field in self._slots:
+            parts[index] = field(year, month, day)
+        return "".join(parts)
+
+    def format_datetime(self, year: int, month: int, day: int, hour: int, minute: int,
+                        second: int, microsecond: int, utcoffset: timedelta | None = None) -> str:
+        """
+        Format a Gaian date and time of day; ``utcoffset`` is None for
+        naive times. Needs a formatter built with ``time=True``.
+        """
+        if self._time_slots is None:
+            raise ValueError(f"{self!r} was not compiled for time fields; pass time=True")
+        parts = self._parts.copy()
+        for index, field in self._slots:
+            parts[index] = field(year, month, day)
+        for index, field in self._time_slots:
+            parts[index] = field(hour, minute, second, microsecond, utcoffset)
+        return "".join(parts)
+
+    def format_many(self, dates, out=None):
+        """
+        Format many dates with this pattern. See the module-level format_many().
+        """
+        if self._time_slots:
+            raise ValueError("format_many formats dates only; the pattern has time fields")
+        strings = self._format_rows(_iter_fields(dates))
+        if out is None:
+            return strings
+        for i, text in enumerate(strings):
+            out[i] = text
+        return out
+
+    # ------------------------------------------------------------------
+    # Bulk formatting internals
+    # ------------------------------------------------------------------
+
+    def _build_month_day_table(self) -> list:
+        """Pre-render everything but the year fields for every (month, day)."""
+        # Index month * 32 + day; each entry holds the text segments that
+        # surround the year fields, already joined.
+        table: list = [None] * (15 * 32)
+        year_slot_indexes = {self._slots[i][0] for i in self._year_slots}
+        for month in range(1, 15):
+            for day in range(1, 8 if month == 14 else 29):
+                parts = self._parts.copy()
+                for index, field in self._slots:
+                    if index not in year_slot_indexes:
+                        parts[index] = field(0, month, day)
+                segments, current = [], []
+                for index, part in enumerate(parts):
+                    if index in year_slot_indexes:
+                        segments.append("".join(current))
+                        current = []
+                    else:
+                        current.append(part)
+                segments.append("".join(current))
+                table[month * 32 + day] = tuple(segments)
+        return table
+
+    def _year_strings(self, year: int) -> tuple[str, ...]:
+        """Render (and cache) the year fields for one year."""
+        if not 10_001 <= year <= 19_999:
+            raise ValueError(f"Year {year} out of supported range (10001–19999)")
+        strings = tuple(self._slots[i][1](year, 0, 0) for i in self._year_slots)
+        self._by_year[year] = strings
+        return strings
+
+    def _format_rows(self, rows):
+        """Yield one formatted string per (year, month, day) row."""
+        table = self._by_month_day
+        if table is None:
+            table = self._by_month_day = self._build_month_day_table()
+        by_year = self._by_year
+        year_count = len(self._year_slots)
+        for year, month, day in rows:
+            segments = table[month * 32 + day] if 0 < month < 15 and 0 < day < 32 else None
+            if segments is None or (month == 14 and not is_leap_year(year)):
+                raise ValueError(f"Invalid Gaian date: ({year}, {month}, {day})")
+            if year_count == 0 and not 10_001 <= year <= 19_999:
+                raise ValueError(f"Year {year} out of supported range (10001–19999)")
+            if year_count == 0:
+                yield segments[0]
+                continue
+            years = by_year.get(year) or self._year_strings(year)
+            if year_count == 1:
+                yield segments[0] + years[0] + segments[1]
+            else:
+                parts = [segments[0]]
+                for text, segment in zip(years, segments[1:]):
+                    parts.append(text)
+                    parts.append(segment)
+                yield "".join(parts)
+
+    def __repr__(self) -> str:
+        if self._time_slots is not None:
+            return f"GaianFormatter({self._pattern!r}, time=True)"
+        return f"GaianFormatter({self._pattern!r})"
+
+
+def _iter_fields(dates):
+    """
+    Yield (year, month, day) from GaianDates, tuples, a NumPy array, or the
+    (years, months, days) column arrays gregorian_to_gaian_array returns.
+    """
+    if isinstance(dates, tuple) and len(dates) == 3 and all(hasattr(c, "dtype") for c in dates):
+        if len({len(c) for c in dates}) != 1:
+            raise ValueError("year, month and day columns must have the same length")
+        return zip(*(c.tolist() for c in dates))
+    if hasattr(dates, "dtype"):
+        if dates.dtype.names:  # structured array with year/month/day fields
+            return zip(dates["year"].tolist(), dates["month"].tolist(), dates["day"].tolist())
+        return map(tuple, dates.tolist())  # 2-D array of (year, month, day) rows
+    return (
+        item if isinstance(item, tuple) else (item.year, item.month, item.day)
+        for item in dates
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def compile_pattern(pattern: str, time: bool = False) -> GaianFormatter:
+    """Return the (cached) GaianFormatter for a pattern string."""
+    return GaianFormatter(pattern, time)
 
 
 def format_date(year: int, month: int, day: int, pattern: str) -> str:
     """Format a Gaian date using a pattern string."""
-    iso_year = year - 10_000
-    month_data = get_month(month)
-    dow = day_of_week(day)
-    weekday_data = get_weekday(dow)
-    doy = day_of_year(month, day)
-
-    parts: list[str] = []
-    for token in _TOKEN_PATTERN.findall(pattern):
-        if token == "yyyy":
-            parts.append(str(year))
-        elif token == "yy":
-            parts.append(f"{iso_year % 100:02d}")
-        elif token == "MMMM":
-            parts.append(month_data["name"])
-        elif token == "MMM*":
-            parts.append(month_data["symbol"])
-        elif token == "MMM":
-            parts.append(month_data["abbrev"])
-        elif token == "MM":
-            parts.append(f"{month:02d}")
-        elif token == "M":
-            parts.append(str(month))
-        elif token == "dddd":
-            parts.append(number_word(day))
-        elif token == "ddd":
-            parts.append(ordinal(day))
-        elif token == "dd":
-            parts.append(f"{day:02d}")
-        elif token == "d":
-            parts.append(str(day))
-        elif token == "WWWW":
-            parts.append(weekday_data["name"])
-        elif token == "WWW":
-            parts.append(weekday_data["abbrev"])
-        elif token == "W":
-            parts.append(weekday_data["symbol"])
-        elif token == "DDD":
-            parts.append(f"{doy:03d}")
-        elif token == "GE":
-            parts.append("GE")
-        else:
-            parts.append(token)  # literal character
+    return compile_pattern(pattern).format(year, month, day)
+
+
+def format_many(pattern: str, dates, out=None):
+    """
+    Format many dates with one compiled pattern.
+
+    ``dates`` may be an iterable of GaianDate objects or (year, month, day)
+    tuples, a NumPy structured array with ``year``, ``month`` and ``day``
+    fields, a 2-D integer array of such rows, or a ``(years, months, days)``
+    tuple of equal-length arrays as gregorian_to_gaian_array returns. Rows
+    are not turned into GaianDate objects; an invalid month/day combination
+    or an unsupported year raises ValueError.
 
-    return "".join(parts)
+    Returns a lazy iterator of strings, or fills ``out[i]`` for each row
+    (a list or array of at least the same length) and returns ``out``.
+    Everything except the year fields is rendered once per (month, day), so
+    the per-row cost is a table lookup and a concatenation.
+    """
+    return compile_pattern(pattern).format_many(dates, out)
@@ -0,0 +1,66 @@
+"""
+Month and year calendar grids, analogous to calendar.monthcalendar.
+
+Every regular Gaian month starts on a Monday and is exactly four weeks
+long, and Horus is one Monday-to-Sunday week, so the grids are constants.
+The only thing that varies by year is whether Horus exists. Day-number
+grids are therefore shared module-level tuples, and GaianDate grids are
+cached per (year, month).
+"""
+from __future__ import annotations
+import functools
+from ._convert import is_leap_year, validate_date
+from .date import GaianDate
+from .month import GaianMonth
+
+# Rows are weeks, columns Monday (1) … Sunday (7)
+MONTH_GRID: tuple[tuple[int, ...], ...] = tuple(
+    tuple(range(week * 7 + 1, week * 7 + 8)) for week in range(4)
+)
+HORUS_GRID: tuple[tuple[int, ...], ...] = (tuple(range(1, 8)),)
+
+_REGULAR_YEAR = (MONTH_GRID,) * 13
+_LEAP_YEAR = _REGULAR_YEAR + (HORUS_GRID,)
+
+
+def _month_number(year: int, month: int | GaianMonth) -> int:
+    number = month.number if isinstance(month, GaianMonth) else month
+    validate_date(year, number, 1)
+    return number
+
+
+def monthcalendar(year: int, month: int | GaianMonth) -> tuple[tuple[int, ...], ...]:
+    """Return the month's weeks as rows of day numbers (Monday first)."""
+    return HORUS_GRID if _month_number(year, month) == 14 else MONTH_GRID
+
+
+def yearcalendar(year: int) -> tuple[tuple[tuple[int, ...], ...], ...]:
+    """Return the monthcalendar() grid of every month in the year (13 or 14)."""
+    validate_date(year, 1, 1)
+    return _LEAP_YEAR if is_leap_year(year) else _REGULAR_YEAR
+
+
+@functools.lru_cache(maxsize=1024)
+def _date_grid(year: int, month: int) -> tuple[tuple[GaianDate, ...], ...]:
+    first = GaianDate(year, month, 1).toordinal()
+    grid = HORUS_GRID if month == 14 else MONTH_GRID
+    return tuple(
+        tuple(GaianDate._from_fields(year, month, day, first + day - 1) for day in week)
+        for week in grid
+    )
+
+
+def monthdatescalendar(year: int, month: int | GaianMonth) -> tuple[tuple[GaianDate, ...], ...]:
+    """Return the month's weeks as rows of GaianDate objects (cached per month)."""
+    return _date_grid(year, _month_number(year, month))
+
+
+@functools.lru_cache(maxsize=64)
+def _year_date_grid(year: int) -> tuple[tuple[tuple[GaianDate, ...], ...], ...]:
+    return tuple(_date_grid(year, month) for month in range(1, 15 if is_leap_year(year) else 14))
+
+
+def yeardatescalendar(year: int) -> tuple[tuple[tuple[GaianDate, ...], ...], ...]:
+    """Return the monthdatescalendar() grid of every month in the year (cached per year)."""
+    validate_date(year, 1, 1)
+    return _year_date_grid(year)
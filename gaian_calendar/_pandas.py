@@ -0,0 +1,239 @@
+"""
+pandas integration: a ``.gaian`` accessor for Series and Index objects.
+
+Requires pandas (``pip install GaianCalendar[pandas]``). Call
+register_pandas_accessor() once; afterwards any Series or Index holding
+datetimes (naive or tz-aware, where the local wall-clock date is used) or
+GaianDate objects has a ``.gaian`` namespace::
+
+    s.gaian.year, s.gaian.month_name, s.gaian.format("yyyy-MM-dd")
+    s.gaian.to_dates()       # object Series of GaianDate
+    dates.gaian.to_datetime()  # and back to datetime64
+
+Columns are computed with the NumPy arithmetic in _vectorized. Missing
+values (NaT, None) stay missing as pandas' own ``.dt`` accessor does:
+numeric columns become float64 with NaN, string columns hold NaN and
+boolean columns are False.
+"""
+from __future__ import annotations
+
+try:
+    import pandas as pd
+except ImportError as exc:  # pragma: no cover - exercised only without pandas
+    raise ImportError(
+        "the .gaian accessor requires pandas: pip install GaianCalendar[pandas]"
+    ) from exc
+
+from ._data import (
+    MONTH_ABBREVS,
+    MONTH_NAMES,
+    MONTH_SYMBOLS,
+    WEEKDAY_ABBREVS,
+    WEEKDAY_NAMES,
+    WEEKDAY_SYMBOLS,
+)
+from ._format import compile_pattern
+from ._vectorized import (
+    EPOCH_ORDINAL,
+    _check_ordinal_range,
+    _ordinals_to_fields,
+    _year_starts,
+    np,
+)
+from .date import GaianDate
+
+# Object arrays so that string columns come out as object dtype like pandas';
+# index 0 is "", which missing rows point at until _wrap replaces them
+_MONTH_NAMES = np.array(MONTH_NAMES, dtype=object)
+_MONTH_ABBREVS = np.array(MONTH_ABBREVS, dtype=object)
+_MONTH_SYMBOLS = np.array(MONTH_SYMBOLS, dtype=object)
+_WEEKDAY_NAMES = np.array(WEEKDAY_NAMES, dtype=object)
+_WEEKDAY_ABBREVS = np.array(WEEKDAY_ABBREVS, dtype=object)
+_WEEKDAY_SYMBOLS = np.array(WEEKDAY_SYMBOLS, dtype=object)
+
+_ACCESSOR_NAME = "gaian"
+_registered = False
+
+
+class GaianAccessor:
+    """The ``.gaian`` namespace of a datetime-like or GaianDate Series / Index."""
+
+    def __init__(self, obj) -> None:
+        ordinals, missing = _to_ordinals(obj)
+        self._obj = obj
+        self._ordinals = ordinals  # int64, 0 where missing
+        self._missing = missing
+        self._fields = None
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _get_fields(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._fields is None:
+            valid = self._ordinals[~self._missing]
+            _check_ordinal_range(valid)
+            fields = [np.zeros(len(self._ordinals), dtype=np.int32) for _ in range(3)]
+            for out, values in zip(fields, _ordinals_to_fields(valid)):
+                out[~self._missing] = values
+            self._fields = tuple(fields)
+        return self._fields
+
+    def _wrap(self, values: np.ndarray):
+        """Return values shaped like the original object, with missing entries restored."""
+        if self._missing.any():
+            if values.dtype.kind == "b":
+                values = values & ~self._missing  # False, as pandas' .dt does
+            else:
+                values = values.astype(np.float64 if values.dtype.kind in "iu" else object)
+                values[self._missing] = np.nan
+        if isinstance(self._obj, pd.Index):
+            return pd.Index(values, name=self._obj.name)
+        return pd.Series(values, index=self._obj.index, name=self._obj.name)
+
+    def _distinct(self):
+        """
+        Distinct ordinals with their (year, month, day) lists, and the
+        inverse index mapping each row back to them. Missing rows share
+        ordinal 0, whose month is 0.
+        """
+        year, month, day = self._get_fields()
+        uniques, first, inverse = np.unique(self._ordinals, return_index=True, return_inverse=True)
+        rows = zip(uniques.tolist(), year[first].tolist(), month[first].tolist(), day[first].tolist())
+        return rows, len(uniques), inverse.ravel()
+
+    # ------------------------------------------------------------------
+    # Vectorized properties
+    # ------------------------------------------------------------------
+
+    @property
+    def year(self):
+        return self._wrap(self._get_fields()[0])
+
+    @property
+    def month(self):
+        return self._wrap(self._get_fields()[1])
+
+    @property
+    def day(self):
+        return self._wrap(self._get_fields()[2])
+
+    @property
+    def day_of_week(self):
+        """1 = Monday … 7 = Sunday."""
+        return self._wrap(self._weekdays())
+
+    @property
+    def day_of_year(self):
+        _, month, day = self._get_fields()
+        return self._wrap((month - 1) * 28 + day)
+
+    @property
+    def is_leap_year(self):
+        iso_years = np.clip(self._get_fields()[0] - 10_000, 0, 9_999)
+        starts = _year_starts()
+        return self._wrap(starts[iso_years + 1] - starts[iso_years] == 371)
+
+    @property
+    def month_name(self):
+        return self._wrap(_MONTH_NAMES[self._get_fields()[1]])
+
+    @property
+    def month_abbrev(self):
+        return self._wrap(_MONTH_ABBREVS[self._get_fields()[1]])
+
+    @property
+    def month_symbol(self):
+        return self._wrap(_MONTH_SYMBOLS[self._get_fields()[1]])
+
+    @property
+    def weekday_name(self):
+        return self._wrap(_WEEKDAY_NAMES[self._weekdays()])
+
+    @property
+    def weekday_abbrev(self):
+        return self._wrap(_WEEKDAY_ABBREVS[self._weekdays()])
+
+    @property
+    def weekday_symbol(self):
+        return self._wrap(_WEEKDAY_SYMBOLS[self._weekdays()])
+
+    def _weekdays(self) -> np.ndarray:
+        day = self._get_fields()[2]
+        return np.where(self._missing, 0, (day - 1) % 7 + 1)
+
+    # ------------------------------------------------------------------
+    # Formatting and conversion
+    # ------------------------------------------------------------------
+
+    def format(self, pattern: str):
+        """Format every date with a pattern (see _format); missing values stay NaN."""
+        rows, n, inverse = self._distinct()
+        formatter = compile_pattern(pattern)
+        strings = np.empty(n, dtype=object)
+        # Each distinct date is formatted once
+        strings[:] = [formatter.format(y, m, d) if m else "" for _, y, m, d in rows]
+        return self._wrap(strings[inverse])
+
+    def to_dates(self):
+        """Return GaianDate objects (object dtype); missing values become None."""
+        rows, n, inverse = self._distinct()
+        make = GaianDate._from_fields
+        dates = np.empty(n, dtype=object)
+        dates[:] = [make(y, m, d, o) if m else None for o, y, m, d in rows]
+        values = dates[inverse]
+        if isinstance(self._obj, pd.Index):
+            return pd.Index(values, dtype=object, name=self._obj.name)
+        return pd.Series(values, index=self._obj.index, name=self._obj.name, dtype=object)
+
+    def to_datetime(self):
+        """Return the dates as datetime64 (midnight); missing values become NaT."""
+        days = (self._ordinals - EPOCH_ORDINAL).astype("datetime64[D]")
+        days[self._missing] = np.datetime64("NaT")
+        values = days.astype("datetime64[ns]")
+        if isinstance(self._obj, pd.Index):
+            return pd.DatetimeIndex(values, name=self._obj.name)
+        return pd.Series(values, index=self._obj.index, name=self._obj.name)
+
+    def to_array(self):
+        """Return a GaianDateArray of the dates; raises ValueError if any is missing."""
+        from .datearray import GaianDateArray
+
+        if self._missing.any():
+            raise ValueError("Cannot build a GaianDateArray from missing values")
+        return GaianDateArray.from_ordinals(self._ordinals)
+
+
+def _to_ordinals(obj) -> tuple[np.ndarray, np.ndarray]:
+    """Day ordinals (int64) and a missing-value mask for a Series or Index."""
+    dtype = obj.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        # Gaian dates follow the local wall-clock date
+        obj = obj.dt.tz_localize(None) if isinstance(obj, pd.Series) else obj.tz_localize(None)
+        dtype = obj.dtype
+    if dtype.kind == "M":
+        days = obj.to_numpy().astype("datetime64[D]")
+        missing = np.isnat(days)
+        ordinals = days.view(np.int64) + EPOCH_ORDINAL
+        ordinals[missing] = 0
+        return ordinals, missing
+    if dtype == object:
+        values = obj.to_numpy()
+        missing = pd.isna(values)
+        if all(isinstance(v, GaianDate) for v in values[~missing]):
+            ordinals = np.fromiter(
+                (0 if m else v.toordinal() for v, m in zip(values, missing)),
+                dtype=np.int64, count=len(values),
+            )
+            return ordinals, np.asarray(missing, dtype=bool)
+    raise AttributeError("Can only use .gaian accessor with datetime-like or GaianDate values")
+
+
+def register_pandas_accessor() -> type[GaianAccessor]:
+    """Register ``.gaian`` on pandas Series and Index (safe to call repeatedly)."""
+    global _registered
+    if not _registered:
+        pd.api.extensions.register_series_accessor(_ACCESSOR_NAME)(GaianAccessor)
+        pd.api.extensions.register_index_accessor(_ACCESSOR_NAME)(GaianAccessor)
+        _registered = True
+    return GaianAccessor
@@ -0,0 +1,165 @@
+"""
+Multi-process bulk conversion of Gregorian dates to Gaian dates.
+
+Work is split into chunks that worker processes convert independently.
+Each worker sends back its chunk as a packed 32-bit array of day ordinals,
+which pickles as one bytes buffer, instead of GaianDate objects. Results
+come back in input order, and at most two chunks per worker are in
+flight, so memory stays bounded for inputs of any size.
+"""
+from __future__ import annotations
+import functools
+import os
+from array import array
+from collections import deque
+from datetime import date
+from itertools import islice
+
+from ._codec import _TYPECODE
+from ._convert import _iso_year_start
+from .date import GaianDate
+
+DEFAULT_CHUNK_SIZE = 50_000
+_BYTES_PER_LINE = 11  # "YYYY-MM-DD\n", used to size file byte ranges
+
+# Ordinals of Sagittarius 1, 10001 and of the day after 19999's last day
+_FIRST_ORDINAL = _iso_year_start(1)
+_END_ORDINAL = _iso_year_start(10_000)
+
+
+def ordered_map(fn, tasks, workers: int):
+    """
+    Yield ``fn(*task)`` for each task, in order, using ``workers`` processes.
+
+    At most ``2 * workers`` tasks are submitted ahead of the one being
+    yielded, so ``tasks`` is consumed lazily. With ``workers == 1``
+    everything runs in this process.
+    """
+    if workers <= 1:
+        for task in tasks:
+            yield fn(*task)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+        for task in tasks:
+            pending.append(pool.submit(fn, *task))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=1 << 16)
+def _iso_ordinal(text: str) -> int:
+    return date.fromisoformat(text.strip()[:10]).toordinal()
+
+
+def _ordinal(value) -> int:
+    if isinstance(value, date):
+        return value.toordinal()
+    if isinstance(value, str):
+        return _iso_ordinal(value)
+    raise TypeError(f"expected a date or ISO string, got {type(value).__name__}")
+
+
+def _pack(values, where) -> array:
+    """Convert dates or ISO strings to a packed ordinal array, range-checked."""
+    try:
+        ordinals = array(_TYPECODE, map(_ordinal, values))
+    except (ValueError, TypeError):
+        # Find the offending item for the message
+        for n, value in enumerate(values):
+            try:
+                _ordinal(value)
+            except (ValueError, TypeError) as exc:
+                raise ValueError(f"{where(n)}: cannot convert {value!r}: {exc}") from None
+        raise
+    if ordinals and (min(ordinals) < _FIRST_ORDINAL or max(ordinals) >= _END_ORDINAL):
+        n = next(i for i, o in enumerate(ordinals) if not _FIRST_ORDINAL <= o < _END_ORDINAL)
+        raise ValueError(f"{where(n)}: {values[n]!r} is out of supported range (10001–19999)")
+    return ordinals
+
+
+def _convert_items(first: int, items: list) -> array:
+    return _pack(items, lambda n: f"item {first + n}")
+
+
+def _convert_file_range(path: str, start: int, end: int) -> array:
+    """Convert the lines that start in the byte range [start, end) of ``path``."""
+    with open(path, "rb") as f:
+        if start:
+            # A line that straddles ``start`` belongs to the previous range
+            f.seek(start - 1)
+            if f.read(1) != b"\n":
+                f.readline()
+        begin = f.tell()
+        if begin >= end:
+            return array(_TYPECODE)
+        data = f.read(end - begin)
+        if not data.endswith(b"\n"):
+            data += f.readline()
+    lines = data.decode("utf-8").splitlines()
+    return _pack(lines, lambda n: f"{path}, line {n + 1} after byte {begin}")
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+def _item_tasks(iterable, chunk_size: int):
+    items = iter(iterable)
+    first = 0
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            return
+        yield first, chunk
+        first += len(chunk)
+
+
+def _file_tasks(path: str, chunk_size: int):
+    size = os.path.getsize(path)
+    step = max(chunk_size * _BYTES_PER_LINE, 1)
+    for start in range(0, size, step):
+        yield path, start, min(start + step, size)
+
+
+def convert_parallel(source, *, workers: int | None = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE, packed: bool = False):
+    """
+    Convert Gregorian dates to Gaian dates across worker processes.
+
+    ``source`` is either a path to a text file with one ISO date
+    (YYYY-MM-DD, optionally followed by a time) per line, or an iterable
+    of ``datetime.date`` objects or ISO strings. Workers read file byte
+    ranges themselves, so only the packed results cross process
+    boundaries.
+
+    Yields GaianDate objects in input order, or with ``packed=True``
+    one packed array of day ordinals per chunk (as pack_many returns), ready for
+    GaianDateArray.from_ordinals. ``chunk_size`` is the number of items
+    per chunk (roughly the number of lines for a file); ``workers``
+    defaults to os.cpu_count(). Invalid values raise ValueError naming
+    their position.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    workers = workers or os.cpu_count() or 1
+    if isinstance(source, (str, os.PathLike)):
+        results = ordered_map(_convert_file_range, _file_tasks(os.fspath(source), chunk_size), workers)
+    else:
+        results = ordered_map(_convert_items, _item_tasks(source, chunk_size), workers)
+    if packed:
+        return results
+    return _unpacked(results)
+
+
+def _unpacked(results):
+    for ordinals in results:
+        yield from map(GaianDate.fromordinal, ordinals)
@@ -0,0 +1,266 @@
+"""
+String parsing for Gaian dates.
+
+Supported shapes (an optional trailing "GE" and comma are ignored):
+  12026-03-15             ISO-like numeric (no-regex fast path)
+  3/15/12026              Slash numeric, month first
+  Aquarius 15, 12026      Month name or abbreviation
+
+Grammars are compiled once at import, and results for repeated input
+strings are served from a bounded cache. GaianParser handles any other
+layout written with the format tokens (see _format).
+"""
+from __future__ import annotations
+import functools
+import re
+from ._convert import validate_date
+from ._data import (
+    MONTH_ABBREVS,
+    MONTH_NAMES,
+    MONTH_SYMBOLS,
+    NUMBER_WORDS,
+    ORDINALS,
+    WEEKDAY_ABBREVS,
+    WEEKDAY_NAMES,
+    WEEKDAY_SYMBOLS,
+    get_month_by_name,
+)
+from ._format import _tokenize
+
+_ISO_PATTERN = re.compile(r"(\d{5})-(\d{1,2})-(\d{1,2})")
+_SLASH_PATTERN = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{5})")
+_NAMED_PATTERN = re.compile(r"([A-Za-z]+)\.?\s+(\d{1,2}),?\s*(\d{5})")
+
+# Distinct strings remembered by parse_fields()
+CACHE_SIZE = 4096
+
+# Fast-path digit lookups: a dict hit is much cheaper than str.isdigit + int
+_TWO_DIGITS = {f"{n:02d}": n for n in range(1, 29)}
+_YEAR_DIGITS: dict[str, int] = {}  # filled on demand, supported years only
+
+
+def _year_digits(text: str) -> int | None:
+    if not (text.isascii() and text.isdigit()):
+        return None
+    year = int(text)
+    if 10_001 <= year <= 19_999:
+        _YEAR_DIGITS[text] = year
+    return year
+
+
+def _parse_uncached(s: str) -> tuple[int, int, int]:
+    # Fast path: "12026-03-15" exactly, as written by format("yyyy-MM-dd")
+    if len(s) == 11 and s[5] == "-" and s[8] == "-":
+        year = _YEAR_DIGITS.get(s[:5]) or _year_digits(s[:5])
+        month = _TWO_DIGITS.get(s[6:8])
+        day = _TWO_DIGITS.get(s[9:])
+        if year and month and day:
+            validate_date(year, month, day)
+            return year, month, day
+
+    text = s.strip()
+    if text.endswith("GE"):
+        text = text[:-2].rstrip()
+    text = text.rstrip(",").rstrip()
+
+    m = _ISO_PATTERN.fullmatch(text)
+    if m:
+        fields = (int(m.group(1)), int(m.group(2)), int(m.group(3)))
+    else:
+        m = _SLASH_PATTERN.fullmatch(text)
+        if m:
+            fields = (int(m.group(3)), int(m.group(1)), int(m.group(2)))
+        else:
+            m = _NAMED_PATTERN.fullmatch(text)
+            if not m:
+                raise ValueError(f"Cannot parse {s!r} as a GaianDate")
+            month = get_month_by_name(m.group(1))["number"]
+            fields = (int(m.group(3)), month, int(m.group(2)))
+    validate_date(*fields)
+    return fields
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def parse_fields(s: str) -> tuple[int, int, int]:
+    """Parse a Gaian date string into a validated (year, month, day) tuple."""
+    return _parse_uncached(s)
+
+
+def parse_many(strings, *, errors: str = "raise"):
+    """
+    Parse an iterable of strings lazily, yielding one GaianDate per string.
+
+    ``errors="raise"`` (the default) propagates the first ValueError;
+    ``errors="coerce"`` yields None for strings that do not parse.
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce', got {errors!r}")
+    from .date import GaianDate
+
+    return _parse_rows(strings, GaianDate._from_fields, errors == "coerce")
+
+
+def _parse_rows(strings, trusted, coerce: bool):
+    for s in strings:
+        try:
+            fields = parse_fields(s)
+        except ValueError:
+            if not coerce:
+                raise
+            yield None
+            continue
+        yield trusted(*fields)
+
+
+# ---------------------------------------------------------------------------
+# Pattern-driven parsing (inverse of the _format tokens)
+# ---------------------------------------------------------------------------
+
+def _alternation(words) -> str:
+    # Longest first so "Twenty-first" wins over a shorter prefix
+    return "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+
+def _lookup(table: dict[str, int]):
+    return lambda text: table[text.lower()]
+
+
+def _two_digit_year(text: str) -> int:
+    # Same pivot as time.strptime's %y: 69–99 → 19xx, 00–68 → 20xx (ISO years)
+    yy = int(text)
+    return (11_900 if yy >= 69 else 12_000) + yy
+
+
+def _numbers(names, fold=str.lower) -> dict[str, int]:
+    return {fold(name): n for n, name in enumerate(names) if n}
+
+
+_MONTH_NAME_NUMBERS = _numbers(MONTH_NAMES)
+_MONTH_ABBREV_NUMBERS = _numbers(MONTH_ABBREVS)
+_MONTH_SYMBOL_NUMBERS = _numbers(MONTH_SYMBOLS, str)
+_WEEKDAY_NAME_NUMBERS = _numbers(WEEKDAY_NAMES)
+_WEEKDAY_ABBREV_NUMBERS = _numbers(WEEKDAY_ABBREVS)
+_WEEKDAY_SYMBOL_NUMBERS = _numbers(WEEKDAY_SYMBOLS, str)
+_WORD_NUMBERS = _numbers(NUMBER_WORDS)
+_ORDINAL_NUMBERS = _numbers(ORDINALS, str)
+
+# Numeric tokens printed without padding (ddd starts with its digits, as in
+# "15th"), and those printed with a fixed number of digits
+_VARIABLE_DIGITS = frozenset({"M", "d", "ddd"})
+_FIXED_DIGITS = frozenset({"yyyy", "yy", "MM", "dd", "DDD"})
+
+
+def _check_digit_runs(pattern: str, tokens) -> None:
+    """
+    Reject patterns whose output has two unpadded numbers in one run of
+    digits: the text of "Md" for month 3, day 15 is also month 31, day 5.
+    One unpadded number per run is unambiguous, since the run's length
+    then fixes every field in it.
+    """
+    previous = None
+    for token, is_token in tokens:
+        if is_token and token in _VARIABLE_DIGITS:
+            if previous is not None:
+                raise ValueError(
+                    f"Pattern {pattern!r} cannot be parsed: {previous} and {token} run together; "
+                    f"use MM or dd, or put a separator between them"
+                )
+            # ddd ends with its suffix letters, which close the run
+            previous = None if token == "ddd" else token
+        elif not (is_token and token in _FIXED_DIGITS or not is_token and token.isdigit()):
+            previous = None
+
+
+# token → (regex, field, converter)
+_PARSE_TOKENS = {
+    "yyyy": (r"\d{5}", "year", int),
+    "yy":   (r"\d{2}", "year", _two_digit_year),
+    "MMMM": ("(?i:" + _alternation(_MONTH_NAME_NUMBERS) + ")", "month", _lookup(_MONTH_NAME_NUMBERS)),
+    "MMM*": (_alternation(_MONTH_SYMBOL_NUMBERS), "month", _MONTH_SYMBOL_NUMBERS.__getitem__),
+    "MMM":  ("(?i:" + _alternation(_MONTH_ABBREV_NUMBERS) + ")", "month", _lookup(_MONTH_ABBREV_NUMBERS)),
+    "MM":   (r"\d{2}", "month", int),
+    "M":    (r"\d{1,2}", "month", int),
+    "dddd": ("(?i:" + _alternation(_WORD_NUMBERS) + ")", "day", _lookup(_WORD_NUMBERS)),
+    "ddd":  (_alternation(_ORDINAL_NUMBERS), "day", _ORDINAL_NUMBERS.__getitem__),
+    "dd":   (r"\d{2}", "day", int),
+    "d":    (r"\d{1,2}", "day", int),
+    "WWWW": ("(?i:" + _alternation(_WEEKDAY_NAME_NUMBERS) + ")", "weekday", _lookup(_WEEKDAY_NAME_NUMBERS)),
+    "WWW":  ("(?i:" + _alternation(_WEEKDAY_ABBREV_NUMBERS) + ")", "weekday", _lookup(_WEEKDAY_ABBREV_NUMBERS)),
+    "W":    (_alternation(_WEEKDAY_SYMBOL_NUMBERS), "weekday", _WEEKDAY_SYMBOL_NUMBERS.__getitem__),
+    "DDD":  (r"\d{3}", "day_of_year", int),
+}
+
+
+class GaianParser:
+    """
+    A format pattern compiled once into a strict matcher.
+
+    Accepts exactly the text that GaianFormatter produces for the same
+    pattern (month and weekday names case-insensitively). Patterns where
+    two unpadded numbers meet, such as "Md", are rejected. Fields that
+    appear more than once, or that overlap — a weekday next to a day, or
+    DDD next to a month and day — must agree with each other.
+    """
+
+    __slots__ = ("_pattern", "_regex", "_fields")
+
+    def __init__(self, pattern: str) -> None:
+        regex: list[str] = []
+        fields: list[tuple[str, str, object]] = []
+        tokens = _tokenize(pattern)
+        _check_digit_runs(pattern, tokens)
+        for token, is_token in tokens:
+            spec = _PARSE_TOKENS.get(token) if is_token else None
+            if spec is None:
+                regex.append(re.escape(token))  # literal text, or "GE"
+                continue
+            expr, field, convert = spec
+            group = f"g{len(fields)}"
+            regex.append(f"(?P<{group}>{expr})")
+            fields.append((group, field, convert))
+        names = {field for _, field, _ in fields}
+        if "year" not in names:
+            raise ValueError(f"Pattern {pattern!r} has no year field (yyyy or yy)")
+        if "day_of_year" not in names and not {"month", "day"} <= names:
+            raise ValueError(f"Pattern {pattern!r} needs a month and day, or DDD")
+        self._pattern = pattern
+        self._regex = re.compile("".join(regex))
+        self._fields = tuple(fields)
+
+    @property
+    def pattern(self) -> str:
+        return self._pattern
+
+    def parse(self, s: str) -> tuple[int, int, int]:
+        """Parse a string into a validated (year, month, day) tuple."""
+        m = self._regex.fullmatch(s)
+        if m is None:
+            raise ValueError(f"{s!r} does not match pattern {self._pattern!r}")
+        values: dict[str, int] = {}
+        for group, field, convert in self._fields:
+            value = convert(m.group(group))
+            if values.setdefault(field, value) != value:
+                raise ValueError(f"Conflicting {field} values in {s!r}")
+        year = values["year"]
+        doy = values.get("day_of_year")
+        if doy is not None:
+            if not 1 <= doy <= 371:
+                raise ValueError(f"Day of year {doy} out of range in {s!r}")
+            month, day = (doy - 1) // 28 + 1, (doy - 1) % 28 + 1
+            if values.setdefault("month", month) != month or values.setdefault("day", day) != day:
+                raise ValueError(f"Day of year {doy} conflicts with month and day in {s!r}")
+        month, day = values["month"], values["day"]
+        validate_date(year, month, day)
+        weekday = values.get("weekday")
+        if weekday is not None and weekday != (day - 1) % 7 + 1:
+            raise ValueError(f"Weekday does not match day {day} in {s!r}")
+        return year, month, day
+
+    def __repr__(self) -> str:
+        return f"GaianParser({self._pattern!r})"
+
+
+@functools.lru_cache(maxsize=256)
+def compile_parser(pattern: str) -> GaianParser:
+    """Return the (cached) GaianParser for a pattern string."""
+    return GaianParser(pattern)
@@ -0,0 +1,260 @@
+"""
+NumPy bulk conversions: the _convert arithmetic applied to whole arrays.
+
+Requires NumPy (``pip install GaianCalendar[numpy]``). The package imports
+this module only when one of its functions is first used, so plain
+``import gaian_calendar`` keeps working without NumPy installed.
+"""
+from __future__ import annotations
+import functools
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - exercised only without NumPy
+    raise ImportError(
+        "gaian_calendar array functions require NumPy: pip install GaianCalendar[numpy]"
+    ) from exc
+
+from ._convert import (
+    EPOCH_ORDINAL,
+    _iso_year_start,
+    _offset_units,
+    _units_per_day,
+    validate_date,
+)
+from . import _workdays
+
+# Record layout used when a structured array is requested
+GAIAN_DTYPE = np.dtype([("year", np.int32), ("month", np.int8), ("day", np.int8)])
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _epoch_days(values) -> np.ndarray:
+    """Return int64 days since 1970-01-01 for datetime64, int or date-like input."""
+    arr = np.asarray(values)
+    if arr.dtype.kind in "iu":
+        return arr.astype(np.int64, copy=False)
+    if arr.dtype.kind != "M":
+        arr = arr.astype("datetime64[D]")
+    # Casting floors finer units (hours, ns, ...) to the containing day
+    return arr.astype("datetime64[D]").view(np.int64)
+
+
+def _timestamp_days(values, tz_offset, unit: str) -> np.ndarray:
+    """Vectorized timestamp_days: int64 local days since 1970-01-01."""
+    per_day = _units_per_day(unit)
+    arr = np.asarray(values)
+    offset = _offset_units(tz_offset, per_day) if tz_offset else 0
+    if arr.dtype.kind in "iu":
+        return (arr.astype(np.int64) + offset) // per_day
+    if arr.dtype.kind == "f":
+        return np.floor((arr + offset) / per_day).astype(np.int64)
+    raise TypeError(f"Timestamps must be integers or floats, got dtype {arr.dtype}")
+
+
+@functools.lru_cache(maxsize=None)
+def _year_starts() -> np.ndarray:
+    """Ordinal of Sagittarius 1 indexed by ISO year 0–10000 (Gaian 10000–20000)."""
+    # The scalar formula is plain integer arithmetic, so it vectorizes as is
+    return _iso_year_start(np.arange(0, 10_001, dtype=np.int64))
+
+
+def _check_ordinal_range(ordinals: np.ndarray) -> None:
+    """Raise ValueError naming the indices that fall outside years 10001–19999."""
+    starts = _year_starts()
+    bad = (ordinals < starts[1]) | (ordinals >= starts[10_000])
+    if bad.any():
+        indices = np.flatnonzero(bad)
+        raise ValueError(
+            f"{indices.size} date(s) out of supported range (10001–19999) "
+            f"at indices {indices[:10].tolist()}"
+        )
+
+
+def _ordinals_to_fields(ordinals: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized ordinal_to_gaian for in-range int64 ordinals → (year, month, day)."""
+    starts = _year_starts()
+    # Same estimate as the scalar version: exact or one ISO year too late
+    iso_years = np.clip((ordinals + 4) * 400 // 146_097 + 1, 1, 10_000)
+    iso_years -= ordinals < starts[iso_years]
+    doy = ordinals - starts[iso_years]
+    return iso_years + 10_000, doy // 28 + 1, doy % 28 + 1
+
+
+# ---------------------------------------------------------------------------
+# Conversion: Gregorian → Gaian
+# ---------------------------------------------------------------------------
+
+def gregorian_to_gaian_array(values, *, structured: bool = False):
+    """
+    Convert an array of Gregorian dates to Gaian (year, month, day) arrays.
+
+    ``values`` may be a ``datetime64`` array of any unit (times are floored
+    to their day), an integer array of days since 1970-01-01, or anything
+    NumPy can cast to ``datetime64[D]``. Returns three int32 arrays of the
+    input's shape, or one structured array with ``year``, ``month`` and
+    ``day`` fields when ``structured=True``.
+    """
+    return _fields_array(_epoch_days(values) + EPOCH_ORDINAL, structured)
+
+
+def timestamps_to_gaian(values, tz_offset=0, unit: str = "s", *, structured: bool = False):
+    """
+    Convert an array of Unix timestamps to Gaian (year, month, day) arrays.
+
+    ``values`` are integers or floats counting ``unit`` ("s", "ms", "us"
+    or "ns") since 1970-01-01 UTC; ``tz_offset`` is a fixed offset east of
+    UTC in seconds or as a timedelta. Each date is computed from its
+    integer day count, with no datetime64 or Python date objects. Returns
+    the same shapes as gregorian_to_gaian_array.
+    """
+    return _fields_array(_timestamp_days(values, tz_offset, unit) + EPOCH_ORDINAL, structured)
+
+
+def _fields_array(ordinals: np.ndarray, structured: bool):
+    _check_ordinal_range(ordinals)
+    years, months, days = _ordinals_to_fields(ordinals)
+    if structured:
+        out = np.empty(ordinals.shape, dtype=GAIAN_DTYPE)
+        out["year"] = years
+        out["month"] = months
+        out["day"] = days
+        return out
+    return years.astype(np.int32), months.astype(np.int32), days.astype(np.int32)
+
+
+# ---------------------------------------------------------------------------
+# Validation
+# ---------------------------------------------------------------------------
+
+def _as_fields(year, month, day) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Broadcast year/month/day inputs to int64 arrays of a common shape."""
+    return tuple(np.asarray(a, dtype=np.int64) for a in np.broadcast_arrays(year, month, day))
+
+
+def valid_date_mask(year, month, day) -> np.ndarray:
+    """Vectorized validate_date: a boolean array, True where the date is valid."""
+    year, month, day = _as_fields(year, month, day)
+    starts = _year_starts()
+    in_range = (year >= 10_001) & (year <= 19_999)
+    iso_years = np.clip(year - 10_000, 1, 9_999)
+    leap = starts[iso_years + 1] - starts[iso_years] == 371
+    max_day = np.where(month == 14, 7, 28)
+    return (
+        in_range
+        & (month >= 1) & (month <= 13 + leap)
+        & (day >= 1) & (day <= max_day)
+    )
+
+
+def validate_date_array(year, month, day) -> None:
+    """Raise ValueError naming every index where (year, month, day) is invalid."""
+    mask = valid_date_mask(year, month, day)
+    if not mask.all():
+        # Reuse the scalar rules to explain the first failure
+        year, month, day = _as_fields(year, month, day)
+        indices = np.flatnonzero(~mask)
+        first = np.unravel_index(indices[0], mask.shape)
+        try:
+            validate_date(int(year[first]), int(month[first]), int(day[first]))
+        except ValueError as exc:
+            reason = str(exc)
+        raise ValueError(
+            f"{indices.size} invalid Gaian date(s) at indices {indices[:10].tolist()}; "
+            f"first: {reason}"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Conversion: Gaian → Gregorian
+# ---------------------------------------------------------------------------
+
+def gaian_to_gregorian_array(year, month, day, *, validate: bool = True) -> np.ndarray:
+    """
+    Convert Gaian year, month and day arrays to a ``datetime64[D]`` array.
+
+    Inputs are broadcast against each other. With ``validate=True`` (the
+    default) invalid dates raise ValueError listing their flat indices;
+    pass ``validate=False`` only for data already known to be valid.
+    """
+    if validate:
+        validate_date_array(year, month, day)
+    year, month, day = _as_fields(year, month, day)
+    iso_years = np.clip(year - 10_000, 0, 10_000)
+    ordinals = _year_starts()[iso_years] + (month - 1) * 28 + day - 1
+    return (ordinals - EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+# ---------------------------------------------------------------------------
+# Workdays
+# ---------------------------------------------------------------------------
+
+_WORKDAY_OFFSETS = np.array(_workdays._OFFSETS, dtype=np.int64)
+_WORKDAYS_BEFORE = np.array(_workdays._BEFORE, dtype=np.int64)
+
+
+def _as_ordinals(values) -> np.ndarray:
+    """int64 day ordinals from an integer array or a GaianDateArray."""
+    arr = np.asarray(getattr(values, "ordinals", values))
+    if arr.dtype.kind not in "iu":
+        raise TypeError(f"Ordinals must be integers, got dtype {arr.dtype}")
+    return arr.astype(np.int64, copy=False)
+
+
+def _holiday_arrays(holidays) -> tuple[np.ndarray, np.ndarray] | None:
+    """(sorted ordinals, shifts) of a holiday set as arrays, cached on it."""
+    if holidays is None:
+        return None
+    holidays = _workdays._holidays(holidays)
+    if holidays._arrays is None:
+        holidays._arrays = (np.array(holidays._ordinals, dtype=np.int64),
+                            np.array(holidays._shifts, dtype=np.int64))
+    return holidays._arrays
+
+
+def _rank_array(ordinals: np.ndarray, arrays) -> np.ndarray:
+    """Vectorized GaianHolidays._rank: workdays before each ordinal."""
+    q, r = np.divmod(ordinals - 1, 7)
+    ranks = q * len(_WORKDAY_OFFSETS) + _WORKDAYS_BEFORE[r]
+    if arrays is not None:
+        ranks -= np.searchsorted(arrays[0], ordinals, side="left")
+    return ranks
+
+
+def _select_array(k: np.ndarray, arrays) -> np.ndarray:
+    """Vectorized GaianHolidays._select: ordinal of workday number k."""
+    if arrays is not None:
+        k = k + np.searchsorted(arrays[1], k, side="right")
+    q, r = np.divmod(k, len(_WORKDAY_OFFSETS))
+    return 1 + q * 7 + _WORKDAY_OFFSETS[r]
+
+
+def add_workdays_array(ordinals, n, holidays=None) -> np.ndarray:
+    """
+    Vectorized add_workdays over day ordinals.
+
+    ``ordinals`` is an integer array of day ordinals or a GaianDateArray,
+    broadcast against ``n``; ``holidays`` is a GaianHolidays (its sorted
+    arrays are cached on first use) or an iterable of dates. Returns int64
+    ordinals; raises ValueError naming results out of range.
+    """
+    ordinals = _as_ordinals(ordinals)
+    n = np.asarray(n, dtype=np.int64)
+    arrays = _holiday_arrays(holidays)
+    k = np.where(n > 0, _rank_array(ordinals + 1, arrays) - 1, _rank_array(ordinals, arrays)) + n
+    result = _select_array(np.maximum(k, 0), arrays)
+    _check_ordinal_range(np.where(k < 0, 0, result))
+    return result
+
+
+def workdays_between_array(start, end, holidays=None) -> np.ndarray:
+    """
+    Vectorized workdays_between: workdays from ``start`` (inclusive) to
+    ``end`` (exclusive), as int64, for broadcast arrays of day ordinals or
+    GaianDateArrays.
+    """
+    arrays = _holiday_arrays(holidays)
+    return _rank_array(_as_ordinals(end), arrays) - _rank_array(_as_ordinals(start), arrays)
@@ -0,0 +1,131 @@
+"""
+Working-day arithmetic: days that are not a sabbath (GaianWeekday.is_sabbath,
+Friday–Sunday) and not a holiday.
+
+Ordinal 1 is a Monday and weeks never drift, so the number of workdays
+before any ordinal is closed-form: whole weeks times workdays per week,
+plus a table lookup for the partial week. Holidays are kept as a sorted
+list and counted with bisect, so adding n workdays or counting them
+between two dates takes O(log holidays) time whatever the distance.
+"""
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from operator import index
+from .date import GaianDate
+from .weekday import GaianWeekday
+
+# Day offsets within a week (0 = Monday) that are workdays; _BEFORE[r] is
+# the number of workdays among the first r days of a week
+_WORKDAY = tuple(not GaianWeekday(n).is_sabbath for n in range(1, 8))
+_OFFSETS = tuple(r for r in range(7) if _WORKDAY[r])
+_BEFORE = tuple(sum(_WORKDAY[:r]) for r in range(8))
+_PER_WEEK = len(_OFFSETS)
+
+
+def _rank(ordinal: int) -> int:
+    """Number of workdays before ``ordinal``, counted from ordinal 1 (a Monday)."""
+    q, r = divmod(ordinal - 1, 7)
+    return q * _PER_WEEK + _BEFORE[r]
+
+
+def _select(k: int) -> int:
+    """Ordinal of workday number ``k`` (0-based), the inverse of _rank."""
+    q, r = divmod(k, _PER_WEEK)
+    return 1 + q * 7 + _OFFSETS[r]
+
+
+class GaianHolidays:
+    """
+    An immutable, sorted set of holidays for the workday functions.
+
+    Accepts GaianDates or anything else with ``toordinal()``, such as
+    datetime.date. Holidays on a sabbath are dropped, since those days are
+    not workdays anyway. Build one GaianHolidays and reuse it: the
+    functions also accept a plain iterable of dates, but then sort it on
+    every call.
+    """
+
+    __slots__ = ("_ordinals", "_shifts", "_arrays")
+
+    def __init__(self, dates=()) -> None:
+        ordinals = sorted({d.toordinal() for d in dates})
+        self._ordinals = [o for o in ordinals if _WORKDAY[(o - 1) % 7]]
+        # Workdays before holiday i that are not holidays. The list never
+        # decreases, so bisecting it finds how many holidays precede the
+        # kth remaining workday.
+        self._shifts = [_rank(o) - i for i, o in enumerate(self._ordinals)]
+        self._arrays = None  # NumPy copies, made on first vectorized use
+
+    def _rank(self, ordinal: int) -> int:
+        """Number of non-holiday workdays before ``ordinal``."""
+        return _rank(ordinal) - bisect_left(self._ordinals, ordinal)
+
+    def _select(self, k: int) -> int:
+        """Ordinal of non-holiday workday number ``k`` (0-based)."""
+        return _select(k + bisect_right(self._shifts, k))
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __iter__(self):
+        return map(GaianDate.fromordinal, self._ordinals)
+
+    def __contains__(self, d: object) -> bool:
+        if not hasattr(d, "toordinal"):
+            return False
+        ordinal = d.toordinal()
+        i = bisect_left(self._ordinals, ordinal)
+        return i < len(self._ordinals) and self._ordinals[i] == ordinal
+
+    def __repr__(self) -> str:
+        return f"GaianHolidays({list(self)!r})"
+
+
+_NO_HOLIDAYS = GaianHolidays()
+
+
+def _holidays(holidays) -> GaianHolidays:
+    if holidays is None:
+        return _NO_HOLIDAYS
+    if isinstance(holidays, GaianHolidays):
+        return holidays
+    return GaianHolidays(holidays)
+
+
+def is_workday(d: GaianDate, holidays=None) -> bool:
+    """Return True if ``d`` is neither a sabbath nor one of ``holidays``."""
+    ordinal = d.toordinal()
+    return _WORKDAY[(ordinal - 1) % 7] and (holidays is None or d not in _holidays(holidays))
+
+
+def add_workdays(d: GaianDate, n: int, holidays=None) -> GaianDate:
+    """
+    Return the nth workday after ``d`` (before it, for negative ``n``).
+
+    ``d`` itself is not counted, so Thursday plus one workday is the next
+    Monday. With ``n == 0``, return ``d`` if it is a workday, else the next
+    workday. ``holidays`` is a GaianHolidays or an iterable of dates that
+    are not workdays. Raises ValueError if the result is out of range.
+    """
+    calendar = _holidays(holidays)
+    n = index(n)
+    ordinal = d.toordinal()
+    if n > 0:
+        k = calendar._rank(ordinal + 1) + n - 1
+    else:
+        k = calendar._rank(ordinal) + n
+    if k < 0:
+        raise ValueError(f"Moving {d!r} by {n} workdays leaves the supported range (10001–19999)")
+    return GaianDate.fromordinal(calendar._select(k))
+
+
+def workdays_between(start: GaianDate, end: GaianDate, holidays=None) -> int:
+    """
+    Count the workdays from ``start`` (inclusive) to ``end`` (exclusive).
+
+    When ``end`` is before ``start`` the result is minus the count from
+    ``end`` to ``start``, so for a workday ``d``,
+    ``workdays_between(d, add_workdays(d, n)) == n``.
+    """
+    calendar = _holidays(holidays)
+    return calendar._rank(end.toordinal()) - calendar._rank(start.toordinal())
@@ -1,59 +1,146 @@
 """GaianDate — the core date type for the Gaian Calendar."""
 from __future__ import annotations
-import functools
-import re
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta, tzinfo
+from operator import index
 from ._convert import (
-    gregorian_to_gaian,
-    gaian_to_gregorian,
+    EPOCH_ORDINAL,
+    add_months,
+    add_years,
+    gaian_to_ordinal,
+    ordinal_to_gaian,
     is_leap_year,
+    timestamp_days,
+    year_length,
     validate_date,
-    day_of_year,
-    day_of_week,
 )
-from ._data import get_month, get_weekday
-from ._format import format_date
+from ._data import (
+    MONTH_ABBREVS,
+    MONTH_NAMES,
+    MONTH_SYMBOLS,
+    WEEKDAY_ABBREVS,
+    WEEKDAY_NAMES,
+    WEEKDAY_SYMBOLS,
+)
+from ._format import GaianFormatter, compile_pattern
 from .month import GaianMonth
 from .weekday import GaianWeekday
 
 
-@functools.total_ordering
+# Parsing lives in _parse, which imports and compiles regular expressions.
+# These stand-ins load it on first use and then rebind themselves to the
+# real functions, so importing GaianDate never pays for it.
+def parse_fields(s: str) -> tuple[int, int, int]:
+    global parse_fields
+    from ._parse import parse_fields
+    return parse_fields(s)
+
+
+def compile_parser(pattern: str):
+    global compile_parser
+    from ._parse import compile_parser
+    return compile_parser(pattern)
+
+
+# Interned month / weekday instances indexed by number
+_MONTHS = GaianMonth._members
+_WEEKDAYS = GaianWeekday._members
+
+# (epoch day, date) of the last from_timestamp() result; log timestamps
+# arrive in runs from the same day
+_last_timestamp: tuple = (None, None)
+
+
 class GaianDate:
     """
     An immutable Gaian Calendar date.
 
     Gaian year = ISO week-year + 10,000.
     13 months of 28 days; month 14 (Horus) has 7 days in leap years only.
+
+    Internally each date also carries its proleptic Gregorian day ordinal
+    (the same number as datetime.date.toordinal()), so arithmetic,
+    comparison and hashing are plain integer operations.
     """
 
-    __slots__ = ("_year", "_month", "_day")
+    __slots__ = ("_year", "_month", "_day", "_ordinal")
 
     def __init__(self, year: int, month: int, day: int) -> None:
         validate_date(year, month, day)
         self._year = year
         self._month = month
         self._day = day
+        self._ordinal = gaian_to_ordinal(year, month, day)
 
     # ------------------------------------------------------------------
     # Alternate constructors
     # ------------------------------------------------------------------
 
     @classmethod
-    def today(cls) -> GaianDate:
-        """Return the current Gaian date in local time."""
-        return cls.from_gregorian(date.today())
+    def today(cls, tz: tzinfo | None = None) -> GaianDate:
+        """Return the current Gaian date in local time, or in timezone ``tz``."""
+        if tz is None:
+            return cls.from_gregorian(date.today())
+        return cls.from_gregorian(datetime.now(tz).date())
 
     @classmethod
     def from_gregorian(cls, d: date) -> GaianDate:
         """Convert a Gregorian datetime.date to a GaianDate."""
-        year, month, day = gregorian_to_gaian(d)
-        return cls(year, month, day)
+        return cls.fromordinal(d.toordinal())
+
+    @classmethod
+    def fromordinal(cls, ordinal: int) -> GaianDate:
+        """Construct from a proleptic Gregorian ordinal, as date.fromordinal()."""
+        ordinal = index(ordinal)  # TypeError for floats; NumPy integers become int
+        year, month, day = ordinal_to_gaian(ordinal)
+        if year < 10_001 or year > 19_999:
+            raise ValueError(f"Year {year} out of supported range (10001–19999)")
+        self = object.__new__(cls)
+        self._year = year
+        self._month = month
+        self._day = day
+        self._ordinal = ordinal
+        return self
+
+    @classmethod
+    def from_timestamp(cls, ts: float, tz_offset: int | timedelta = 0, unit: str = "s") -> GaianDate:
+        """
+        Return the Gaian date of a Unix timestamp at a fixed UTC offset.
+
+        ``ts`` counts ``unit`` ("s", "ms", "us" or "ns") since 1970-01-01
+        UTC; ``tz_offset`` is the offset east of UTC in seconds or as a
+        timedelta (default 0: the UTC date, unlike date.fromtimestamp()).
+        Consecutive timestamps from the same day return the same object.
+        """
+        global _last_timestamp
+        day = timestamp_days(ts, tz_offset, unit)
+        last_day, last = _last_timestamp
+        if day == last_day and type(last) is cls:
+            return last
+        self = cls.fromordinal(day + EPOCH_ORDINAL)
+        _last_timestamp = (day, self)
+        return self
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> GaianDate:
+        """Inverse of to_bytes(): decode a 4-byte little-endian day ordinal."""
+        if len(data) != 4:
+            raise ValueError(f"Packed GaianDate must be 4 bytes, got {len(data)}")
+        return cls.fromordinal(int.from_bytes(data, "little"))
+
+    @classmethod
+    def _from_fields(cls, year: int, month: int, day: int, ordinal: int | None = None) -> GaianDate:
+        """Construct from fields that are already validated (skips validate_date)."""
+        self = object.__new__(cls)
+        self._year = year
+        self._month = month
+        self._day = day
+        self._ordinal = gaian_to_ordinal(year, month, day) if ordinal is None else ordinal
+        return self
 
     @classmethod
     def from_day_of_year(cls, year: int, doy: int) -> GaianDate:
         """Construct from a Gaian year and day-of-year (1–364 or 1–371 in leap years)."""
-        leap = is_leap_year(year)
-        max_doy = 371 if leap else 364
+        max_doy = year_length(year)
         if not 1 <= doy <= max_doy:
             raise ValueError(f"Day of year {doy} out of range (1–{max_doy}) for year {year}")
         if doy <= 364:
@@ -73,27 +160,18 @@ class GaianDate:
           - "Aqu 15, 12026"
           - "3/15/12026"
           - "12026-03-15"
-        """
-        s = s.strip().rstrip(" GE").strip().rstrip(",").strip()
 
-        # ISO-like numeric: 12026-03-15
-        m = re.fullmatch(r"(\d{5})-(\d{1,2})-(\d{1,2})", s)
-        if m:
-            return cls(int(m.group(1)), int(m.group(2)), int(m.group(3)))
-
-        # Slash numeric: 3/15/12026 or 03/15/12026
-        m = re.fullmatch(r"(\d{1,2})/(\d{1,2})/(\d{5})", s)
-        if m:
-            return cls(int(m.group(3)), int(m.group(1)), int(m.group(2)))
-
-        # Named: "Aquarius 15, 12026" or "Aqu 15, 12026"
-        m = re.fullmatch(r"([A-Za-z]+)\s+(\d{1,2}),?\s*(\d{5})", s)
-        if m:
-            from ._data import get_month_by_name
-            month_data = get_month_by_name(m.group(1))
-            return cls(int(m.group(3)), month_data["number"], int(m.group(2)))
+        Results for repeated strings are cached; see parse_many() for bulk input.
+        """
+        return cls._from_fields(*parse_fields(s))
 
-        raise ValueError(f"Cannot parse {s!r} as a GaianDate")
+    @classmethod
+    def strptime(cls, s: str, pattern: str) -> GaianDate:
+        """
+        Parse a string written in a format pattern, e.g. "WWWW, MMMM d, yyyy GE"
+        or "yyyy-DDD". The pattern is compiled once and cached.
+        """
+        return cls._from_fields(*compile_parser(pattern).parse(s))
 
     # ------------------------------------------------------------------
     # Properties
@@ -114,12 +192,12 @@ class GaianDate:
     @property
     def day_of_week(self) -> int:
         """ISO weekday: 1 (Monday) … 7 (Sunday)."""
-        return day_of_week(self._day)
+        return (self._day - 1) % 7 + 1
 
     @property
     def day_of_year(self) -> int:
         """1–364, or up to 371 in leap years."""
-        return day_of_year(self._month, self._day)
+        return (self._month - 1) * 28 + self._day
 
     @property
     def is_leap_year(self) -> bool:
@@ -128,35 +206,35 @@ class GaianDate:
 
     @property
     def month_name(self) -> str:
-        return get_month(self._month)["name"]
+        return MONTH_NAMES[self._month]
 
     @property
     def month_symbol(self) -> str:
-        return get_month(self._month)["symbol"]
+        return MONTH_SYMBOLS[self._month]
 
     @property
     def month_abbrev(self) -> str:
-        return get_month(self._month)["abbrev"]
+        return MONTH_ABBREVS[self._month]
 
     @property
     def weekday_name(self) -> str:
-        return get_weekday(self.day_of_week)["name"]
+        return WEEKDAY_NAMES[(self._day - 1) % 7 + 1]
 
     @property
     def weekday_symbol(self) -> str:
-        return get_weekday(self.day_of_week)["symbol"]
+        return WEEKDAY_SYMBOLS[(self._day - 1) % 7 + 1]
 
     @property
     def weekday_abbrev(self) -> str:
-        return get_weekday(self.day_of_week)["abbrev"]
+        return WEEKDAY_ABBREVS[(self._day - 1) % 7 + 1]
 
     @property
     def gaian_month(self) -> GaianMonth:
-        return GaianMonth(self._month)
+        return _MONTHS[self._month]
 
     @property
     def gaian_weekday(self) -> GaianWeekday:
-        return GaianWeekday(self.day_of_week)
+        return _WEEKDAYS[(self._day - 1) % 7 + 1]
 
     # ------------------------------------------------------------------
     # Conversion
@@ -164,7 +242,15 @@ class GaianDate:
 
     def to_gregorian(self) -> date:
         """Convert to a Gregorian datetime.date."""
-        return gaian_to_gregorian(self._year, self._month, self._day)
+        return date.fromordinal(self._ordinal)
+
+    def toordinal(self) -> int:
+        """Return the proleptic Gregorian ordinal, as date.toordinal()."""
+        return self._ordinal
+
+    def to_bytes(self) -> bytes:
+        """Return the day ordinal as 4 little-endian bytes (see pack_many for bulk)."""
+        return self._ordinal.to_bytes(4, "little")
 
     # ------------------------------------------------------------------
     # Formatting
@@ -172,7 +258,7 @@ class GaianDate:
 
     def format(self, pattern: str) -> str:
         """Format using a pattern string. See planning/03_api_design.md for tokens."""
-        return format_date(self._year, self._month, self._day, pattern)
+        return compile_pattern(pattern).format(self._year, self._month, self._day)
 
     # ------------------------------------------------------------------
     # Arithmetic
@@ -180,19 +266,32 @@ class GaianDate:
 
     def __add__(self, other: object) -> GaianDate:
         if isinstance(other, timedelta):
-            greg = self.to_gregorian() + other
-            return GaianDate.from_gregorian(greg)
+            return GaianDate.fromordinal(self._ordinal + other.days)
         return NotImplemented
 
     def __radd__(self, other: object) -> GaianDate:
         return self.__add__(other)
 
+    def add_months(self, months: int) -> GaianDate:
+        """
+        Return the date ``months`` Gaian months away, on the same day of
+        month. Horus counts as a month in leap years; landing on Horus
+        clamps a day above 7 to Horus 7.
+        """
+        return GaianDate._from_fields(*add_months(self._year, self._month, self._day, months))
+
+    def add_years(self, years: int) -> GaianDate:
+        """
+        Return the same month and day ``years`` years away. A Horus date
+        moved to a year without Horus becomes Ophiuchus 28.
+        """
+        return GaianDate._from_fields(*add_years(self._year, self._month, self._day, years))
+
     def __sub__(self, other: object) -> GaianDate | timedelta:
         if isinstance(other, timedelta):
-            greg = self.to_gregorian() - other
-            return GaianDate.from_gregorian(greg)
+            return GaianDate.fromordinal(self._ordinal - other.days)
         if isinstance(other, GaianDate):
-            return self.to_gregorian() - other.to_gregorian()
+            return timedelta(self._ordinal - other._ordinal)
         return NotImplemented
 
     # ------------------------------------------------------------------
@@ -201,16 +300,37 @@ class GaianDate:
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, GaianDate):
-            return (self._year, self._month, self._day) == (other._year, other._month, other._day)
+            return self._ordinal == other._ordinal
         return NotImplemented
 
     def __lt__(self, other: object) -> bool:
         if isinstance(other, GaianDate):
-            return (self._year, self._month, self._day) < (other._year, other._month, other._day)
+            return self._ordinal < other._ordinal
+        return NotImplemented
+
+    def __le__(self, other: object) -> bool:
+        if isinstance(other, GaianDate):
+            return self._ordinal <= other._ordinal
+        return NotImplemented
+
+    def __gt__(self, other: object) -> bool:
+        if isinstance(other, GaianDate):
+            return self._ordinal > other._ordinal
+        return NotImplemented
+
+    def __ge__(self, other: object) -> bool:
+        if isinstance(other, GaianDate):
+            return self._ordinal >= other._ordinal
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash((self._year, self._month, self._day))
+        return hash(self._ordinal)
+
+    def __reduce__(self):
+        # Pickle as the bare ordinal instead of the slot-state dict
+        if type(self) is GaianDate:
+            return (_from_ordinal, (self._ordinal,))
+        return (_from_ordinal, (self._ordinal, type(self)))
 
     # ------------------------------------------------------------------
     # Representation
@@ -220,4 +340,12 @@ class GaianDate:
         return f"GaianDate({self._year}, {self._month}, {self._day})"
 
     def __str__(self) -> str:
-        return self.format("MMMM d, yyyy GE")
+        return _DEFAULT_FORMAT.format(self._year, self._month, self._day)
+
+
+def _from_ordinal(ordinal: int, cls: type = GaianDate) -> GaianDate:
+    """Unpickle a GaianDate from the ordinal written by __reduce__."""
+    return cls.fromordinal(ordinal)
+
+
+_DEFAULT_FORMAT = GaianFormatter("MMMM d, yyyy GE")
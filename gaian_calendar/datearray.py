@@ -0,0 +1,306 @@
+"""
+GaianDateArray — a column of Gaian dates stored as one int32 ordinal buffer.
+
+Requires NumPy (``pip install GaianCalendar[numpy]``); the package imports
+this module only on first use of GaianDateArray.
+"""
+from __future__ import annotations
+from ._data import (
+    MONTH_ABBREVS,
+    MONTH_NAMES,
+    MONTH_SYMBOLS,
+    WEEKDAY_ABBREVS,
+    WEEKDAY_NAMES,
+    WEEKDAY_SYMBOLS,
+)
+from ._vectorized import (
+    EPOCH_ORDINAL,
+    _check_ordinal_range,
+    _epoch_days,
+    _ordinals_to_fields,
+    _timestamp_days,
+    _year_starts,
+    add_workdays_array,
+    gaian_to_gregorian_array,
+    np,
+)
+from .date import GaianDate
+
+_MONTH_NAMES = np.array(MONTH_NAMES)
+_MONTH_ABBREVS = np.array(MONTH_ABBREVS)
+_MONTH_SYMBOLS = np.array(MONTH_SYMBOLS)
+_WEEKDAY_NAMES = np.array(WEEKDAY_NAMES)
+_WEEKDAY_ABBREVS = np.array(WEEKDAY_ABBREVS)
+_WEEKDAY_SYMBOLS = np.array(WEEKDAY_SYMBOLS)
+
+
+class GaianDateArray:
+    """
+    An immutable, one-dimensional array of Gaian dates.
+
+    Each date is stored as its day ordinal (GaianDate.toordinal()) in a
+    single read-only int32 NumPy array, 4 bytes per date. Properties such as
+    ``year``, ``month_name`` or ``is_leap_year`` return NumPy columns computed
+    for the whole array at once; comparisons return boolean arrays.
+    GaianDate objects are only created when single elements are read.
+
+    The ordinal buffer is available as ``ordinals`` (and through
+    ``memoryview(arr)`` on Python 3.12+).
+    """
+
+    __slots__ = ("_ordinals", "_fields")
+
+    def __init__(self, dates=()) -> None:
+        if isinstance(dates, GaianDateArray):
+            ordinals = dates._ordinals
+        else:
+            ordinals = np.fromiter(map(GaianDate.toordinal, dates), dtype=np.int32)
+            ordinals.flags.writeable = False
+        self._ordinals = ordinals
+        self._fields = None
+
+    @classmethod
+    def _wrap(cls, ordinals: np.ndarray) -> GaianDateArray:
+        """Wrap an int32 array that nothing else holds, or a read-only view."""
+        ordinals.flags.writeable = False
+        self = object.__new__(cls)
+        self._ordinals = ordinals
+        self._fields = None
+        return self
+
+    # ------------------------------------------------------------------
+    # Alternate constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_ordinals(cls, ordinals) -> GaianDateArray:
+        """Construct from day ordinals; raise ValueError naming out-of-range indices."""
+        ordinals = np.asarray(ordinals)
+        if ordinals.dtype.kind not in "iu":
+            raise TypeError(f"Ordinals must be integers, got dtype {ordinals.dtype}")
+        ordinals = ordinals.ravel()
+        _check_ordinal_range(ordinals.astype(np.int64, copy=False))
+        return cls._wrap(ordinals.astype(np.int32))
+
+    @classmethod
+    def from_fields(cls, year, month, day) -> GaianDateArray:
+        """Construct from year, month and day arrays (broadcast and validated)."""
+        return cls.from_datetime64(gaian_to_gregorian_array(year, month, day))
+
+    @classmethod
+    def from_datetime64(cls, values) -> GaianDateArray:
+        """
+        Construct from a ``datetime64`` array of any unit (times are floored
+        to their day) or an integer array of days since 1970-01-01.
+        """
+        ordinals = _epoch_days(values).ravel() + EPOCH_ORDINAL
+        _check_ordinal_range(ordinals)
+        return cls._wrap(ordinals.astype(np.int32))
+
+    @classmethod
+    def from_timestamps(cls, values, tz_offset=0, unit: str = "s") -> GaianDateArray:
+        """
+        Construct from Unix timestamps (see timestamps_to_gaian for
+        ``tz_offset`` and ``unit``).
+        """
+        ordinals = _timestamp_days(values, tz_offset, unit).ravel() + EPOCH_ORDINAL
+        _check_ordinal_range(ordinals)
+        return cls._wrap(ordinals.astype(np.int32))
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    @property
+    def ordinals(self) -> np.ndarray:
+        """The read-only int32 ordinal buffer (no copy)."""
+        return self._ordinals
+
+    def to_datetime64(self) -> np.ndarray:
+        """Return the dates as a ``datetime64[D]`` array."""
+        return (self._ordinals.astype(np.int64) - EPOCH_ORDINAL).astype("datetime64[D]")
+
+    def tolist(self) -> list[GaianDate]:
+        return list(self)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(self._ordinals)
+
+    @property
+    def nbytes(self) -> int:
+        return self._ordinals.nbytes
+
+    # ------------------------------------------------------------------
+    # Vectorized properties
+    # ------------------------------------------------------------------
+
+    def _get_fields(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._fields is None:
+            fields = _ordinals_to_fields(self._ordinals.astype(np.int64))
+            fields = tuple(a.astype(np.int32) for a in fields)
+            for a in fields:
+                a.flags.writeable = False
+            self._fields = fields
+        return self._fields
+
+    @property
+    def year(self) -> np.ndarray:
+        return self._get_fields()[0]
+
+    @property
+    def month(self) -> np.ndarray:
+        return self._get_fields()[1]
+
+    @property
+    def day(self) -> np.ndarray:
+        return self._get_fields()[2]
+
+    @property
+    def day_of_week(self) -> np.ndarray:
+        """1 = Monday … 7 = Sunday."""
+        return (self.day - 1) % 7 + 1
+
+    @property
+    def day_of_year(self) -> np.ndarray:
+        _, month, day = self._get_fields()
+        return (month - 1) * 28 + day
+
+    @property
+    def is_leap_year(self) -> np.ndarray:
+        iso_years = self.year - 10_000
+        starts = _year_starts()
+        return starts[iso_years + 1] - starts[iso_years] == 371
+
+    @property
+    def month_name(self) -> np.ndarray:
+        return _MONTH_NAMES[self.month]
+
+    @property
+    def month_symbol(self) -> np.ndarray:
+        return _MONTH_SYMBOLS[self.month]
+
+    @property
+    def month_abbrev(self) -> np.ndarray:
+        return _MONTH_ABBREVS[self.month]
+
+    @property
+    def weekday_name(self) -> np.ndarray:
+        return _WEEKDAY_NAMES[self.day_of_week]
+
+    @property
+    def weekday_symbol(self) -> np.ndarray:
+        return _WEEKDAY_SYMBOLS[self.day_of_week]
+
+    @property
+    def weekday_abbrev(self) -> np.ndarray:
+        return _WEEKDAY_ABBREVS[self.day_of_week]
+
+    # ------------------------------------------------------------------
+    # Sorting and searching
+    # ------------------------------------------------------------------
+
+    def argsort(self, kind: str | None = None) -> np.ndarray:
+        return self._ordinals.argsort(kind=kind)
+
+    def sorted(self) -> GaianDateArray:
+        """Return a new array with the dates in ascending order."""
+        return GaianDateArray._wrap(np.sort(self._ordinals))
+
+    def searchsorted(self, value, side: str = "left"):
+        """
+        Find insertion points for ``value`` (a GaianDate, GaianDateArray or
+        iterable of GaianDates) in this array, which must be sorted.
+        """
+        return self._ordinals.searchsorted(_ordinals_of(value), side=side)
+
+    def min(self) -> GaianDate:
+        return GaianDate.fromordinal(int(self._ordinals.min()))
+
+    def max(self) -> GaianDate:
+        return GaianDate.fromordinal(int(self._ordinals.max()))
+
+    # ------------------------------------------------------------------
+    # Workdays
+    # ------------------------------------------------------------------
+
+    def add_workdays(self, n, holidays=None) -> GaianDateArray:
+        """Return each date moved by ``n`` workdays (see add_workdays)."""
+        ordinals = add_workdays_array(self._ordinals, n, holidays)
+        return GaianDateArray._wrap(ordinals.ravel().astype(np.int32))
+
+    # ------------------------------------------------------------------
+    # Sequence protocol
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __getitem__(self, key):
+        """An integer index returns a GaianDate; slices, masks and index arrays a GaianDateArray."""
+        if isinstance(key, (int, np.integer)):
+            return GaianDate.fromordinal(int(self._ordinals[key]))
+        return GaianDateArray._wrap(self._ordinals[key])
+
+    def __iter__(self):
+        make = GaianDate._from_fields
+        year, month, day = self._get_fields()
+        return map(make, year.tolist(), month.tolist(), day.tolist(), self._ordinals.tolist())
+
+    def __contains__(self, d: object) -> bool:
+        return isinstance(d, GaianDate) and bool((self._ordinals == d.toordinal()).any())
+
+    # ------------------------------------------------------------------
+    # Comparison (elementwise)
+    # ------------------------------------------------------------------
+
+    def __eq__(self, other):
+        other = _comparable(other)
+        return NotImplemented if other is None else self._ordinals == other
+
+    def __ne__(self, other):
+        other = _comparable(other)
+        return NotImplemented if other is None else self._ordinals != other
+
+    def __lt__(self, other):
+        other = _comparable(other)
+        return NotImplemented if other is None else self._ordinals < other
+
+    def __le__(self, other):
+        other = _comparable(other)
+        return NotImplemented if other is None else self._ordinals <= other
+
+    def __gt__(self, other):
+        other = _comparable(other)
+        return NotImplemented if other is None else self._ordinals > other
+
+    def __ge__(self, other):
+        other = _comparable(other)
+        return NotImplemented if other is None else self._ordinals >= other
+
+    __hash__ = None  # elementwise __eq__, like numpy arrays
+
+    def __repr__(self) -> str:
+        n = len(self)
+        if n <= 6:
+            items = ", ".join(repr(d) for d in self)
+        else:
+            items = ", ".join(repr(self[i]) for i in (0, 1, 2)) + ", …, " + \
+                ", ".join(repr(self[i]) for i in (n - 3, n - 2, n - 1))
+        return f"GaianDateArray([{items}], length={n})"
+
+
+def _comparable(other):
+    """Ordinal form of a comparison operand, or None if unsupported."""
+    if isinstance(other, GaianDate):
+        return other.toordinal()
+    if isinstance(other, GaianDateArray):
+        return other._ordinals
+    return None
+
+
+def _ordinals_of(value):
+    if isinstance(value, GaianDate):
+        return value.toordinal()
+    if isinstance(value, GaianDateArray):
+        return value._ordinals
+    return np.fromiter(map(GaianDate.toordinal, value), dtype=np.int32)
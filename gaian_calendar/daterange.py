@@ -0,0 +1,222 @@
+"""GaianDateRange — a lazy, range-like sequence of Gaian dates."""
+from __future__ import annotations
+from datetime import timedelta
+from ._convert import month_from_index, month_index, months_in_year
+from .date import GaianDate
+
+_UNITS = ("days", "weeks", "months")
+
+
+class GaianDateRange:
+    """
+    An immutable sequence of dates from ``start`` up to (not including) ``stop``,
+    modeled on the built-in ``range``.
+
+    ``step`` counts ``unit``s: "days" (default), "weeks" or "months"; a
+    ``timedelta`` of whole days is also accepted as the step. Negative
+    steps count backwards. ``len``, ``in``, indexing and slicing are O(1).
+
+    Month steps count Horus as a month in leap years and keep the start's
+    day of month. On Horus, which has 7 days, a day above 7 is clamped to
+    Horus 7. The next month in the sequence returns to the original day.
+    """
+
+    __slots__ = ("_indices", "_unit", "_day", "_stop")
+
+    def __init__(
+        self,
+        start: GaianDate,
+        stop: GaianDate,
+        step: int | timedelta = 1,
+        *,
+        unit: str = "days",
+    ) -> None:
+        if unit not in _UNITS:
+            raise ValueError(f"unit must be one of {_UNITS}, got {unit!r}")
+        if isinstance(step, timedelta):
+            if unit != "days" or step.seconds or step.microseconds:
+                raise ValueError("A timedelta step must be a whole number of days")
+            step = step.days
+        if step == 0:
+            raise ValueError("GaianDateRange step must not be zero")
+        if unit == "months":
+            first = month_index(start.year, start.month)
+            last = month_index(stop.year, stop.month)
+            # Whether the element that would fall in stop's own month is in range
+            day = min(start.day, 7) if stop.month == 14 else start.day
+            if (step > 0 and day < stop.day) or (step < 0 and day > stop.day):
+                last += 1 if step > 0 else -1
+            self._indices = range(first, last, step)
+            self._day = start.day
+        else:
+            days = step * 7 if unit == "weeks" else step
+            self._indices = range(start.toordinal(), stop.toordinal(), days)
+            self._day = 0
+        self._unit = unit
+        self._stop = stop
+
+    @classmethod
+    def _from_indices(cls, indices: range, unit: str, day: int) -> GaianDateRange:
+        self = object.__new__(cls)
+        self._indices = indices
+        self._unit = unit
+        self._day = day
+        self._stop = None
+        return self
+
+    # ------------------------------------------------------------------
+    # Properties
+    # ------------------------------------------------------------------
+
+    @property
+    def start(self) -> GaianDate:
+        return self._element(self._indices.start)
+
+    @property
+    def stop(self) -> GaianDate:
+        if self._stop is None:
+            return self._element(self._indices.stop)
+        return self._stop
+
+    @property
+    def step(self) -> int:
+        """Step in ``unit``s (weeks are reported as weeks)."""
+        step = self._indices.step
+        return step // 7 if self._unit == "weeks" else step
+
+    @property
+    def unit(self) -> str:
+        return self._unit
+
+    # ------------------------------------------------------------------
+    # Element mapping
+    # ------------------------------------------------------------------
+
+    def _element(self, index: int) -> GaianDate:
+        """Map an ordinal (day/week units) or month index (month unit) to a date."""
+        if self._day:
+            year, month = month_from_index(index)
+            day = min(self._day, 7) if month == 14 else self._day
+            return GaianDate._from_fields(year, month, day)
+        return GaianDate.fromordinal(index)
+
+    def _index_of(self, d: GaianDate) -> int | None:
+        """Inverse of _element, or None if no index maps to this date."""
+        if self._day:
+            day = min(self._day, 7) if d.month == 14 else self._day
+            return month_index(d.year, d.month) if d.day == day else None
+        return d.toordinal()
+
+    # ------------------------------------------------------------------
+    # Sequence protocol
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __bool__(self) -> bool:
+        return bool(self._indices)
+
+    def __getitem__(self, key: int | slice) -> GaianDate | GaianDateRange:
+        if isinstance(key, slice):
+            return GaianDateRange._from_indices(self._indices[key], self._unit, self._day)
+        return self._element(self._indices[key])
+
+    def __contains__(self, d: object) -> bool:
+        if not isinstance(d, GaianDate):
+            return False
+        index = self._index_of(d)
+        return index is not None and index in self._indices
+
+    def index(self, d: GaianDate) -> int:
+        """Return the position of ``d``; raise ValueError if it is not in the range."""
+        if d not in self:
+            raise ValueError(f"{d!r} is not in range")
+        return self._indices.index(self._index_of(d))
+
+    def count(self, d: GaianDate) -> int:
+        return 1 if d in self else 0
+
+    def __iter__(self):
+        indices = self._indices
+        if not indices:
+            return iter(())
+        if self._day:
+            return self._iter_months(indices)
+        return self._iter_days(indices)
+
+    def __reversed__(self):
+        return iter(self[::-1])
+
+    def _iter_days(self, indices: range):
+        """Step the (year, month, day) fields directly instead of converting each ordinal."""
+        step = indices.step
+        if abs(step) > 28:  # rolls over several months per step; convert instead
+            yield from map(GaianDate.fromordinal, indices)
+            return
+        first = GaianDate.fromordinal(indices.start)
+        year, month, day, ordinal = first.year, first.month, first.day, indices.start
+        months = months_in_year(year)
+        make = GaianDate._from_fields
+        for _ in range(len(indices)):
+            yield make(year, month, day, ordinal)
+            ordinal += step
+            day += step
+            while day > (7 if month == 14 else 28):
+                day -= 7 if month == 14 else 28
+                month += 1
+                if month > months:
+                    year += 1
+                    month = 1
+                    months = months_in_year(year)
+            while day < 1:
+                month -= 1
+                if month < 1:
+                    year -= 1
+                    months = months_in_year(year)
+                    month = months
+                day += 7 if month == 14 else 28
+
+    def _iter_months(self, indices: range):
+        """Step (year, month) directly, clamping the day on Horus."""
+        step = indices.step
+        year, month = month_from_index(indices.start)
+        months = months_in_year(year)
+        make = GaianDate._from_fields
+        for _ in range(len(indices)):
+            yield make(year, month, min(self._day, 7) if month == 14 else self._day)
+            month += step
+            while month > months:
+                month -= months
+                year += 1
+                months = months_in_year(year)
+            while month < 1:
+                year -= 1
+                months = months_in_year(year)
+                month += months
+
+    # ------------------------------------------------------------------
+    # Dunder methods
+    # ------------------------------------------------------------------
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, GaianDateRange):
+            if not self._indices and not other._indices:
+                return True
+            return (self._indices, self._day) == (other._indices, other._day)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        if not self._indices:
+            return hash(())
+        return hash((self._indices, self._day))
+
+    def __repr__(self) -> str:
+        try:
+            bounds = f"{self.start!r}, {self.stop!r}"
+        except ValueError:  # a bound outside the supported years
+            bounds = f"indices={self._indices!r}"
+        step = self.step
+        if self._unit == "days" and step == 1:
+            return f"GaianDateRange({bounds})"
+        return f"GaianDateRange({bounds}, {step}, unit={self._unit!r})"
@@ -0,0 +1,356 @@
+"""GaianDateTime — a Gaian date with a time of day and optional tzinfo."""
+from __future__ import annotations
+from datetime import date, datetime, time, timedelta, timezone, tzinfo as TZInfo
+from ._convert import EPOCH_ORDINAL, _offset_units, _units_per_day
+from ._format import GaianFormatter, compile_pattern
+from .date import GaianDate
+from .delta import GaianDelta
+
+_DAY_US = 86_400_000_000
+_HOUR_US = 3_600_000_000
+_MINUTE_US = 60_000_000
+_SECOND_US = 1_000_000
+
+
+def _timedelta_us(delta: timedelta) -> int:
+    return (delta.days * 86_400 + delta.seconds) * _SECOND_US + delta.microseconds
+
+
+class GaianDateTime:
+    """
+    An immutable Gaian date and time of day, naive or with a ``tzinfo``.
+
+    Composes a GaianDate with the time as integer microseconds since
+    midnight, so adding a timedelta or subtracting two datetimes is integer
+    arithmetic on (ordinal * day + time) with no datetime round-trips. As
+    with datetime.datetime, arithmetic happens in wall-clock time and keeps
+    the tzinfo; comparing or subtracting two aware values uses UTC.
+    """
+
+    __slots__ = ("_date", "_time", "_tzinfo")
+
+    def __init__(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: int = 0,
+        minute: int = 0,
+        second: int = 0,
+        microsecond: int = 0,
+        tzinfo: TZInfo | None = None,
+    ) -> None:
+        if not 0 <= hour <= 23:
+            raise ValueError(f"Hour {hour} out of range (0–23)")
+        if not 0 <= minute <= 59:
+            raise ValueError(f"Minute {minute} out of range (0–59)")
+        if not 0 <= second <= 59:
+            raise ValueError(f"Second {second} out of range (0–59)")
+        if not 0 <= microsecond <= 999_999:
+            raise ValueError(f"Microsecond {microsecond} out of range (0–999999)")
+        if tzinfo is not None and not isinstance(tzinfo, TZInfo):
+            raise TypeError(f"tzinfo must be a datetime.tzinfo or None, got {type(tzinfo).__name__}")
+        self._date = GaianDate(year, month, day)
+        self._time = hour * _HOUR_US + minute * _MINUTE_US + second * _SECOND_US + microsecond
+        self._tzinfo = tzinfo
+
+    @classmethod
+    def _from_parts(cls, d: GaianDate, micros: int, tzinfo: TZInfo | None) -> GaianDateTime:
+        """Construct from a date and validated microseconds since midnight."""
+        self = object.__new__(cls)
+        self._date = d
+        self._time = micros
+        self._tzinfo = tzinfo
+        return self
+
+    @classmethod
+    def _from_local_us(cls, local_us: int, tzinfo: TZInfo | None) -> GaianDateTime:
+        """Construct from microseconds since midnight of ordinal 0, wall-clock time."""
+        ordinal, micros = divmod(local_us, _DAY_US)
+        return cls._from_parts(GaianDate.fromordinal(ordinal), micros, tzinfo)
+
+    # ------------------------------------------------------------------
+    # Alternate constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def now(cls, tz: TZInfo | None = None) -> GaianDateTime:
+        """Return the current local time, or the current time in ``tz``."""
+        return cls.from_datetime(datetime.now(tz))
+
+    @classmethod
+    def combine(cls, d: GaianDate, t: time = time(), tzinfo: TZInfo | None = None) -> GaianDateTime:
+        """Combine a GaianDate and a datetime.time; ``tzinfo`` defaults to ``t.tzinfo``."""
+        micros = t.hour * _HOUR_US + t.minute * _MINUTE_US + t.second * _SECOND_US + t.microsecond
+        return cls._from_parts(d, micros, t.tzinfo if tzinfo is None else tzinfo)
+
+    @classmethod
+    def from_datetime(cls, dt: datetime) -> GaianDateTime:
+        """Convert a datetime.datetime, keeping its tzinfo."""
+        micros = dt.hour * _HOUR_US + dt.minute * _MINUTE_US + dt.second * _SECOND_US + dt.microsecond
+        return cls._from_parts(GaianDate.fromordinal(dt.toordinal()), micros, dt.tzinfo)
+
+    @classmethod
+    def from_timestamp(cls, ts: float, tz_offset: int | timedelta | TZInfo = 0,
+                       unit: str = "s") -> GaianDateTime:
+        """
+        Return the aware GaianDateTime of a Unix timestamp.
+
+        ``ts`` counts ``unit`` ("s", "ms", "us" or "ns") since 1970-01-01
+        UTC; finer units are floored to microseconds. ``tz_offset`` is a
+        fixed offset east of UTC in seconds or as a timedelta (the result
+        carries the matching datetime.timezone), or any tzinfo, whose
+        offset for that instant is looked up through datetime.
+        """
+        per_day = _units_per_day(unit)
+        if isinstance(ts, int):
+            utc_us = ts * _DAY_US // per_day
+        else:
+            utc_us = round(ts * (_DAY_US / per_day))
+        if isinstance(tz_offset, TZInfo):
+            if not isinstance(tz_offset, timezone):
+                utc = datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(microseconds=utc_us)
+                return cls.from_datetime(utc.astimezone(tz_offset))
+            tz = tz_offset
+            offset_us = _timedelta_us(tz.utcoffset(None))
+        else:
+            offset_us = _offset_units(tz_offset, _DAY_US) if tz_offset else 0
+            tz = timezone(timedelta(microseconds=offset_us)) if offset_us else timezone.utc
+        return cls._from_local_us(utc_us + offset_us + EPOCH_ORDINAL * _DAY_US, tz)
+
+    # ------------------------------------------------------------------
+    # Properties
+    # ------------------------------------------------------------------
+
+    @property
+    def date(self) -> GaianDate:
+        return self._date
+
+    @property
+    def year(self) -> int:
+        return self._date.year
+
+    @property
+    def month(self) -> int:
+        return self._date.month
+
+    @property
+    def day(self) -> int:
+        return self._date.day
+
+    @property
+    def hour(self) -> int:
+        return self._time // _HOUR_US
+
+    @property
+    def minute(self) -> int:
+        return self._time // _MINUTE_US % 60
+
+    @property
+    def second(self) -> int:
+        return self._time // _SECOND_US % 60
+
+    @property
+    def microsecond(self) -> int:
+        return self._time % _SECOND_US
+
+    @property
+    def tzinfo(self) -> TZInfo | None:
+        return self._tzinfo
+
+    @property
+    def day_of_week(self) -> int:
+        """ISO weekday: 1 (Monday) … 7 (Sunday)."""
+        return self._date.day_of_week
+
+    @property
+    def day_of_year(self) -> int:
+        """1–364, or up to 371 in leap years."""
+        return self._date.day_of_year
+
+    def time(self) -> time:
+        """Return the time of day as a naive datetime.time."""
+        return time(*self._clock())
+
+    def _clock(self) -> tuple[int, int, int, int]:
+        seconds, microsecond = divmod(self._time, _SECOND_US)
+        minutes, second = divmod(seconds, 60)
+        hour, minute = divmod(minutes, 60)
+        return hour, minute, second, microsecond
+
+    def utcoffset(self) -> timedelta | None:
+        """The tzinfo's UTC offset at this time, or None if naive."""
+        tz = self._tzinfo
+        if tz is None:
+            return None
+        if isinstance(tz, timezone):  # fixed offset: no datetime needed
+            return tz.utcoffset(None)
+        return tz.utcoffset(self.to_datetime())
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    def to_datetime(self) -> datetime:
+        """Convert to a datetime.datetime with the same tzinfo."""
+        d = date.fromordinal(self._date.toordinal())
+        return datetime(d.year, d.month, d.day, *self._clock(), tzinfo=self._tzinfo)
+
+    def _local_us(self) -> int:
+        return self._date.toordinal() * _DAY_US + self._time
+
+    def _utc_us(self) -> int:
+        """Microseconds since midnight of ordinal 0, UTC (aware values only)."""
+        return self._local_us() - _timedelta_us(self.utcoffset())
+
+    def to_timestamp(self, unit: str = "s") -> int:
+        """
+        Return the Unix time in ``unit`` ("s", "ms", "us" or "ns"), floored
+        for "s" and "ms". Naive values are taken as local time, as
+        datetime.timestamp() does.
+        """
+        per_day = _units_per_day(unit)
+        if self._tzinfo is None:
+            utc_us = self._local_us() - _timedelta_us(self.to_datetime().astimezone().utcoffset())
+        else:
+            utc_us = self._utc_us()
+        return (utc_us - EPOCH_ORDINAL * _DAY_US) * per_day // _DAY_US
+
+    def timestamp(self) -> float:
+        """Return the Unix time in seconds as a float, like datetime.timestamp()."""
+        return self.to_timestamp("us") / _SECOND_US
+
+    # ------------------------------------------------------------------
+    # Formatting
+    # ------------------------------------------------------------------
+
+    def format(self, pattern: str) -> str:
+        """Format using a pattern string with date and time tokens (see _format)."""
+        d = self._date
+        return compile_pattern(pattern, True).format_datetime(
+            d.year, d.month, d.day, *self._clock(), self.utcoffset(),
+        )
+
+    # ------------------------------------------------------------------
+    # Arithmetic
+    # ------------------------------------------------------------------
+
+    def __add__(self, other: object) -> GaianDateTime:
+        if isinstance(other, timedelta):
+            return type(self)._from_local_us(self._local_us() + _timedelta_us(other), self._tzinfo)
+        if isinstance(other, GaianDelta):
+            return type(self)._from_parts(self._date + other, self._time, self._tzinfo)
+        return NotImplemented
+
+    def __radd__(self, other: object) -> GaianDateTime:
+        return self.__add__(other)
+
+    def add_months(self, months: int) -> GaianDateTime:
+        """Move the date by whole months (see GaianDate.add_months), keeping the time."""
+        return type(self)._from_parts(self._date.add_months(months), self._time, self._tzinfo)
+
+    def add_years(self, years: int) -> GaianDateTime:
+        """Move the date by whole years (see GaianDate.add_years), keeping the time."""
+        return type(self)._from_parts(self._date.add_years(years), self._time, self._tzinfo)
+
+    def __sub__(self, other: object) -> GaianDateTime | timedelta:
+        if isinstance(other, timedelta):
+            return type(self)._from_local_us(self._local_us() - _timedelta_us(other), self._tzinfo)
+        if isinstance(other, GaianDelta):
+            return type(self)._from_parts(self._date - other, self._time, self._tzinfo)
+        if isinstance(other, GaianDateTime):
+            if (self._tzinfo is None) != (other._tzinfo is None):
+                raise TypeError("Cannot subtract offset-naive and offset-aware GaianDateTimes")
+            if self._tzinfo is None or self._tzinfo is other._tzinfo:
+                return timedelta(microseconds=self._local_us() - other._local_us())
+            return timedelta(microseconds=self._utc_us() - other._utc_us())
+        return NotImplemented
+
+    # ------------------------------------------------------------------
+    # Comparison
+    # ------------------------------------------------------------------
+
+    def _key(self, other: GaianDateTime) -> tuple[int, int]:
+        """Comparable microsecond values of self and other, as datetime compares them."""
+        if self._tzinfo is other._tzinfo:
+            return self._local_us(), other._local_us()
+        if self._tzinfo is None or other._tzinfo is None:
+            raise TypeError("Cannot compare offset-naive and offset-aware GaianDateTimes")
+        return self._utc_us(), other._utc_us()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, GaianDateTime):
+            if (self._tzinfo is None) != (other._tzinfo is None):
+                return False
+            a, b = self._key(other)
+            return a == b
+        return NotImplemented
+
+    def __lt__(self, other: object) -> bool:
+        if isinstance(other, GaianDateTime):
+            a, b = self._key(other)
+            return a < b
+        return NotImplemented
+
+    def __le__(self, other: object) -> bool:
+        if isinstance(other, GaianDateTime):
+            a, b = self._key(other)
+            return a <= b
+        return NotImplemented
+
+    def __gt__(self, other: object) -> bool:
+        if isinstance(other, GaianDateTime):
+            a, b = self._key(other)
+            return a > b
+        return NotImplemented
+
+    def __ge__(self, other: object) -> bool:
+        if isinstance(other, GaianDateTime):
+            a, b = self._key(other)
+            return a >= b
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._local_us() if self._tzinfo is None else self._utc_us())
+
+    def __reduce__(self):
+        return (_from_state, (self._date.toordinal(), self._time, self._tzinfo, type(self)))
+
+    # ------------------------------------------------------------------
+    # Representation
+    # ------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        d = self._date
+        hour, minute, second, microsecond = self._clock()
+        fields = [d.year, d.month, d.day, hour, minute]
+        if second or microsecond:
+            fields.append(second)
+        if microsecond:
+            fields.append(microsecond)
+        text = ", ".join(map(str, fields))
+        if self._tzinfo is not None:
+            text += f", tzinfo={self._tzinfo!r}"
+        return f"GaianDateTime({text})"
+
+    def __str__(self) -> str:
+        d = self._date
+        formatter = _STR_FORMATS[self._time % _SECOND_US != 0, self._tzinfo is not None]
+        return formatter.format_datetime(d.year, d.month, d.day, *self._clock(), self.utcoffset())
+
+
+def _from_state(ordinal: int, micros: int, tzinfo: TZInfo | None,
+                cls: type = GaianDateTime) -> GaianDateTime:
+    """Unpickle a GaianDateTime from the state written by __reduce__."""
+    return cls._from_parts(GaianDate.fromordinal(ordinal), micros, tzinfo)
+
+
+# str() patterns by (has microseconds, is aware)
+_STR_FORMATS = {
+    (micro, aware): GaianFormatter(
+        "MMMM d, yyyy GE HH:mm:ss" + (".SSSSSS" if micro else "") + ("XXX" if aware else ""),
+        time=True,
+    )
+    for micro in (False, True)
+    for aware in (False, True)
+}
@@ -0,0 +1,133 @@
+"""GaianDelta — a duration in Gaian years, months and days."""
+from __future__ import annotations
+from operator import index
+from ._convert import add_months, add_years
+from .date import GaianDate
+
+
+class GaianDelta:
+    """
+    A calendar duration for ``+`` and ``-`` with GaianDate and GaianDateTime.
+
+    Unlike a timedelta, months and years follow the calendar: adding
+    ``GaianDelta(months=1)`` keeps the day of month. The parts are applied
+    in order, years, then months, then days (weeks count as 7 days), each
+    computed on the (year, month, day) integers:
+
+    * Months count Horus as a month in leap years. Landing on Horus
+      clamps a day above 7 to Horus 7.
+    * A Horus date moved by years into a year without Horus becomes
+      Ophiuchus 28, the last day of that year.
+
+    Because of the clamping, ``d + delta - delta`` is not always ``d``.
+    """
+
+    __slots__ = ("_years", "_months", "_days")
+
+    def __init__(self, years: int = 0, months: int = 0, weeks: int = 0, days: int = 0) -> None:
+        self._years = index(years)
+        self._months = index(months)
+        self._days = index(weeks) * 7 + index(days)
+
+    @classmethod
+    def _make(cls, years: int, months: int, days: int) -> GaianDelta:
+        self = object.__new__(cls)
+        self._years = years
+        self._months = months
+        self._days = days
+        return self
+
+    # ------------------------------------------------------------------
+    # Properties
+    # ------------------------------------------------------------------
+
+    @property
+    def years(self) -> int:
+        return self._years
+
+    @property
+    def months(self) -> int:
+        return self._months
+
+    @property
+    def days(self) -> int:
+        """Days, including weeks."""
+        return self._days
+
+    # ------------------------------------------------------------------
+    # Applying to dates
+    # ------------------------------------------------------------------
+
+    def _apply(self, d: GaianDate) -> GaianDate:
+        year, month, day = d.year, d.month, d.day
+        if self._years:
+            year, month, day = add_years(year, month, day, self._years)
+        if self._months:
+            year, month, day = add_months(year, month, day, self._months)
+        if self._days:
+            return GaianDate.fromordinal(GaianDate._from_fields(year, month, day).toordinal() + self._days)
+        return GaianDate._from_fields(year, month, day)
+
+    def __radd__(self, other: object) -> GaianDate:
+        if isinstance(other, GaianDate):
+            return self._apply(other)
+        return NotImplemented
+
+    def __rsub__(self, other: object) -> GaianDate:
+        if isinstance(other, GaianDate):
+            return (-self)._apply(other)
+        return NotImplemented
+
+    # ------------------------------------------------------------------
+    # Delta arithmetic
+    # ------------------------------------------------------------------
+
+    def __add__(self, other: object) -> GaianDelta | GaianDate:
+        if isinstance(other, GaianDelta):
+            return GaianDelta._make(
+                self._years + other._years, self._months + other._months, self._days + other._days,
+            )
+        if isinstance(other, GaianDate):
+            return self._apply(other)
+        return NotImplemented
+
+    def __sub__(self, other: object) -> GaianDelta:
+        if isinstance(other, GaianDelta):
+            return self + -other
+        return NotImplemented
+
+    def __neg__(self) -> GaianDelta:
+        return GaianDelta._make(-self._years, -self._months, -self._days)
+
+    def __pos__(self) -> GaianDelta:
+        return self
+
+    def __mul__(self, other: object) -> GaianDelta:
+        if isinstance(other, int):
+            return GaianDelta._make(self._years * other, self._months * other, self._days * other)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __bool__(self) -> bool:
+        return bool(self._years or self._months or self._days)
+
+    # ------------------------------------------------------------------
+    # Comparison and representation
+    # ------------------------------------------------------------------
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, GaianDelta):
+            return (self._years, self._months, self._days) == (other._years, other._months, other._days)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self._years, self._months, self._days))
+
+    def __reduce__(self):
+        return (GaianDelta, (self._years, self._months, 0, self._days))
+
+    def __repr__(self) -> str:
+        parts = [f"{name}={value}" for name, value in
+                 (("years", self._years), ("months", self._months), ("days", self._days)) if value]
+        return f"GaianDelta({', '.join(parts)})"
@@ -1,19 +1,40 @@
 """GaianMonth — a month in the Gaian Calendar."""
 from __future__ import annotations
 import functools
-from ._data import get_month, get_month_by_name, MONTHS
+from ._data import MONTH_TABLE, MonthInfo, get_month_by_name
 
 
 @functools.total_ordering
 class GaianMonth:
-    """Represents one of the 13 or 14 Gaian months."""
+    """
+    Represents one of the 13 or 14 Gaian months.
 
-    __slots__ = ("_number",)
+    Instances are interned: GaianMonth(3) returns the same object every time
+    (GaianMonth(3) is GaianMonth.AQUARIUS), with its metadata stored on it.
+    """
 
-    def __init__(self, number: int) -> None:
+    __slots__ = ("_number", "_name", "_abbrev", "_symbol", "_element")
+
+    # The 14 interned instances indexed by number (index 0 unused), set below
+    _members: tuple = ()
+
+    def __new__(cls, number: int) -> GaianMonth:
         if not 1 <= number <= 14:
             raise ValueError(f"Month number must be 1–14, got {number}")
-        self._number = number
+        return cls._members[number]
+
+    @classmethod
+    def _create(cls, info: MonthInfo) -> GaianMonth:
+        self = object.__new__(cls)
+        self._number = info.number
+        self._name = info.name
+        self._abbrev = info.abbrev
+        self._symbol = info.symbol
+        self._element = info.element
+        return self
+
+    def __reduce__(self):
+        return (GaianMonth, (self._number,))
 
     # ------------------------------------------------------------------
     # Properties
@@ -25,20 +46,20 @@ class GaianMonth:
 
     @property
     def name(self) -> str:
-        return get_month(self._number)["name"]
+        return self._name
 
     @property
     def abbrev(self) -> str:
-        return get_month(self._number)["abbrev"]
+        return self._abbrev
 
     @property
     def symbol(self) -> str:
-        return get_month(self._number)["symbol"]
+        return self._symbol
 
     @property
     def element(self) -> str | None:
         """Elemental association. None for Horus (month 14)."""
-        return get_month(self._number)["element"]
+        return self._element
 
     @property
     def is_intercalary(self) -> bool:
@@ -98,6 +119,8 @@ class GaianMonth:
     HORUS       = None
 
 
+GaianMonth._members = (None,) + tuple(GaianMonth._create(info) for info in MONTH_TABLE[1:])
+
 GaianMonth.SAGITTARIUS = GaianMonth(1)
 GaianMonth.CAPRICORN   = GaianMonth(2)
 GaianMonth.AQUARIUS    = GaianMonth(3)
@@ -0,0 +1,707 @@
+"""
+GaianRule — RRULE-style recurrences over Gaian dates.
+
+Every Gaian year and every month starts on a Monday, so the days a rule
+selects inside a year depend only on whether the year has Horus. A rule
+compiles to one of two shapes:
+
+* a cycle of day offsets repeating every ``period`` days from an anchor
+  (daily and weekly rules without calendar filters), or
+* a table of day offsets per kind of unit, where units are years (kind:
+  leap or common) or months (kind: month number and leap), stepped by the
+  interval.
+
+Leap years repeat every 400 years, so the number of occurrences in the
+first ``j`` units comes from a prefix table over one 400-year cycle. That
+makes ``rule[n]``, ``after``, ``before`` and ``in`` O(log n), and lets two
+rules with the same shape be intersected or unioned by combining their
+offset tables. Other combinations fall back to a lazy GaianRuleSet.
+"""
+from __future__ import annotations
+import functools
+import heapq
+from bisect import bisect_left, bisect_right
+from math import gcd
+from operator import index
+from ._convert import (
+    _iso_year_start,
+    _year_info,
+    is_leap_year,
+    month_from_index,
+    month_index,
+    ordinal_to_gaian,
+)
+from .date import GaianDate
+
+_FREQS = ("daily", "weekly", "monthly", "yearly")
+
+# Ordinals of the first and last supported days (Sagittarius 1, 10001 and
+# the last day of 19999)
+_FIRST_ORDINAL = _iso_year_start(1)
+_LAST_ORDINAL = _iso_year_start(10_000) - 1
+_LAST_MONTH = month_index(19_999, 14 if is_leap_year(19_999) else 13)
+
+# Units repeat their kinds every 400 years: 400 years, or 400 * 13 + 71 months
+_CYCLE = {"year": 400, "month": 5271}
+
+
+# ---------------------------------------------------------------------------
+# Patterns
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=4096)
+def _year_pattern(leap: bool, months, days, weekdays, days_of_year) -> tuple[int, ...]:
+    """Sorted 0-based day-of-year offsets selected by the filters (None = any)."""
+    length = 371 if leap else 364
+    if days_of_year is not None:
+        days_of_year = {d - 1 if d > 0 else length + d for d in days_of_year}
+    offsets = []
+    for offset in range(length):
+        month, day = offset // 28 + 1, offset % 28 + 1
+        if months is not None and month not in months:
+            continue
+        if days is not None:
+            month_length = 7 if month == 14 else 28
+            if day not in days and day - month_length - 1 not in days:
+                continue
+        if weekdays is not None and (day - 1) % 7 + 1 not in weekdays:
+            continue
+        if days_of_year is not None and offset not in days_of_year:
+            continue
+        offsets.append(offset)
+    return tuple(offsets)
+
+
+@functools.lru_cache(maxsize=1024)
+def _weekly_pattern(period: int, shift: int, offsets: tuple[int, ...]) -> tuple:
+    """Day-of-year offsets, per year kind, of a cycle whose period divides 7."""
+    selected = set(offsets)
+    return tuple(
+        tuple(o for o in range(371 if leap else 364) if (o + shift) % period in selected)
+        for leap in (0, 1)
+    )
+
+
+def _month_offsets(year_offsets: tuple[tuple[int, ...], tuple[int, ...]]) -> tuple:
+    """Split per-year-kind offsets into per-month-kind offsets (kind = month * 2 + leap)."""
+    kinds: list[tuple[int, ...]] = [()] * 30
+    for leap, offsets in enumerate(year_offsets):
+        for month in range(1, 15 if leap else 14):
+            base = (month - 1) * 28
+            kinds[month * 2 + leap] = tuple(o - base for o in offsets if base <= o < base + 28)
+    return tuple(kinds)
+
+
+@functools.lru_cache(maxsize=None)
+def _kinds(unit: str) -> tuple[int, ...]:
+    """Kind of each unit index over one 400-year cycle."""
+    if unit == "year":
+        return tuple(int(is_leap_year(10_001 + v)) for v in range(400))
+    return tuple(
+        month * 2 + int(is_leap_year(year))
+        for year, month in map(month_from_index, range(5271))
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _prefix(unit: str, step: int, residue: int, counts: tuple[int, ...]) -> tuple[int, ...]:
+    """
+    Occurrences in the first j units of the progression residue, residue +
+    step, … for j = 0 … L, where L is the number of steps after which the
+    kinds repeat.
+    """
+    kinds = _kinds(unit)
+    size = len(kinds)
+    total, prefix = 0, [0]
+    for j in range(size // gcd(step, size)):
+        total += counts[kinds[(residue + step * j) % size]]
+        prefix.append(total)
+    return tuple(prefix)
+
+
+# ---------------------------------------------------------------------------
+# Engines: map occurrence numbers to ordinals and back
+# ---------------------------------------------------------------------------
+
+class _Cycle:
+    """Occurrences ``anchor + q * period + offset`` for every q ≥ 0."""
+
+    __slots__ = ("anchor", "period", "offsets")
+
+    def __init__(self, anchor: int, period: int, offsets: tuple[int, ...]) -> None:
+        self.anchor = anchor
+        self.period = period
+        self.offsets = offsets
+
+    def rank(self, ordinal: int) -> int:
+        """Number of occurrences before ``ordinal``."""
+        if not self.offsets:
+            return 0
+        q, rest = divmod(ordinal - self.anchor, self.period)
+        return max(0, q * len(self.offsets) + bisect_left(self.offsets, rest))
+
+    def rank_end(self) -> int:
+        return self.rank(_LAST_ORDINAL + 1)
+
+    def nth(self, n: int) -> int:
+        q, i = divmod(n, len(self.offsets))
+        return self.anchor + q * self.period + self.offsets[i]
+
+    def ordinals(self, n: int):
+        q, i = divmod(n, len(self.offsets))
+        start, offsets, period = self.anchor + q * self.period, self.offsets, self.period
+        while True:
+            for offset in offsets[i:]:
+                yield start + offset
+            start += period
+            i = 0
+
+    def key(self) -> tuple:
+        return ("cycle", self.anchor, self.period)
+
+    def with_offsets(self, offsets: tuple[int, ...]) -> _Cycle:
+        return _Cycle(self.anchor, self.period, offsets)
+
+    def as_units(self, unit: str, first: int, step: int) -> _Units | None:
+        """The same days as a unit table, if the period divides a week."""
+        if 7 % self.period:
+            return None
+        # Years and months start on Mondays, so the cycle's phase at each
+        # unit start is the same: that of ordinal 1, a Monday
+        by_year = _weekly_pattern(self.period, (1 - self.anchor) % self.period, self.offsets)
+        offsets = by_year if unit == "year" else _month_offsets(by_year)
+        return _Units(unit, first, step, offsets)
+
+
+class _Units:
+    """
+    Occurrences at fixed day offsets inside the units first, first + step, …
+
+    Units are years (index = year - 10001) or months (index = month_index);
+    ``offsets[kind]`` are the 0-based day offsets used in a unit of that kind.
+    """
+
+    __slots__ = ("unit", "first", "step", "offsets", "_prefix")
+
+    def __init__(self, unit: str, first: int, step: int, offsets: tuple) -> None:
+        self.unit = unit
+        self.first = first
+        self.step = step
+        self.offsets = offsets
+        self._prefix = _prefix(unit, step, first % _CYCLE[unit], tuple(map(len, offsets)))
+
+    def _kind(self, u: int) -> int:
+        return _kinds(self.unit)[u % _CYCLE[self.unit]]
+
+    def _start(self, u: int) -> int:
+        if self.unit == "year":
+            return _year_info(10_001 + u)[1]
+        year, month = month_from_index(u)
+        return _year_info(year)[1] + (month - 1) * 28
+
+    def _unit_of(self, ordinal: int) -> int:
+        year, month, _ = ordinal_to_gaian(ordinal)
+        return year - 10_001 if self.unit == "year" else month_index(year, month)
+
+    def _count(self, j: int) -> int:
+        """Occurrences in the first j units."""
+        prefix = self._prefix
+        q, r = divmod(j, len(prefix) - 1)
+        return q * prefix[-1] + prefix[r]
+
+    def rank(self, ordinal: int) -> int:
+        """Number of occurrences before ``ordinal``."""
+        u = self._unit_of(ordinal)
+        if u < self.first:
+            return 0
+        j, misaligned = divmod(u - self.first, self.step)
+        if misaligned:
+            return self._count(j + 1)
+        return self._count(j) + bisect_left(self.offsets[self._kind(u)], ordinal - self._start(u))
+
+    def rank_end(self) -> int:
+        """Number of occurrences up to the end of year 19999."""
+        last = 9_998 if self.unit == "year" else _LAST_MONTH
+        return self._count((last - self.first) // self.step + 1) if last >= self.first else 0
+
+    def _locate(self, n: int) -> tuple[int, int]:
+        """(unit number j, position within the unit) of occurrence n."""
+        prefix = self._prefix
+        q, r = divmod(n, prefix[-1])
+        i = bisect_right(prefix, r) - 1
+        return q * (len(prefix) - 1) + i, r - prefix[i]
+
+    def nth(self, n: int) -> int:
+        j, pos = self._locate(n)
+        u = self.first + self.step * j
+        return self._start(u) + self.offsets[self._kind(u)][pos]
+
+    def ordinals(self, n: int):
+        j, pos = self._locate(n)
+        u = self.first + self.step * j
+        while True:
+            start = self._start(u)
+            for offset in self.offsets[self._kind(u)][pos:]:
+                yield start + offset
+            u += self.step
+            pos = 0
+
+    def key(self) -> tuple:
+        return (self.unit, self.first, self.step)
+
+    def with_offsets(self, offsets: tuple) -> _Units:
+        return _Units(self.unit, self.first, self.step, offsets)
+
+
+def _empty(engine) -> bool:
+    if isinstance(engine, _Cycle):
+        return not engine.offsets
+    return not engine._prefix[-1]
+
+
+# ---------------------------------------------------------------------------
+# Shared behaviour of rules and rule sets
+# ---------------------------------------------------------------------------
+
+class _Recurrence:
+    """Queries built on _ceil / _floor / _ordinals (ordinals in, ordinals out)."""
+
+    __slots__ = ()
+
+    def __iter__(self):
+        return map(GaianDate.fromordinal, self._ordinals(_FIRST_ORDINAL))
+
+    def after(self, d: GaianDate, inclusive: bool = False) -> GaianDate | None:
+        """The first occurrence after ``d`` (or on it, if inclusive), or None."""
+        ordinal = self._ceil(d.toordinal() + (0 if inclusive else 1))
+        return None if ordinal is None else GaianDate.fromordinal(ordinal)
+
+    def before(self, d: GaianDate, inclusive: bool = False) -> GaianDate | None:
+        """The last occurrence before ``d`` (or on it, if inclusive), or None."""
+        ordinal = self._floor(d.toordinal() - (0 if inclusive else 1))
+        return None if ordinal is None else GaianDate.fromordinal(ordinal)
+
+    def between(self, start: GaianDate, stop: GaianDate, inclusive: bool = True):
+        """Lazily yield the occurrences from ``start`` to ``stop``."""
+        lo, hi = start.toordinal(), stop.toordinal()
+        if not inclusive:
+            lo, hi = lo + 1, hi - 1
+        for ordinal in self._ordinals(lo):
+            if ordinal > hi:
+                return
+            yield GaianDate.fromordinal(ordinal)
+
+    def __contains__(self, d: object) -> bool:
+        if not isinstance(d, GaianDate):
+            return False
+        ordinal = d.toordinal()
+        return self._ceil(ordinal) == ordinal
+
+    def __and__(self, other: object):
+        if isinstance(other, _Recurrence):
+            return intersect(self, other)
+        return NotImplemented
+
+    def __or__(self, other: object):
+        if isinstance(other, _Recurrence):
+            return union(self, other)
+        return NotImplemented
+
+
+# ---------------------------------------------------------------------------
+# GaianRule
+# ---------------------------------------------------------------------------
+
+def _numbers(values, low: int, high: int, what: str, signed: bool = False) -> tuple | None:
+    """Normalize a filter to a sorted tuple of ints (None when not given)."""
+    if values is None:
+        return None
+    if isinstance(values, int) or hasattr(values, "number"):
+        values = (values,)
+    result = set()
+    for value in values:
+        n = index(getattr(value, "number", value))
+        if not (low <= n <= high or signed and -high <= n <= -low):
+            bounds = f"±{low}–{high}" if signed else f"{low}–{high}"
+            raise ValueError(f"{what} {n} out of range ({bounds})")
+        result.add(n)
+    return tuple(sorted(result))
+
+
+class GaianRule(_Recurrence):
+    """
+    A recurrence rule in the style of iCalendar RRULE.
+
+    ``freq`` is "daily", "weekly", "monthly" or "yearly", and ``interval``
+    counts those units between periods, starting from ``start``. Filters
+    narrow the days in each period:
+
+    * ``months``: month numbers 1–14 or GaianMonths (14 is Horus)
+    * ``days``: days of month 1–28; negative counts from the month's end,
+      so -1 is the 28th, or Horus 7
+    * ``weekdays``: 1 (Monday) – 7 (Sunday) or GaianWeekdays
+    * ``days_of_year``: 1–371; negative counts from the year's end
+    * ``leap``: True for leap years only, False for common years only
+
+    As in RRULE, a yearly rule with no filters repeats ``start``'s month and
+    day, a monthly rule ``start``'s day and a weekly rule its weekday. A
+    day that a month lacks (the 15th of Horus) is skipped, not clamped.
+    Occurrences begin at ``start`` and stop after ``count`` occurrences, at
+    ``until`` (inclusive) or at the end of year 19999.
+
+    Daily and weekly rules with an interval above 1 cannot combine it with
+    calendar filters (months, days, days_of_year, leap).
+
+    Rules are immutable sequences: ``len``, ``rule[n]``, ``after``,
+    ``before`` and ``in`` are O(log n), and iteration is lazy. ``&`` and
+    ``|`` combine rules; rules of the same shape (e.g. two with a daily,
+    weekly or yearly frequency and interval 1, and the same bounds) combine
+    into a single GaianRule.
+    """
+
+    __slots__ = ("_engine", "_lo", "_hi", "_first", "_stop", "_spec")
+
+    def __init__(
+        self,
+        freq: str,
+        start: GaianDate,
+        *,
+        interval: int = 1,
+        months=None,
+        days=None,
+        weekdays=None,
+        days_of_year=None,
+        leap: bool | None = None,
+        count: int | None = None,
+        until: GaianDate | None = None,
+    ) -> None:
+        if freq not in _FREQS:
+            raise ValueError(f"freq must be one of {_FREQS}, got {freq!r}")
+        interval = index(interval)
+        if interval < 1:
+            raise ValueError(f"interval must be at least 1, got {interval}")
+        if count is not None and index(count) < 0:
+            raise ValueError(f"count must not be negative, got {count}")
+        months = _numbers(months, 1, 14, "Month")
+        days = _numbers(days, 1, 28, "Day", signed=True)
+        weekdays = _numbers(weekdays, 1, 7, "Weekday")
+        days_of_year = _numbers(days_of_year, 1, 371, "Day of year", signed=True)
+
+        if freq == "yearly" and not (months or days or weekdays or days_of_year):
+            months, days = (start.month,), (start.day,)
+        elif freq == "monthly" and not (days or weekdays or days_of_year):
+            days = (start.day,)
+        elif freq == "weekly" and not weekdays:
+            weekdays = (start.day_of_week,)
+        calendar = months or days or days_of_year or leap is not None
+
+        ordinal = start.toordinal()
+        if freq in ("daily", "weekly") and not calendar:
+            if freq == "weekly":
+                anchor, period = ordinal - (start.day_of_week - 1), 7 * interval
+                offsets = tuple(w - 1 for w in weekdays)
+            else:
+                anchor = ordinal
+                period = interval * 7 // gcd(interval, 7) if weekdays else interval
+                offsets = tuple(
+                    x for x in range(0, period, interval)
+                    if weekdays is None or (anchor + x - 1) % 7 + 1 in weekdays
+                )
+            engine = _Cycle(anchor, period, offsets)
+        elif freq in ("daily", "weekly") and interval > 1:
+            raise ValueError(
+                f"A {freq} rule with an interval cannot filter by months, days, "
+                "days_of_year or leap"
+            )
+        else:
+            by_year = tuple(
+                () if leap is not None and leap != bool(kind)
+                else _year_pattern(bool(kind), months, days, weekdays, days_of_year)
+                for kind in (0, 1)
+            )
+            if freq == "monthly" and interval > 1:
+                engine = _Units("month", month_index(start.year, start.month), interval,
+                                _month_offsets(by_year))
+            elif freq == "yearly" and interval > 1:
+                engine = _Units("year", start.year - 10_001, interval, by_year)
+            else:
+                engine = _Units("year", 0, 1, by_year)
+
+        hi = _LAST_ORDINAL if until is None else min(until.toordinal(), _LAST_ORDINAL)
+        self._init(engine, ordinal, hi, count)
+        self._spec = (freq, start, interval, months, days, weekdays, days_of_year, leap,
+                      count, until)
+
+    def _init(self, engine, lo: int, hi: int, count: int | None = None) -> None:
+        self._engine = engine
+        if _empty(engine) or lo > hi:
+            self._first = self._stop = 0
+        else:
+            self._first = engine.rank(lo)
+            end = engine.rank_end() if hi == _LAST_ORDINAL else engine.rank(hi + 1)
+            self._stop = max(self._first, end)
+            if count is not None:
+                self._stop = min(self._stop, self._first + count)
+        # Narrow the bounds to the set, so _combine never revives days that
+        # count cut off
+        if self._stop == self._first:
+            hi = lo - 1
+        elif count is not None:
+            hi = engine.nth(self._stop - 1)
+        self._lo, self._hi = lo, hi
+
+    def _describe(self) -> str:
+        spec = self._spec
+        return spec if isinstance(spec, str) else _spec(*spec)
+
+    @classmethod
+    def _from_engine(cls, engine, lo: int, hi: int, spec: str) -> GaianRule:
+        self = object.__new__(cls)
+        self._init(engine, lo, hi)
+        self._spec = spec
+        return self
+
+    # ------------------------------------------------------------------
+    # Sequence protocol
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._stop - self._first
+
+    def __bool__(self) -> bool:
+        return self._stop > self._first
+
+    def __getitem__(self, n: int) -> GaianDate:
+        """The nth occurrence (negative counts from the end), in O(log n)."""
+        n = index(n)
+        size = self._stop - self._first
+        if n < 0:
+            n += size
+        if not 0 <= n < size:
+            raise IndexError("GaianRule index out of range")
+        return GaianDate.fromordinal(self._engine.nth(self._first + n))
+
+    def index(self, d: GaianDate) -> int:
+        """Return the position of ``d``; raise ValueError if it is not an occurrence."""
+        if d not in self:
+            raise ValueError(f"{d!r} is not an occurrence")
+        return self._engine.rank(d.toordinal()) - self._first
+
+    def __reversed__(self):
+        engine = self._engine
+        return (GaianDate.fromordinal(engine.nth(n)) for n in range(self._stop - 1, self._first - 1, -1))
+
+    # ------------------------------------------------------------------
+    # Ordinal queries (used by _Recurrence)
+    # ------------------------------------------------------------------
+
+    def _ceil(self, ordinal: int) -> int | None:
+        if not self:
+            return None
+        n = max(self._engine.rank(ordinal), self._first)
+        return self._engine.nth(n) if n < self._stop else None
+
+    def _floor(self, ordinal: int) -> int | None:
+        if not self:
+            return None
+        n = min(self._engine.rank(ordinal + 1), self._stop) - 1
+        return self._engine.nth(n) if n >= self._first else None
+
+    def _ordinals(self, ordinal: int):
+        if not self:
+            return iter(())
+        n = max(self._engine.rank(ordinal), self._first)
+        remaining = self._stop - n
+        if remaining <= 0:
+            return iter(())
+        ordinals = self._engine.ordinals(n)
+        return (next(ordinals) for _ in range(remaining))
+
+    def __repr__(self) -> str:
+        return f"GaianRule({self._describe()})"
+
+
+def _spec(freq, start, interval, months, days, weekdays, days_of_year, leap, count, until) -> str:
+    parts = [repr(freq), repr(start)]
+    for name, value, default in (
+        ("interval", interval, 1), ("months", months, None), ("days", days, None),
+        ("weekdays", weekdays, None), ("days_of_year", days_of_year, None),
+        ("leap", leap, None), ("count", count, None), ("until", until, None),
+    ):
+        if value != default:
+            parts.append(f"{name}={value!r}")
+    return ", ".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Combining rules
+# ---------------------------------------------------------------------------
+
+def _aligned(a, b, op: str) -> tuple | None:
+    """The two engines in a common shape, or None if they have none."""
+    if a.key() == b.key():
+        return a, b
+    if isinstance(a, _Cycle) and isinstance(b, _Cycle):
+        period = a.period * b.period // gcd(a.period, b.period)
+        if period > 146_097:  # a 400-year cycle; beyond that, iterate instead
+            return None
+        anchor = min(a.anchor, b.anchor)
+        return _Cycle(anchor, period, _residues(a, anchor, period)), \
+            _Cycle(anchor, period, _residues(b, anchor, period))
+    if isinstance(b, _Cycle):
+        a, b = b, a
+        swapped = True
+    else:
+        swapped = False
+    # A cycle restricted to stepped units only keeps its days in those
+    # units: right for an intersection, too little for a union
+    if not isinstance(a, _Cycle) or op == "union" and b.step != 1:
+        return None
+    a = a.as_units(b.unit, b.first, b.step)
+    if a is None:
+        return None
+    return (b, a) if swapped else (a, b)
+
+
+def _residues(cycle: _Cycle, anchor: int, period: int) -> tuple[int, ...]:
+    """The offsets of ``cycle`` re-expressed against another anchor and period."""
+    shift = cycle.anchor - anchor
+    return tuple(sorted(
+        (shift + q * cycle.period + offset) % period
+        for q in range(period // cycle.period)
+        for offset in cycle.offsets
+    ))
+
+
+def _combine(a: GaianRule, b: GaianRule, op: str) -> GaianRule | None:
+    """Combine two rules into one GaianRule when their shapes allow it."""
+    if op == "union" and (a._lo, a._hi) != (b._lo, b._hi):
+        return None
+    engines = _aligned(a._engine, b._engine, op)
+    if engines is None:
+        return None
+    x, y = engines
+    merge = (lambda p, q: tuple(sorted(set(p) & set(q)))) if op == "intersection" else \
+        (lambda p, q: tuple(sorted(set(p) | set(q))))
+    if isinstance(x, _Cycle):
+        engine = x.with_offsets(merge(x.offsets, y.offsets))
+    else:
+        engine = x.with_offsets(tuple(map(merge, x.offsets, y.offsets)))
+    symbol = " & " if op == "intersection" else " | "
+    return GaianRule._from_engine(engine, max(a._lo, b._lo), min(a._hi, b._hi),
+                                  f"({a._describe()}){symbol}({b._describe()})")
+
+
+def intersect(*rules: _Recurrence) -> _Recurrence:
+    """The dates in every rule: a GaianRule when the shapes allow, else a GaianRuleSet."""
+    return _reduce(rules, "intersection")
+
+
+def union(*rules: _Recurrence) -> _Recurrence:
+    """The dates in any rule: a GaianRule when the shapes allow, else a GaianRuleSet."""
+    return _reduce(rules, "union")
+
+
+def _reduce(rules, op: str) -> _Recurrence:
+    if not rules:
+        raise TypeError(f"{op} needs at least one rule")
+    pending: list[_Recurrence] = []
+    for rule in rules:
+        if isinstance(rule, GaianRuleSet) and rule._op == op:
+            pending.extend(rule._rules)
+        else:
+            pending.append(rule)
+    # Fold rules of the same shape together; keep the rest for the rule set
+    merged: list[_Recurrence] = []
+    for rule in pending:
+        if isinstance(rule, GaianRule):
+            for i, other in enumerate(merged):
+                if isinstance(other, GaianRule):
+                    combined = _combine(other, rule, op)
+                    if combined is not None:
+                        merged[i] = combined
+                        break
+            else:
+                merged.append(rule)
+        else:
+            merged.append(rule)
+    return merged[0] if len(merged) == 1 else GaianRuleSet(op, merged)
+
+
+class GaianRuleSet(_Recurrence):
+    """
+    The union or intersection of rules that do not share a shape.
+
+    Iteration and after / before stay lazy: a union merges its rules'
+    occurrences, and an intersection leapfrogs between them, each rule
+    jumping straight to its next candidate with an O(log n) query.
+    """
+
+    __slots__ = ("_op", "_rules")
+
+    def __init__(self, op: str, rules) -> None:
+        if op not in ("union", "intersection"):
+            raise ValueError(f"op must be 'union' or 'intersection', got {op!r}")
+        self._op = op
+        self._rules = tuple(rules)
+
+    @property
+    def rules(self) -> tuple:
+        return self._rules
+
+    def _ceil(self, ordinal: int) -> int | None:
+        if self._op == "union":
+            found = [o for o in (r._ceil(ordinal) for r in self._rules) if o is not None]
+            return min(found, default=None)
+        while True:
+            for rule in self._rules:
+                found = rule._ceil(ordinal)
+                if found is None:
+                    return None
+                if found != ordinal:
+                    ordinal = found
+                    break
+            else:
+                return ordinal
+
+    def _floor(self, ordinal: int) -> int | None:
+        if self._op == "union":
+            found = [o for o in (r._floor(ordinal) for r in self._rules) if o is not None]
+            return max(found, default=None)
+        while True:
+            for rule in self._rules:
+                found = rule._floor(ordinal)
+                if found is None:
+                    return None
+                if found != ordinal:
+                    ordinal = found
+                    break
+            else:
+                return ordinal
+
+    def _ordinals(self, ordinal: int):
+        if self._op == "union":
+            last = None
+            for found in heapq.merge(*(r._ordinals(ordinal) for r in self._rules)):
+                if found != last:
+                    yield found
+                    last = found
+            return
+        while True:
+            found = self._ceil(ordinal)
+            if found is None:
+                return
+            yield found
+            ordinal = found + 1
+
+    def __getitem__(self, n: int) -> GaianDate:
+        """The nth occurrence, found by iterating (O(n))."""
+        n = index(n)
+        if n >= 0:
+            for i, d in enumerate(self):
+                if i == n:
+                    return d
+        raise IndexError("GaianRuleSet index out of range")
+
+    def __repr__(self) -> str:
+        return f"GaianRuleSet({self._op!r}, {list(self._rules)!r})"
@@ -1,19 +1,39 @@
 """GaianWeekday — a weekday in the Gaian Calendar."""
 from __future__ import annotations
 import functools
-from ._data import get_weekday, WEEKDAYS
+from ._data import WEEKDAY_TABLE, WeekdayInfo
 
 
 @functools.total_ordering
 class GaianWeekday:
-    """Represents one of the 7 Gaian weekdays (1=Monday … 7=Sunday)."""
+    """
+    Represents one of the 7 Gaian weekdays (1=Monday … 7=Sunday).
 
-    __slots__ = ("_number",)
+    Instances are interned: GaianWeekday(1) is GaianWeekday.MONDAY.
+    """
 
-    def __init__(self, number: int) -> None:
+    __slots__ = ("_number", "_name", "_abbrev", "_symbol", "_planet")
+
+    # The 7 interned instances indexed by number (index 0 unused), set below
+    _members: tuple = ()
+
+    def __new__(cls, number: int) -> GaianWeekday:
         if not 1 <= number <= 7:
             raise ValueError(f"Weekday number must be 1–7, got {number}")
-        self._number = number
+        return cls._members[number]
+
+    @classmethod
+    def _create(cls, info: WeekdayInfo) -> GaianWeekday:
+        self = object.__new__(cls)
+        self._number = info.number
+        self._name = info.name
+        self._abbrev = info.abbrev
+        self._symbol = info.symbol
+        self._planet = info.planet
+        return self
+
+    def __reduce__(self):
+        return (GaianWeekday, (self._number,))
 
     # ------------------------------------------------------------------
     # Properties
@@ -25,19 +45,19 @@ class GaianWeekday:
 
     @property
     def name(self) -> str:
-        return get_weekday(self._number)["name"]
+        return self._name
 
     @property
     def abbrev(self) -> str:
-        return get_weekday(self._number)["abbrev"]
+        return self._abbrev
 
     @property
     def symbol(self) -> str:
-        return get_weekday(self._number)["symbol"]
+        return self._symbol
 
     @property
     def planet(self) -> str:
-        return get_weekday(self._number)["planet"]
+        return self._planet
 
     @property
     def is_sabbath(self) -> bool:
@@ -80,6 +100,8 @@ class GaianWeekday:
     SUNDAY    = None
 
 
+GaianWeekday._members = (None,) + tuple(GaianWeekday._create(info) for info in WEEKDAY_TABLE[1:])
+
 # Attach constants after class definition
 GaianWeekday.MONDAY    = GaianWeekday(1)
 GaianWeekday.TUESDAY   = GaianWeekday(2)
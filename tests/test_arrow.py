@@ -0,0 +1,105 @@
+"""Tests for the Arrow conversions in _arrow.py."""
+import pytest
+from datetime import date, datetime, timedelta, timezone
+
+pa = pytest.importorskip("pyarrow")
+
+from gaian_calendar import (
+    GaianDate,
+    gaian_to_gregorian_arrow,
+    gaian_to_gregorian_batches,
+    gregorian_to_gaian_arrow,
+    gregorian_to_gaian_batches,
+)
+
+DAYS = [date(2026, 3, 9), date(2026, 12, 31), date(2025, 12, 29)]
+
+
+def _expected(days):
+    fields = [None if d is None else GaianDate.from_gregorian(d) for d in days]
+    return (
+        [None if g is None else g.year for g in fields],
+        [None if g is None else g.month for g in fields],
+        [None if g is None else g.day for g in fields],
+    )
+
+
+class TestGregorianToGaian:
+    def test_date32(self):
+        year, month, day = gregorian_to_gaian_arrow(pa.array(DAYS, type=pa.date32()))
+        assert year.type == pa.int32()
+        assert (year.to_pylist(), month.to_pylist(), day.to_pylist()) == _expected(DAYS)
+
+    def test_matches_scalar_over_many_days(self):
+        days = [date(1999, 12, 1) + timedelta(n) for n in range(2_000)]
+        fields = gregorian_to_gaian_arrow(pa.array(days, type=pa.date32()))
+        assert tuple(f.to_pylist() for f in fields) == _expected(days)
+
+    def test_nulls_stay_null(self):
+        days = [DAYS[0], None, DAYS[1]]
+        fields = gregorian_to_gaian_arrow(pa.array(days, type=pa.date32()))
+        assert tuple(f.to_pylist() for f in fields) == _expected(days)
+
+    def test_date64_and_chunked(self):
+        chunked = pa.chunked_array([pa.array(DAYS[:1], type=pa.date64()), pa.array(DAYS[1:], type=pa.date64())])
+        fields = gregorian_to_gaian_arrow(chunked)
+        assert tuple(f.to_pylist() for f in fields) == _expected(DAYS)
+
+    def test_timestamp_floors_and_local_date(self):
+        naive = pa.array([datetime(2026, 3, 9, 23, 59), datetime(1969, 12, 31, 12)], type=pa.timestamp("ns"))
+        assert gregorian_to_gaian_arrow(naive)[2].to_pylist() == _expected([date(2026, 3, 9), date(1969, 12, 31)])[2]
+        utc = datetime(2026, 3, 8, 20, tzinfo=timezone.utc)
+        tokyo = pa.array([utc], type=pa.timestamp("us", tz="Asia/Tokyo"))
+        assert gregorian_to_gaian_arrow(tokyo)[2].to_pylist() == [15]
+
+    def test_rejects_other_types(self):
+        with pytest.raises(TypeError):
+            gregorian_to_gaian_arrow(pa.array([1, 2]))
+
+    def test_out_of_range(self):
+        with pytest.raises(ValueError):
+            # One day before date.min: ordinal 0
+            gregorian_to_gaian_arrow(pa.array([-719_163], type=pa.int32()).cast(pa.date32()))
+
+
+class TestGaianToGregorian:
+    def test_round_trip(self):
+        days = [date(1999, 12, 1) + timedelta(n) for n in range(1_000)] + [None]
+        result = gaian_to_gregorian_arrow(*gregorian_to_gaian_arrow(pa.array(days, type=pa.date32())))
+        assert result.type == pa.date32()
+        assert result.to_pylist() == days
+
+    def test_null_in_any_column(self):
+        result = gaian_to_gregorian_arrow(pa.array([12026, 12026]), pa.array([3, None]), pa.array([15, 1]))
+        assert result.to_pylist() == [date(2026, 3, 9), None]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="indices \\[0\\]"):
+            gaian_to_gregorian_arrow(pa.array([12025]), pa.array([14]), pa.array([1]))
+
+
+class TestBatches:
+    def test_streams_both_ways(self):
+        table = pa.table({"id": [1, 2, 3], "day": pa.array(DAYS, type=pa.date32())})
+        reader = pa.RecordBatchReader.from_batches(table.schema, table.to_batches(max_chunksize=2))
+        batches = list(gregorian_to_gaian_batches(reader, "day"))
+        assert len(batches) == 2
+        assert batches[0].schema.names == ["id", "day", "gaian_year", "gaian_month", "gaian_day"]
+        result = pa.Table.from_batches(batches)
+        assert result.column("gaian_month").to_pylist() == [3, 14, 1]
+
+        back = pa.Table.from_batches(list(gaian_to_gregorian_batches(result, name="check")))
+        assert back.column("check").to_pylist() == DAYS
+
+    def test_custom_names(self):
+        table = pa.table({"day": pa.array(DAYS, type=pa.date32())})
+        (batch,) = gregorian_to_gaian_batches(table, "day", names=("y", "m", "d"))
+        assert batch.schema.names == ["day", "y", "m", "d"]
+
+    def test_lazy(self):
+        def batches():
+            yield pa.record_batch({"day": pa.array(DAYS, type=pa.date32())})
+            raise AssertionError("read past the first batch")
+
+        stream = gregorian_to_gaian_batches(batches(), "day")
+        assert next(stream).num_rows == 3
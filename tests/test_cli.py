@@ -0,0 +1,90 @@
+"""Tests for the command-line converter in _cli.py."""
+import subprocess
+import sys
+from datetime import date, timedelta
+from gaian_calendar import GaianDate
+from gaian_calendar._cli import main
+
+
+def _run(tmp_path, text, *args):
+    source = tmp_path / "in.txt"
+    target = tmp_path / "out.txt"
+    source.write_text(text, encoding="utf-8")
+    code = main([*args, "-i", str(source), "-o", str(target)])
+    return code, target.read_text(encoding="utf-8") if target.exists() else None
+
+
+class TestFormat:
+    def test_lines(self, tmp_path):
+        code, out = _run(tmp_path, "2026-03-09\n2026-12-31\n2025-12-29", "format")
+        assert code == 0
+        assert out == "12026-03-15\n12026-14-04\n12026-01-01\n"
+
+    def test_pattern_and_times(self, tmp_path):
+        code, out = _run(tmp_path, "2026-03-09T23:59:00\n", "format", "-p", "WWWW, MMMM d, yyyy GE")
+        assert out == "Monday, Aquarius 15, 12026 GE\n"
+
+    def test_csv_column_by_name(self, tmp_path):
+        text = 'id,day,note\n1,2026-03-09,"a, b"\n2,2026-12-31,c\n'
+        code, out = _run(tmp_path, text, "format", "-c", "day", "--header")
+        assert out == 'id,day,note\n1,12026-03-15,"a, b"\n2,12026-14-04,c\n'
+
+    def test_csv_column_by_index_and_delimiter(self, tmp_path):
+        code, out = _run(tmp_path, "x;2026-03-09\n", "format", "-c", "1", "-d", ";")
+        assert out == "x;12026-03-15\n"
+
+
+class TestParse:
+    def test_any_shape(self, tmp_path):
+        code, out = _run(tmp_path, "Aquarius 15, 12026 GE\n12026-14-04\n3/15/12026\n", "parse")
+        assert out == "2026-03-09\n2026-12-31\n2026-03-09\n"
+
+    def test_strict_pattern(self, tmp_path):
+        code, out = _run(tmp_path, "12026/071\n", "parse", "-p", "yyyy/DDD")
+        assert out == "2026-03-09\n"
+
+    def test_round_trip(self, tmp_path):
+        days = [date(2020, 1, 1) + timedelta(n) for n in range(400)]
+        text = "".join(f"{d.isoformat()}\n" for d in days)
+        _, gaian = _run(tmp_path, text, "format", "-p", "MMMM d, yyyy GE")
+        _, back = _run(tmp_path, gaian, "parse")
+        assert back == text
+
+
+class TestErrors:
+    def test_raise_reports_line(self, tmp_path, capsys):
+        code, _ = _run(tmp_path, "2026-03-09\nnope\n", "format")
+        assert code == 1
+        assert "line 2" in capsys.readouterr().err
+
+    def test_coerce_writes_empty(self, tmp_path):
+        code, out = _run(tmp_path, "nope\n12026-03-15\n", "parse", "--errors", "coerce")
+        assert code == 0
+        assert out == "\n2026-03-09\n"
+
+    def test_missing_column(self, tmp_path, capsys):
+        code, _ = _run(tmp_path, "a,b\n1,2\n", "format", "-c", "when", "--header")
+        assert code == 1
+        assert "when" in capsys.readouterr().err
+
+    def test_bad_jobs(self, tmp_path):
+        assert _run(tmp_path, "", "format", "-j", "0")[0] == 2
+
+
+class TestJobs:
+    def test_parallel_matches_serial_and_keeps_order(self, tmp_path):
+        days = [date(2000, 1, 1) + timedelta(n * 7) for n in range(500)]
+        text = "".join(f"{d.isoformat()}\n" for d in days)
+        _, serial = _run(tmp_path, text, "format")
+        _, parallel = _run(tmp_path, text, "format", "-j", "2", "--chunk-lines", "37")
+        assert parallel == serial
+        assert serial.splitlines()[-1] == GaianDate.from_gregorian(days[-1]).format("yyyy-MM-dd")
+
+
+class TestModule:
+    def test_python_dash_m_streams_stdin(self):
+        result = subprocess.run(
+            [sys.executable, "-m", "gaian_calendar", "format"],
+            input="2026-03-09\n", capture_output=True, text=True, check=True,
+        )
+        assert result.stdout == "12026-03-15\n"
@@ -0,0 +1,82 @@
+"""Tests for the packed binary encoding in _codec.py and GaianDate pickling."""
+import pytest
+import copy
+import pickle
+from array import array
+from gaian_calendar import GaianDate, pack_many, unpack_many
+from gaian_calendar._codec import _TYPECODE
+
+DATES = [GaianDate(10001, 1, 1), GaianDate(12026, 3, 15), GaianDate(12026, 14, 7), GaianDate(19999, 13, 28)]
+
+
+class MyDate(GaianDate):
+    __slots__ = ()
+
+
+class TestToBytes:
+    def test_round_trip(self):
+        for d in DATES:
+            data = d.to_bytes()
+            assert len(data) == 4
+            assert GaianDate.from_bytes(data) == d
+
+    def test_little_endian_ordinal(self):
+        d = GaianDate(12026, 3, 15)
+        assert d.to_bytes() == d.toordinal().to_bytes(4, "little")
+
+    def test_wrong_length(self):
+        with pytest.raises(ValueError):
+            GaianDate.from_bytes(b"\x00\x01\x02")
+
+    def test_out_of_range(self):
+        with pytest.raises(ValueError):
+            GaianDate.from_bytes(b"\x00\x00\x00\x00")
+
+
+class TestPackMany:
+    def test_array_round_trip(self):
+        packed = pack_many(DATES)
+        assert isinstance(packed, array) and packed.typecode == _TYPECODE and packed.itemsize == 4
+        assert unpack_many(packed) == DATES
+
+    def test_bytes_round_trip(self):
+        data = pack_many(DATES).tobytes()
+        assert len(data) == 4 * len(DATES)
+        assert data == b"".join(d.to_bytes() for d in DATES)
+        assert unpack_many(data) == DATES
+        assert unpack_many(bytearray(data)) == DATES
+        assert unpack_many(memoryview(data)) == DATES
+
+    def test_empty(self):
+        assert unpack_many(pack_many([])) == []
+
+    def test_bad_length(self):
+        with pytest.raises(ValueError):
+            unpack_many(b"\x00" * 6)
+
+    def test_bad_typecode(self):
+        with pytest.raises(ValueError):
+            unpack_many(array("H", [1, 2]))
+
+
+class TestPickle:
+    def test_round_trip(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            assert pickle.loads(pickle.dumps(DATES, protocol)) == DATES
+
+    def test_restores_fields(self):
+        d = pickle.loads(pickle.dumps(GaianDate(12026, 14, 7)))
+        assert (d.year, d.month, d.day) == (12026, 14, 7)
+
+    def test_compact(self):
+        # Each date costs about its ordinal, not a dict of four slot values
+        dates = [GaianDate.fromordinal(o) for o in range(740_000, 741_000)]
+        assert len(pickle.dumps(dates)) < 12 * len(dates)
+
+    def test_subclass(self):
+        d = pickle.loads(pickle.dumps(MyDate(12026, 3, 15)))
+        assert type(d) is MyDate and d == GaianDate(12026, 3, 15)
+
+    def test_copy(self):
+        d = GaianDate(12026, 3, 15)
+        assert copy.copy(d) == d and copy.deepcopy(d) == d
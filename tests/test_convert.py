@@ -1,12 +1,19 @@
 """Tests for core calendar arithmetic in _convert.py."""
 import pytest
-from datetime import date
+from datetime import date, timedelta
 from gaian_calendar._convert import (
+    add_months,
+    add_years,
     gregorian_to_gaian,
     gaian_to_gregorian,
     is_leap_year,
+    year_length,
+    months_in_year,
+    month_index,
+    month_from_index,
     day_of_year,
     day_of_week,
+    timestamp_days,
     validate_date,
 )
 
@@ -32,6 +39,58 @@ class TestLeapYear:
         assert is_leap_year(12032) is True
 
 
+# ---------------------------------------------------------------------------
+# Year table
+# ---------------------------------------------------------------------------
+
+class TestYearTable:
+    def test_leap_matches_isocalendar_for_supported_range(self):
+        for year in range(10_001, 20_000):
+            expected = date(year - 10_000, 12, 28).isocalendar()[1] == 53
+            assert is_leap_year(year) is expected, f"Failed at {year}"
+
+    def test_year_length_leap(self):
+        assert year_length(12026) == 371
+
+    def test_year_length_regular(self):
+        assert year_length(12025) == 364
+
+    def test_year_start_ordinal(self):
+        from gaian_calendar._convert import _year_info
+        for year in (10_001, 12025, 12026, 19_999):
+            start = date.fromisocalendar(year - 10_000, 1, 1).toordinal()
+            assert _year_info(year)[1] == start
+
+
+# ---------------------------------------------------------------------------
+# Absolute month numbering
+# ---------------------------------------------------------------------------
+
+class TestMonthIndex:
+    def test_first_month(self):
+        assert month_index(10_001, 1) == 0
+
+    def test_months_in_year(self):
+        assert months_in_year(12026) == 14
+        assert months_in_year(12025) == 13
+
+    def test_consecutive_across_horus(self):
+        assert month_index(12027, 1) - month_index(12026, 13) == 2
+        assert month_index(12026, 1) - month_index(12025, 13) == 1
+
+    def test_roundtrip_every_month_over_800_years(self):
+        index = month_index(12000, 1)
+        for year in range(12000, 12800):
+            for month in range(1, months_in_year(year) + 1):
+                assert month_index(year, month) == index
+                assert month_from_index(index) == (year, month)
+                index += 1
+
+    def test_last_supported_month(self):
+        last = month_index(19_999, months_in_year(19_999))
+        assert month_from_index(last) == (19_999, months_in_year(19_999))
+
+
 # ---------------------------------------------------------------------------
 # Gregorian → Gaian
 # ---------------------------------------------------------------------------
@@ -86,6 +145,27 @@ class TestGaianToGregorian:
     def test_horus_1_12026(self):
         assert gaian_to_gregorian(12026, 14, 1) == date(2026, 12, 28)
 
+    def test_horus_in_non_leap_raises(self):
+        with pytest.raises(ValueError, match="leap"):
+            gaian_to_gregorian(12025, 14, 1)
+
+    @pytest.mark.parametrize("fields", [
+        (12026, 0, 1), (12026, 15, 1), (12025, 13, 29), (12026, 1, 0), (12026, 14, 8), (20000, 1, 1),
+    ])
+    def test_invalid_fields_raise(self, fields):
+        with pytest.raises(ValueError):
+            gaian_to_gregorian(*fields)
+
+    def test_matches_isocalendar_across_years(self):
+        d = date(2019, 12, 20)
+        for _ in range(800):
+            iso_year, iso_week, iso_weekday = d.isocalendar()
+            expected = (iso_year + 10_000, (iso_week - 1) // 4 + 1,
+                        (iso_week - 1) % 4 * 7 + iso_weekday)
+            assert gregorian_to_gaian(d) == expected, f"Failed at {d}"
+            assert gaian_to_gregorian(*expected) == d
+            d += timedelta(days=3)
+
     def test_roundtrip_all_days_in_year(self):
         for doy in range(1, 365):
             month = (doy - 1) // 28 + 1
@@ -143,6 +223,80 @@ class TestDayOfWeek:
         assert day_of_week(28) == 7
 
 
+# ---------------------------------------------------------------------------
+# Month and year arithmetic
+# ---------------------------------------------------------------------------
+
+class TestAddMonths:
+    def test_within_year(self):
+        assert add_months(12026, 3, 15, 2) == (12026, 5, 15)
+        assert add_months(12026, 3, 15, -2) == (12026, 1, 15)
+
+    def test_horus_counts_in_leap_years(self):
+        assert add_months(12026, 13, 20, 1) == (12026, 14, 7)    # clamped
+        assert add_months(12026, 13, 5, 1) == (12026, 14, 5)
+        assert add_months(12026, 13, 20, 2) == (12027, 1, 20)
+        assert add_months(12025, 13, 20, 1) == (12026, 1, 20)    # no Horus in 12025
+        assert add_months(12026, 14, 3, -1) == (12026, 13, 3)
+
+    def test_matches_month_index(self):
+        for months in (-5271, -400, -14, -1, 0, 1, 13, 14, 99, 5271):
+            year, month, day = add_months(12026, 3, 15, months)
+            assert month_index(year, month) == month_index(12026, 3) + months
+            assert day == (7 if month == 14 else 15)
+
+    def test_out_of_range(self):
+        with pytest.raises(ValueError):
+            add_months(19_999, 13, 1, 2)
+        with pytest.raises(ValueError):
+            add_months(10_001, 1, 1, -1)
+
+
+class TestAddYears:
+    def test_keeps_month_and_day(self):
+        assert add_years(12026, 3, 15, 10) == (12036, 3, 15)
+        assert add_years(12026, 14, 7, 6) == (12032, 14, 7)      # 12032 is leap
+
+    def test_horus_into_common_year(self):
+        assert add_years(12026, 14, 3, 1) == (12027, 13, 28)
+
+    def test_out_of_range(self):
+        with pytest.raises(ValueError):
+            add_years(19_999, 1, 1, 1)
+
+
+# ---------------------------------------------------------------------------
+# Unix timestamps
+# ---------------------------------------------------------------------------
+
+# 2026-03-09T00:00:00Z
+MIDNIGHT = 1_773_014_400
+
+
+class TestTimestampDays:
+    def test_matches_date(self):
+        assert timestamp_days(MIDNIGHT) == (date(2026, 3, 9) - date(1970, 1, 1)).days
+
+    def test_floors_before_epoch_and_midnight(self):
+        assert timestamp_days(-1) == -1
+        assert timestamp_days(MIDNIGHT - 0.5) == timestamp_days(MIDNIGHT) - 1
+
+    @pytest.mark.parametrize("unit, scale", [("s", 1), ("ms", 10**3), ("us", 10**6), ("ns", 10**9)])
+    def test_units(self, unit, scale):
+        assert timestamp_days(MIDNIGHT * scale, unit=unit) == timestamp_days(MIDNIGHT)
+        assert timestamp_days(MIDNIGHT * scale - 1, unit=unit) == timestamp_days(MIDNIGHT) - 1
+
+    def test_offsets(self):
+        day = timestamp_days(MIDNIGHT)
+        assert timestamp_days(MIDNIGHT, tz_offset=-1) == day - 1
+        assert timestamp_days(MIDNIGHT - 3600, tz_offset=timedelta(hours=1)) == day
+        assert timestamp_days(MIDNIGHT * 10**9, timedelta(minutes=-30), "ns") == day - 1
+
+    def test_unknown_unit(self):
+        with pytest.raises(ValueError, match="unit"):
+            timestamp_days(0, unit="h")
+
+
 # ---------------------------------------------------------------------------
 # Validation
 # ---------------------------------------------------------------------------
@@ -37,6 +37,76 @@ class TestFromGregorian:
         assert gaian.to_gregorian() == greg
 
 
+class TestToday:
+    def test_today_in_timezone(self):
+        from datetime import datetime, timezone
+
+        tz = timezone(timedelta(hours=14))
+        assert GaianDate.today(tz) in {
+            GaianDate.from_gregorian(datetime.now(tz).date() + timedelta(n)) for n in (-1, 0)
+        }
+
+
+class TestFromTimestamp:
+    def test_matches_fromtimestamp(self):
+        from datetime import datetime, timezone
+
+        for ts in range(0, 2_000_000_000, 12_345_679):
+            greg = datetime.fromtimestamp(ts, timezone.utc).date()
+            assert GaianDate.from_timestamp(ts) == GaianDate.from_gregorian(greg)
+
+    def test_offset_and_unit(self):
+        ts = 1_773_014_400  # 2026-03-09T00:00:00Z
+        assert GaianDate.from_timestamp(ts) == GaianDate(12026, 3, 15)
+        assert GaianDate.from_timestamp(ts, tz_offset=-3600) == GaianDate(12026, 3, 14)
+        assert GaianDate.from_timestamp(ts * 10**9 - 1, unit="ns") == GaianDate(12026, 3, 14)
+
+    def test_same_day_is_memoized(self):
+        a = GaianDate.from_timestamp(1_773_014_400)
+        assert GaianDate.from_timestamp(1_773_014_400 + 86_399) is a
+        assert GaianDate.from_timestamp(1_773_014_400 + 86_400) == a + timedelta(days=1)
+
+    def test_out_of_range_raises(self):
+        with pytest.raises(ValueError):
+            GaianDate.from_timestamp(-62_135_596_800 * 2)
+
+
+class TestOrdinal:
+    def test_toordinal_matches_gregorian(self):
+        d = GaianDate(12026, 3, 15)
+        assert d.toordinal() == d.to_gregorian().toordinal()
+
+    def test_fromordinal(self):
+        assert GaianDate.fromordinal(date(2025, 12, 29).toordinal()) == GaianDate(12026, 1, 1)
+
+    def test_roundtrip(self):
+        d = GaianDate(12026, 14, 7)
+        assert GaianDate.fromordinal(d.toordinal()) == d
+
+    def test_fromordinal_fields(self):
+        d = GaianDate.fromordinal(GaianDate(12026, 14, 3).toordinal())
+        assert (d.year, d.month, d.day) == (12026, 14, 3)
+
+    def test_fromordinal_rejects_non_integers(self):
+        with pytest.raises(TypeError):
+            GaianDate.fromordinal(739000.5)
+        with pytest.raises(TypeError):
+            GaianDate.fromordinal(739000.0)
+
+    def test_fromordinal_numpy_integer(self):
+        np = pytest.importorskip("numpy")
+        d = GaianDate.fromordinal(np.int64(739000))
+        assert type(d.toordinal()) is int and type(d.year) is int
+        assert d == GaianDate.fromordinal(739000)
+        assert hash(d) == hash(GaianDate.fromordinal(739000))
+
+    def test_fromordinal_out_of_range_raises(self):
+        with pytest.raises(ValueError):
+            GaianDate.fromordinal(0)  # ISO year 0 → Gaian 10000
+        with pytest.raises(ValueError):
+            GaianDate.fromordinal(date.max.toordinal() + 7)
+
+
 class TestProperties:
     def setup_method(self):
         self.d = GaianDate(12026, 3, 15)
@@ -87,6 +157,17 @@ class TestArithmetic:
         d2 = GaianDate(12026, 1, 8)
         assert d2 - d1 == timedelta(days=7)
 
+    def test_year_boundary_forward_through_horus(self):
+        d = GaianDate(12026, 13, 28)
+        assert d + timedelta(days=1) == GaianDate(12026, 14, 1)
+        assert d + timedelta(days=8) == GaianDate(12027, 1, 1)
+
+    def test_radd(self):
+        assert timedelta(days=1) + GaianDate(12026, 2, 28) == GaianDate(12026, 3, 1)
+
+    def test_subtract_across_years(self):
+        assert GaianDate(12027, 1, 1) - GaianDate(12026, 1, 1) == timedelta(days=371)
+
     def test_add_week(self):
         d = GaianDate(12026, 3, 1)
         result = d + timedelta(weeks=1)
@@ -111,6 +192,14 @@ class TestComparison:
         b = GaianDate(12026, 3, 15)
         assert hash(a) == hash(b)
 
+    def test_less_equal_and_greater_equal(self):
+        assert GaianDate(12026, 1, 1) <= GaianDate(12026, 1, 1)
+        assert GaianDate(12026, 14, 1) >= GaianDate(12026, 13, 28)
+
+    def test_sorting_across_years(self):
+        dates = [GaianDate(12027, 1, 1), GaianDate(12026, 14, 7), GaianDate(12026, 1, 1)]
+        assert sorted(dates) == [dates[2], dates[1], dates[0]]
+
     def test_usable_as_dict_key(self):
         d = {GaianDate(12026, 1, 1): "New Year"}
         assert d[GaianDate(12026, 1, 1)] == "New Year"
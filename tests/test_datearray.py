@@ -0,0 +1,162 @@
+"""Tests for GaianDateArray."""
+import pytest
+import pickle
+from datetime import date, timedelta
+
+np = pytest.importorskip("numpy")
+
+from gaian_calendar import GaianDate, GaianDateArray, add_workdays
+
+DATES = [GaianDate(12026, 3, 15), GaianDate(12026, 14, 7), GaianDate(12025, 1, 1), GaianDate(12030, 13, 28)]
+
+
+@pytest.fixture
+def arr():
+    return GaianDateArray(DATES)
+
+
+@pytest.fixture
+def span():
+    start = date(1999, 12, 1)
+    return GaianDateArray(GaianDate.from_gregorian(start + timedelta(n)) for n in range(3_000))
+
+
+class TestConstruction:
+    def test_from_dates(self, arr):
+        assert len(arr) == 4
+        assert arr.ordinals.dtype == np.int32
+        assert arr.ordinals.tolist() == [d.toordinal() for d in DATES]
+        assert arr.nbytes == 16
+
+    def test_empty(self):
+        assert len(GaianDateArray()) == 0
+
+    def test_from_ordinals(self, arr):
+        assert GaianDateArray.from_ordinals(arr.ordinals.astype(np.int64)).tolist() == DATES
+
+    def test_from_ordinals_out_of_range(self):
+        with pytest.raises(ValueError, match="indices \\[1\\]"):
+            GaianDateArray.from_ordinals([738_000, 0])
+
+    def test_from_ordinals_rejects_floats(self):
+        with pytest.raises(TypeError):
+            GaianDateArray.from_ordinals([738_000.0])
+
+    def test_from_fields(self, arr):
+        assert GaianDateArray.from_fields(arr.year, arr.month, arr.day).tolist() == DATES
+
+    def test_from_fields_invalid(self):
+        with pytest.raises(ValueError):
+            GaianDateArray.from_fields([12025], [14], [1])
+
+    def test_datetime64_round_trip(self):
+        values = np.arange("1990-01-01", "2040-01-01", dtype="datetime64[D]")
+        arr = GaianDateArray.from_datetime64(values)
+        assert (arr.to_datetime64() == values).all()
+        assert arr[0] == GaianDate.from_gregorian(date(1990, 1, 1))
+
+    def test_datetime64_floors_times(self):
+        values = np.array(["2026-03-09T23:59"], dtype="datetime64[m]")
+        assert GaianDateArray.from_datetime64(values)[0] == GaianDate(12026, 3, 15)
+
+    def test_from_timestamps(self, arr):
+        seconds = (arr.ordinals.astype(np.int64) - 719_163) * 86_400 + 43_200
+        assert GaianDateArray.from_timestamps(seconds).tolist() == DATES
+        assert GaianDateArray.from_timestamps(seconds * 1000, tz_offset=-43_201, unit="ms")[0] == \
+            DATES[0] - timedelta(days=1)
+
+    def test_immutable(self, arr):
+        with pytest.raises(ValueError):
+            arr.ordinals[0] = 0
+        with pytest.raises(ValueError):
+            arr.year[0] = 0
+
+
+class TestColumns:
+    def test_match_scalar_properties(self, span):
+        for name in ("year", "month", "day", "day_of_week", "day_of_year", "is_leap_year",
+                     "month_name", "month_symbol", "month_abbrev",
+                     "weekday_name", "weekday_symbol", "weekday_abbrev"):
+            assert getattr(span, name).tolist() == [getattr(d, name) for d in span], name
+
+    def test_known_values(self, arr):
+        assert arr.month_name.tolist() == ["Aquarius", "Horus", "Sagittarius", "Ophiuchus"]
+        assert arr.weekday_name.tolist() == ["Monday", "Sunday", "Monday", "Sunday"]
+        assert arr.is_leap_year.tolist() == [True, True, False, False]
+
+
+class TestSequence:
+    def test_getitem_returns_gaian_date(self, arr):
+        assert arr[1] == GaianDate(12026, 14, 7)
+        assert arr[-1] == GaianDate(12030, 13, 28)
+        assert arr[np.int64(0)] == DATES[0]
+
+    def test_slice_and_mask(self, arr):
+        assert isinstance(arr[1:], GaianDateArray)
+        assert arr[1:3].tolist() == DATES[1:3]
+        assert arr[arr.month == 14].tolist() == [GaianDate(12026, 14, 7)]
+        assert arr[[3, 0]].tolist() == [DATES[3], DATES[0]]
+
+    def test_iter_and_contains(self, arr):
+        assert list(arr) == DATES
+        assert GaianDate(12025, 1, 1) in arr
+        assert GaianDate(12025, 1, 2) not in arr
+
+    def test_copy_constructor_shares_buffer(self, arr):
+        assert GaianDateArray(arr).ordinals is arr.ordinals
+
+    def test_pickle(self, arr):
+        assert pickle.loads(pickle.dumps(arr)).tolist() == DATES
+
+    def test_repr(self, arr, span):
+        assert repr(arr).startswith("GaianDateArray([GaianDate(12026, 3, 15), ")
+        assert "…" in repr(span) and "length=3000" in repr(span)
+
+
+class TestWorkdays:
+    def test_add_workdays(self, arr):
+        moved = arr.add_workdays(3, [GaianDate(12026, 3, 16)])
+        assert isinstance(moved, GaianDateArray)
+        assert moved.tolist() == [add_workdays(d, 3, [GaianDate(12026, 3, 16)]) for d in DATES]
+
+
+class TestComparison:
+    def test_with_date(self, arr):
+        pivot = GaianDate(12026, 3, 15)
+        assert (arr == pivot).tolist() == [True, False, False, False]
+        assert (arr != pivot).tolist() == [False, True, True, True]
+        assert (arr < pivot).tolist() == [False, False, True, False]
+        assert (arr <= pivot).tolist() == [True, False, True, False]
+        assert (arr > pivot).tolist() == [False, True, False, True]
+        assert (arr >= pivot).tolist() == [True, True, False, True]
+
+    def test_reflected(self, arr):
+        assert (GaianDate(12026, 3, 15) < arr).tolist() == [False, True, False, True]
+
+    def test_with_array(self, arr):
+        assert (arr == GaianDateArray(DATES)).all()
+        assert (arr[:2] < arr[2:]).tolist() == [False, True]
+
+    def test_unsupported(self, arr):
+        assert (arr == 5) is False
+        with pytest.raises(TypeError):
+            arr < 5
+
+    def test_unhashable(self, arr):
+        with pytest.raises(TypeError):
+            hash(arr)
+
+
+class TestSortSearch:
+    def test_sorted_and_argsort(self, arr):
+        assert arr.sorted().tolist() == sorted(DATES)
+        assert arr.argsort().tolist() == [2, 0, 1, 3]
+        assert arr.min() == min(DATES) and arr.max() == max(DATES)
+
+    def test_searchsorted(self, span):
+        target = GaianDate(12000, 5, 10)
+        i = span.searchsorted(target)
+        assert span[i] == target
+        assert span.searchsorted(target, side="right") == i + 1
+        assert span.searchsorted([span[0], span[-1]]).tolist() == [0, len(span) - 1]
+        assert span.searchsorted(span[10:12]).tolist() == [10, 11]
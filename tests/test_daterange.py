@@ -0,0 +1,162 @@
+"""Tests for GaianDateRange."""
+import pytest
+from datetime import timedelta
+from gaian_calendar import GaianDate, GaianDateRange
+
+
+def _walk(start, stop, delta):
+    """Reference sequence built with timedelta arithmetic."""
+    out, d = [], start
+    while (d < stop) if delta > timedelta(0) else (d > stop):
+        out.append(d)
+        d = d + delta
+    return out
+
+
+class TestDays:
+    def setup_method(self):
+        self.start = GaianDate(12026, 13, 20)
+        self.stop = GaianDate(12027, 2, 10)
+        self.r = GaianDateRange(self.start, self.stop)
+
+    def test_iteration_matches_timedelta_walk(self):
+        assert list(self.r) == _walk(self.start, self.stop, timedelta(days=1))
+
+    def test_passes_through_horus(self):
+        assert GaianDate(12026, 14, 7) in self.r
+        assert self.r[9] == GaianDate(12026, 14, 1)
+
+    def test_len(self):
+        assert len(self.r) == (self.stop - self.start).days
+
+    def test_stop_excluded(self):
+        assert self.stop not in self.r
+        assert self.r[-1] == self.stop - timedelta(days=1)
+
+    def test_negative_index(self):
+        assert self.r[-len(self.r)] == self.start
+
+    def test_index_out_of_range(self):
+        with pytest.raises(IndexError):
+            self.r[len(self.r)]
+
+    def test_slice(self):
+        assert list(self.r[5:40:3]) == list(self.r)[5:40:3]
+
+    def test_reversed(self):
+        assert list(reversed(self.r)) == list(self.r)[::-1]
+
+    def test_index(self):
+        assert self.r.index(GaianDate(12027, 1, 1)) == 16
+
+    def test_index_missing_raises(self):
+        with pytest.raises(ValueError):
+            self.r.index(self.stop)
+
+    def test_contains_other_types(self):
+        assert "12026-13-20" not in self.r
+
+    def test_step(self):
+        r = GaianDateRange(self.start, self.stop, 3)
+        assert list(r) == _walk(self.start, self.stop, timedelta(days=3))
+        assert GaianDate(12026, 13, 21) not in r
+
+    def test_negative_step(self):
+        r = GaianDateRange(self.stop, self.start, -2)
+        assert list(r) == _walk(self.stop, self.start, timedelta(days=-2))
+
+    def test_large_step(self):
+        r = GaianDateRange(GaianDate(12020, 1, 1), GaianDate(12030, 1, 1), 45)
+        assert list(r) == _walk(GaianDate(12020, 1, 1), GaianDate(12030, 1, 1), timedelta(days=45))
+
+    def test_timedelta_step(self):
+        assert GaianDateRange(self.start, self.stop, timedelta(days=2)) == GaianDateRange(
+            self.start, self.stop, 2)
+
+    def test_empty(self):
+        r = GaianDateRange(self.stop, self.start)
+        assert len(r) == 0
+        assert list(r) == []
+        assert not r
+
+    def test_zero_step_raises(self):
+        with pytest.raises(ValueError):
+            GaianDateRange(self.start, self.stop, 0)
+
+    def test_fractional_timedelta_raises(self):
+        with pytest.raises(ValueError):
+            GaianDateRange(self.start, self.stop, timedelta(hours=12))
+
+    def test_bad_unit_raises(self):
+        with pytest.raises(ValueError):
+            GaianDateRange(self.start, self.stop, unit="years")
+
+    def test_start_stop_step(self):
+        assert (self.r.start, self.r.stop, self.r.step, self.r.unit) == (
+            self.start, self.stop, 1, "days")
+
+
+class TestWeeks:
+    def test_weeks(self):
+        start, stop = GaianDate(12026, 1, 1), GaianDate(12027, 1, 1)
+        r = GaianDateRange(start, stop, unit="weeks")
+        assert len(r) == 53
+        assert r[-1] == GaianDate(12026, 14, 1)
+        assert all(d.weekday_name == "Monday" for d in r)
+
+    def test_equals_seven_day_step(self):
+        start, stop = GaianDate(12026, 1, 1), GaianDate(12027, 1, 1)
+        assert GaianDateRange(start, stop, 1, unit="weeks") == GaianDateRange(start, stop, 7)
+        assert GaianDateRange(start, stop, 2, unit="weeks").step == 2
+
+
+class TestMonths:
+    def test_monthly_includes_horus_in_leap_year(self):
+        r = GaianDateRange(GaianDate(12026, 12, 1), GaianDate(12027, 3, 1), unit="months")
+        assert list(r) == [
+            GaianDate(12026, 12, 1), GaianDate(12026, 13, 1), GaianDate(12026, 14, 1),
+            GaianDate(12027, 1, 1), GaianDate(12027, 2, 1),
+        ]
+
+    def test_monthly_skips_horus_in_regular_year(self):
+        r = GaianDateRange(GaianDate(12025, 13, 1), GaianDate(12026, 2, 1), unit="months")
+        assert list(r) == [GaianDate(12025, 13, 1), GaianDate(12026, 1, 1)]
+
+    def test_day_clamped_on_horus_then_restored(self):
+        r = GaianDateRange(GaianDate(12026, 13, 20), GaianDate(12027, 3, 1), unit="months")
+        assert list(r) == [
+            GaianDate(12026, 13, 20), GaianDate(12026, 14, 7),
+            GaianDate(12027, 1, 20), GaianDate(12027, 2, 20),
+        ]
+
+    def test_stop_in_same_month_as_element(self):
+        start = GaianDate(12026, 1, 15)
+        assert len(GaianDateRange(start, GaianDate(12026, 3, 15), unit="months")) == 2
+        assert len(GaianDateRange(start, GaianDate(12026, 3, 16), unit="months")) == 3
+
+    def test_len_and_index_across_decades(self):
+        r = GaianDateRange(GaianDate(12000, 1, 10), GaianDate(12100, 1, 10), unit="months")
+        items = list(r)
+        assert len(r) == len(items)
+        assert r[len(r) // 2] == items[len(items) // 2]
+        assert r.index(items[500]) == 500
+
+    def test_step_and_negative_step(self):
+        r = GaianDateRange(GaianDate(12026, 1, 5), GaianDate(12028, 1, 1), 5, unit="months")
+        assert list(r)[:4] == [
+            GaianDate(12026, 1, 5), GaianDate(12026, 6, 5),
+            GaianDate(12026, 11, 5), GaianDate(12027, 2, 5),  # 12026 has Horus
+        ]
+        back = GaianDateRange(GaianDate(12027, 1, 5), GaianDate(12026, 12, 5), -1, unit="months")
+        assert list(back) == [GaianDate(12027, 1, 5), GaianDate(12026, 14, 5), GaianDate(12026, 13, 5)]
+
+    def test_contains_requires_matching_day(self):
+        r = GaianDateRange(GaianDate(12026, 1, 20), GaianDate(12027, 3, 1), unit="months")
+        assert GaianDate(12026, 14, 7) in r
+        assert GaianDate(12026, 14, 6) not in r
+        assert GaianDate(12026, 5, 19) not in r
+        assert GaianDate(12026, 5, 20) in r
+
+    def test_slice(self):
+        r = GaianDateRange(GaianDate(12026, 1, 20), GaianDate(12030, 1, 1), unit="months")
+        assert list(r[2:30:4]) == list(r)[2:30:4]
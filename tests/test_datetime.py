@@ -0,0 +1,136 @@
+"""Tests for GaianDateTime."""
+import pytest
+import pickle
+from datetime import datetime, time, timedelta, timezone
+from gaian_calendar import GaianDate, GaianDateTime
+
+IST = timezone(timedelta(hours=5, minutes=30))
+
+
+@pytest.fixture
+def dt():
+    # Aquarius 15, 12026 = 2026-03-09
+    return GaianDateTime(12026, 3, 15, 14, 30, 5, 1234, IST)
+
+
+class TestConstruction:
+    def test_fields(self, dt):
+        assert (dt.year, dt.month, dt.day) == (12026, 3, 15)
+        assert (dt.hour, dt.minute, dt.second, dt.microsecond) == (14, 30, 5, 1234)
+        assert dt.tzinfo is IST
+        assert dt.date == GaianDate(12026, 3, 15)
+        assert dt.time() == time(14, 30, 5, 1234)
+        assert dt.day_of_week == 1
+
+    def test_slotted(self, dt):
+        with pytest.raises(AttributeError):
+            dt.extra = 1
+
+    @pytest.mark.parametrize("fields", [
+        (12026, 3, 15, 24), (12026, 3, 15, 0, 60), (12026, 3, 15, 0, 0, 60),
+        (12026, 3, 15, 0, 0, 0, 1_000_000), (12025, 14, 1),
+    ])
+    def test_invalid(self, fields):
+        with pytest.raises(ValueError):
+            GaianDateTime(*fields)
+
+    def test_combine(self):
+        d = GaianDate(12026, 14, 7)
+        assert GaianDateTime.combine(d, time(8, 15)) == GaianDateTime(12026, 14, 7, 8, 15)
+        assert GaianDateTime.combine(d, time(8, tzinfo=IST)).tzinfo is IST
+
+    def test_now(self):
+        assert GaianDateTime.now(timezone.utc).tzinfo is timezone.utc
+
+
+class TestConversion:
+    def test_datetime_round_trip(self, dt):
+        greg = dt.to_datetime()
+        assert greg == datetime(2026, 3, 9, 14, 30, 5, 1234, IST)
+        assert GaianDateTime.from_datetime(greg) == dt
+
+    def test_naive_round_trip(self):
+        greg = datetime(2025, 12, 28, 23, 59, 59)
+        dt = GaianDateTime.from_datetime(greg)
+        assert dt.tzinfo is None and dt.date == GaianDate(12025, 13, 28)
+        assert dt.to_datetime() == greg
+
+    def test_timestamp(self, dt):
+        assert dt.timestamp() == dt.to_datetime().timestamp()
+        assert dt.to_timestamp() == 1_773_046_805
+        assert dt.to_timestamp("ns") == 1_773_046_805_001_234_000
+
+    @pytest.mark.parametrize("ts", [0, -1, 1_773_014_399, 1_773_046_805, 2_000_000_000])
+    def test_from_timestamp_matches_datetime(self, ts):
+        for tz in (timezone.utc, IST, timezone(timedelta(hours=-8))):
+            expected = GaianDateTime.from_datetime(datetime.fromtimestamp(ts, tz))
+            got = GaianDateTime.from_timestamp(ts, tz.utcoffset(None))
+            assert got == expected and got.to_datetime() == expected.to_datetime()
+            assert got.utcoffset() == tz.utcoffset(None)
+
+    def test_from_timestamp_units(self, dt):
+        assert GaianDateTime.from_timestamp(dt.to_timestamp("ns"), IST, unit="ns").to_datetime() == \
+            dt.to_datetime()
+        assert GaianDateTime.from_timestamp(1_773_046_805.5).microsecond == 500_000
+
+    def test_from_timestamp_zone(self):
+        zoneinfo = pytest.importorskip("zoneinfo")
+        try:
+            tz = zoneinfo.ZoneInfo("America/New_York")
+        except zoneinfo.ZoneInfoNotFoundError:
+            pytest.skip("no tz database")
+        dt = GaianDateTime.from_timestamp(1_773_046_805, tz)
+        assert dt.to_datetime() == datetime.fromtimestamp(1_773_046_805, tz)
+        assert dt.utcoffset() == timedelta(hours=-4)
+
+
+class TestArithmetic:
+    def test_add_crosses_day_and_year(self):
+        dt = GaianDateTime(12026, 14, 7, 23, 0)
+        assert dt + timedelta(hours=2) == GaianDateTime(12027, 1, 1, 1, 0)
+        assert timedelta(hours=2) + dt == dt + timedelta(hours=2)
+        assert dt - timedelta(days=371) == GaianDateTime(12025, 13, 28, 23, 0)
+
+    def test_matches_datetime(self, dt):
+        for delta in (timedelta(microseconds=-1), timedelta(days=400, seconds=3), timedelta(weeks=-60)):
+            assert (dt + delta).to_datetime() == dt.to_datetime() + delta
+
+    def test_difference(self, dt):
+        other = GaianDateTime(12026, 1, 1, tzinfo=timezone.utc)
+        assert dt - other == dt.to_datetime() - other.to_datetime()
+        assert dt - (dt - timedelta(seconds=90)) == timedelta(seconds=90)
+
+    def test_naive_aware_mix(self, dt):
+        naive = GaianDateTime(12026, 3, 15)
+        with pytest.raises(TypeError):
+            dt - naive
+        with pytest.raises(TypeError):
+            dt < naive
+        assert dt != naive
+
+
+class TestComparison:
+    def test_aware_compares_in_utc(self, dt):
+        same = GaianDateTime.from_datetime(dt.to_datetime().astimezone(timezone.utc))
+        assert same == dt and hash(same) == hash(dt)
+        assert dt < same + timedelta(microseconds=1)
+        assert sorted([dt + timedelta(1), same, dt - timedelta(1)])[1] is same
+
+    def test_pickle(self, dt):
+        assert pickle.loads(pickle.dumps(dt)) == dt
+        assert pickle.loads(pickle.dumps(dt)).tzinfo == IST
+
+
+class TestFormat:
+    def test_str_and_repr(self, dt):
+        assert str(dt) == "Aquarius 15, 12026 GE 14:30:05.001234+05:30"
+        assert str(GaianDateTime(12026, 3, 15, 9)) == "Aquarius 15, 12026 GE 09:00:00"
+        assert repr(GaianDateTime(12026, 3, 15, 9)) == "GaianDateTime(12026, 3, 15, 9, 0)"
+
+    def test_time_tokens(self, dt):
+        assert dt.format("yyyy-MM-ddTHH:mm:ss.SSSXXX") == "12026-03-15T14:30:05.001+05:30"
+        assert dt.format("WWW h:mm a") == "Mon 2:30 PM"
+        assert dt.format("MMMM d, yyyy 'at' HH:mm") == "Aquarius 15, 12026 at 14:30"
+        assert dt.format("SSSSSS") == "001234"
+        assert GaianDateTime(12026, 3, 15, 0, 5).format("hh:mm a H") == "12:05 AM 0"
+        assert GaianDateTime(12026, 3, 15, tzinfo=timezone.utc).format("XXX") == "Z"
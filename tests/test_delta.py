@@ -0,0 +1,70 @@
+"""Tests for GaianDelta and month / year arithmetic on dates."""
+import pytest
+import pickle
+from datetime import timedelta, timezone
+from gaian_calendar import GaianDate, GaianDateRange, GaianDateTime, GaianDelta
+
+
+class TestDateMethods:
+    def test_add_months(self):
+        assert GaianDate(12026, 13, 20).add_months(1) == GaianDate(12026, 14, 7)
+        assert GaianDate(12026, 13, 20).add_months(2) == GaianDate(12027, 1, 20)
+
+    def test_add_years(self):
+        assert GaianDate(12026, 14, 3).add_years(1) == GaianDate(12027, 13, 28)
+        assert GaianDate(12026, 3, 15).add_years(-1) == GaianDate(12025, 3, 15)
+
+    def test_matches_month_range(self):
+        # GaianDateRange with unit="months" follows the same Horus rule
+        start = GaianDate(12020, 1, 25)
+        months = GaianDateRange(start, GaianDate(12040, 1, 1), unit="months")
+        assert [start.add_months(n) for n in range(len(months))] == list(months)
+
+    def test_result_fields_are_consistent(self):
+        d = GaianDate(12026, 13, 28).add_months(27)
+        assert d == GaianDate(d.year, d.month, d.day)
+        assert d.toordinal() == GaianDate(d.year, d.month, d.day).toordinal()
+
+
+class TestGaianDelta:
+    def test_parts(self):
+        delta = GaianDelta(years=1, months=2, weeks=3, days=4)
+        assert (delta.years, delta.months, delta.days) == (1, 2, 25)
+
+    def test_applied_in_order(self):
+        d = GaianDate(12026, 14, 5)
+        # years first: Horus 5 → Ophiuchus 28, 12027; then one month; then a week
+        assert d + GaianDelta(years=1, months=1, weeks=1) == GaianDate(12028, 1, 28) + timedelta(7)
+
+    def test_add_is_symmetric(self):
+        d, delta = GaianDate(12026, 13, 20), GaianDelta(months=1, days=3)
+        assert delta + d == d + delta == GaianDate(12027, 1, 3)
+
+    def test_subtract(self):
+        assert GaianDate(12026, 3, 15) - GaianDelta(months=14) == GaianDate(12025, 2, 15)
+        assert GaianDate(12026, 3, 15) - GaianDelta(days=15) == GaianDate(12026, 2, 28)
+
+    def test_datetime_keeps_time(self):
+        t = GaianDateTime(12026, 3, 15, 9, 30, tzinfo=timezone.utc)
+        assert t + GaianDelta(months=1) == GaianDateTime(12026, 4, 15, 9, 30, tzinfo=timezone.utc)
+        assert t - GaianDelta(years=1) == t.add_years(-1)
+
+    def test_delta_arithmetic(self):
+        a, b = GaianDelta(months=1), GaianDelta(years=1, days=2)
+        assert a + b == GaianDelta(years=1, months=1, days=2)
+        assert a - b == GaianDelta(years=-1, months=1, days=-2)
+        assert 3 * a == a * 3 == GaianDelta(months=3)
+        assert -a == GaianDelta(months=-1) and +a is a
+        assert not GaianDelta() and a
+
+    def test_hash_pickle_repr(self):
+        delta = GaianDelta(years=2, weeks=1)
+        assert hash(delta) == hash(GaianDelta(years=2, days=7))
+        assert pickle.loads(pickle.dumps(delta)) == delta
+        assert repr(delta) == "GaianDelta(years=2, days=7)"
+
+    def test_rejects_non_integers(self):
+        with pytest.raises(TypeError):
+            GaianDelta(months=1.5)
+        with pytest.raises(TypeError):
+            GaianDelta(months=1) + timedelta(1)
@@ -1,6 +1,8 @@
 """Tests for the formatting engine."""
 import pytest
-from gaian_calendar import GaianDate
+from datetime import timedelta
+from gaian_calendar import GaianDate, GaianFormatter, format_many
+from gaian_calendar._format import compile_pattern
 
 
 class TestFormat:
@@ -96,4 +98,171 @@ class TestFormat:
         assert GaianDate(12026, 1, 28).format("dddd") == "Twenty-eighth"
 
     def test_literal_characters_pass_through(self):
-        assert self.d.format("MMMM 'the' d") == "Aquarius 'the' 15"
+        assert self.d.format("MMMM, d. yyyy!") == "Aquarius, 15. 12026!"
+
+    def test_quoted_literals(self):
+        assert self.d.format("MMMM 'the' d") == "Aquarius the 15"
+        assert self.d.format("'Day' d 'of' yyyy") == "Day 15 of 12026"
+        assert self.d.format("d''MM 'yyyy''s'") == "15'03 yyyy's"
+
+    def test_unterminated_quote_raises(self):
+        with pytest.raises(ValueError, match="quote"):
+            self.d.format("MMMM 'd")
+
+
+class TestGaianFormatter:
+    def test_format_fields(self):
+        f = GaianFormatter("WWWW, MMMM d, yyyy GE")
+        assert f.format(12026, 3, 15) == "Monday, Aquarius 15, 12026 GE"
+
+    def test_reusable(self):
+        f = GaianFormatter("yyyy-MM-dd")
+        assert f.format(12026, 3, 15) == "12026-03-15"
+        assert f.format(12025, 13, 28) == "12025-13-28"
+
+    def test_literal_only_pattern(self):
+        assert GaianFormatter("-- GE --").format(12026, 1, 1) == "-- GE --"
+
+    def test_empty_pattern(self):
+        assert GaianFormatter("").format(12026, 1, 1) == ""
+
+    def test_adjacent_tokens(self):
+        assert GaianFormatter("MMM*MMdd").format(12026, 3, 5) == "♒0305"
+
+    def test_horus(self):
+        assert GaianFormatter("MMMM d WWW DDD").format(12026, 14, 7) == "Horus 7 Sun 371"
+
+    def test_pattern_property(self):
+        assert GaianFormatter("MMMM d").pattern == "MMMM d"
+
+    def test_compile_pattern_is_cached(self):
+        assert compile_pattern("MMMM d, yyyy") is compile_pattern("MMMM d, yyyy")
+
+    def test_fields_match_date_properties_for_all_days(self):
+        f = compile_pattern("MMMM|MMM*|MMM|WWWW|WWW|W|DDD")
+        for month in range(1, 15):
+            for day in range(1, 8 if month == 14 else 29):
+                d = GaianDate(12026, month, day)
+                assert f.format(12026, month, day).split("|") == [
+                    d.month_name, d.month_symbol, d.month_abbrev,
+                    d.weekday_name, d.weekday_abbrev, d.weekday_symbol,
+                    f"{d.day_of_year:03d}",
+                ]
+
+
+class TestTimeFields:
+    def test_date_patterns_keep_literal_letters(self):
+        # Time tokens are only recognized when compiled with time=True
+        assert GaianFormatter("d at HH:mm").format(12026, 3, 15) == "15 at HH:mm"
+
+    def test_quoted_words_next_to_time_fields(self):
+        f = GaianFormatter("MMMM d, yyyy 'at' HH:mm", time=True)
+        assert f.format_datetime(12026, 3, 15, 13, 5, 0, 0) == "Aquarius 15, 12026 at 13:05"
+        f = GaianFormatter("h 'o''clock' a 'hahaha'", time=True)
+        assert f.format_datetime(12026, 3, 15, 13, 5, 0, 0) == "1 o'clock PM hahaha"
+
+    def test_format_datetime(self):
+        f = GaianFormatter("yyyy-MM-dd HH:mm:ss.SSSSSS", time=True)
+        assert f.format_datetime(12026, 3, 15, 7, 5, 9, 42) == "12026-03-15 07:05:09.000042"
+
+    def test_twelve_hour_clock(self):
+        f = GaianFormatter("h hh a", time=True)
+        assert [f.format_datetime(12026, 1, 1, h, 0, 0, 0) for h in (0, 11, 12, 23)] == [
+            "12 12 AM", "11 11 AM", "12 12 PM", "11 11 PM",
+        ]
+
+    @pytest.mark.parametrize("offset, text", [
+        (None, ""), (timedelta(0), "Z"), (timedelta(hours=-3), "-03:00"),
+        (timedelta(hours=5, minutes=45), "+05:45"), (timedelta(seconds=3661), "+01:01:01"),
+    ])
+    def test_utc_offset(self, offset, text):
+        assert GaianFormatter("XXX", time=True).format_datetime(12026, 1, 1, 0, 0, 0, 0, offset) == text
+
+    def test_date_formatter_rejects_times(self):
+        with pytest.raises(ValueError):
+            GaianFormatter("HH").format_datetime(12026, 1, 1, 0, 0, 0, 0)
+
+    def test_format_many_rejects_time_fields(self):
+        with pytest.raises(ValueError):
+            list(GaianFormatter("HH", time=True).format_many([(12026, 1, 1)]))
+
+    def test_compile_pattern_caches_per_mode(self):
+        assert compile_pattern("HH") is not compile_pattern("HH", True)
+        assert repr(compile_pattern("HH", True)) == "GaianFormatter('HH', time=True)"
+
+
+class TestFormatMany:
+    def test_gaian_dates(self):
+        dates = [GaianDate(12026, 3, 15), GaianDate(12026, 14, 7)]
+        assert list(format_many("MMMM d, yyyy GE", dates)) == [
+            "Aquarius 15, 12026 GE",
+            "Horus 7, 12026 GE",
+        ]
+
+    def test_tuples(self):
+        rows = [(12026, 3, 15), (12025, 13, 28)]
+        assert list(format_many("yyyy-MM-dd", rows)) == ["12026-03-15", "12025-13-28"]
+
+    def test_is_lazy(self):
+        result = format_many("d", iter([(12026, 1, 1)]))
+        assert next(result) == "1"
+
+    def test_no_year_fields(self):
+        assert list(format_many("WWWW MMM*", [(12026, 3, 15), (12027, 3, 15)])) == [
+            "Monday ♒", "Monday ♒",
+        ]
+
+    def test_multiple_year_fields(self):
+        assert list(format_many("yyyy/yy/yyyy", [(12026, 1, 1)])) == ["12026/26/12026"]
+
+    def test_fills_out(self):
+        out = [None] * 2
+        result = format_many("d MMM", [(12026, 1, 1), (12026, 2, 2)], out=out)
+        assert result is out
+        assert out == ["1 Sag", "2 Cap"]
+
+    def test_matches_format_for_every_day(self):
+        pattern = "yyyy yy MMMM MMM* MMM MM M dddd ddd dd d WWWW WWW W DDD GE"
+        dates = [GaianDate(12026, m, d) for m in range(1, 15) for d in range(1, 8 if m == 14 else 29)]
+        assert list(format_many(pattern, dates)) == [d.format(pattern) for d in dates]
+
+    def test_invalid_day_raises(self):
+        with pytest.raises(ValueError):
+            list(format_many("d", [(12026, 3, 33)]))
+
+    def test_horus_in_non_leap_year_raises(self):
+        with pytest.raises(ValueError):
+            list(format_many("d", [(12025, 14, 1)]))
+
+    def test_year_out_of_range_raises(self):
+        with pytest.raises(ValueError):
+            list(format_many("yyyy", [(9_999, 1, 1)]))
+
+    def test_year_checked_without_year_fields(self):
+        with pytest.raises(ValueError, match="range"):
+            list(format_many("MMMM d", [(12026, 3, 15), (25_000, 3, 15)]))
+
+    def test_numpy_structured(self):
+        np = pytest.importorskip("numpy")
+        from gaian_calendar import gregorian_to_gaian_array
+        records = gregorian_to_gaian_array(np.array(["2026-03-09"], dtype="datetime64[D]"),
+                                           structured=True)
+        assert list(format_many("MMMM d", records)) == ["Aquarius 15"]
+
+    def test_numpy_columns(self):
+        np = pytest.importorskip("numpy")
+        from gaian_calendar import gregorian_to_gaian_array
+        columns = gregorian_to_gaian_array(np.array(["2026-03-09", "2026-12-28"], dtype="datetime64[D]"))
+        assert list(format_many("MMMM d, yyyy", columns)) == ["Aquarius 15, 12026", "Horus 1, 12026"]
+
+    def test_numpy_columns_must_match(self):
+        np = pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="length"):
+            format_many("d", (np.array([12026]), np.array([3, 3]), np.array([1, 2])))
+
+    def test_numpy_rows_fill_array(self):
+        np = pytest.importorskip("numpy")
+        rows = np.array([[12026, 3, 15], [12026, 14, 1]])
+        out = np.empty(2, dtype="U20")
+        format_many("yyyy-MM-dd", rows, out=out)
+        assert out.tolist() == ["12026-03-15", "12026-14-01"]
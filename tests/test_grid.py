@@ -0,0 +1,71 @@
+"""Tests for the calendar grids in _grid.py."""
+import pytest
+from gaian_calendar import (
+    GaianDate,
+    GaianMonth,
+    monthcalendar,
+    yearcalendar,
+    monthdatescalendar,
+    yeardatescalendar,
+)
+
+
+class TestMonthCalendar:
+    def test_regular_month(self):
+        grid = monthcalendar(12026, 3)
+        assert len(grid) == 4
+        assert grid[0] == (1, 2, 3, 4, 5, 6, 7)
+        assert grid[3] == (22, 23, 24, 25, 26, 27, 28)
+
+    def test_horus(self):
+        assert monthcalendar(12026, 14) == ((1, 2, 3, 4, 5, 6, 7),)
+
+    def test_horus_in_non_leap_year_raises(self):
+        with pytest.raises(ValueError, match="leap"):
+            monthcalendar(12025, 14)
+
+    def test_accepts_gaian_month(self):
+        assert monthcalendar(12026, GaianMonth.AQUARIUS) == monthcalendar(12026, 3)
+
+    def test_shared_across_years(self):
+        assert monthcalendar(12026, 3) is monthcalendar(12025, 7)
+
+    def test_columns_are_weekdays(self):
+        for week in monthcalendar(12026, 1):
+            for column, day in enumerate(week, start=1):
+                assert GaianDate(12026, 1, day).day_of_week == column
+
+
+class TestYearCalendar:
+    def test_regular_year(self):
+        assert len(yearcalendar(12025)) == 13
+
+    def test_leap_year(self):
+        grids = yearcalendar(12026)
+        assert len(grids) == 14
+        assert grids[13] == monthcalendar(12026, 14)
+
+    def test_out_of_range_raises(self):
+        with pytest.raises(ValueError):
+            yearcalendar(20_000)
+
+
+class TestDateGrids:
+    def test_month_dates(self):
+        grid = monthdatescalendar(12026, 3)
+        assert grid[0][0] == GaianDate(12026, 3, 1)
+        assert grid[3][6] == GaianDate(12026, 3, 28)
+        assert all(d.weekday_name == "Sunday" for d in (week[6] for week in grid))
+
+    def test_ordinals_are_consistent(self):
+        for week in monthdatescalendar(12026, 14):
+            for d in week:
+                assert GaianDate.fromordinal(d.toordinal()) == d
+
+    def test_cached(self):
+        assert monthdatescalendar(12026, 3) is monthdatescalendar(12026, GaianMonth(3))
+
+    def test_year_dates(self):
+        grids = yeardatescalendar(12026)
+        assert len(grids) == 14
+        assert grids[13][0][6] == GaianDate(12026, 14, 7)
@@ -0,0 +1,45 @@
+"""Tests for lazy loading in gaian_calendar/__init__.py."""
+import pytest
+import subprocess
+import sys
+import gaian_calendar
+
+
+def _modules_after(code: str) -> set[str]:
+    out = subprocess.run(
+        [sys.executable, "-c", code + "; import sys; print(' '.join(sys.modules))"],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return set(out.split())
+
+
+class TestLazyImport:
+    def test_import_does_not_load_heavy_modules(self):
+        modules = _modules_after("import gaian_calendar")
+        for name in ("re", "typing", "gaian_calendar._parse", "gaian_calendar._grid",
+                     "gaian_calendar.daterange", "gaian_calendar._vectorized",
+                     "gaian_calendar.recurrence"):
+            assert name not in modules
+
+    def test_parse_loads_parser_on_first_use(self):
+        modules = _modules_after(
+            "import gaian_calendar; gaian_calendar.GaianDate.parse('12026-03-15')"
+        )
+        assert "gaian_calendar._parse" in modules
+
+    def test_lazy_names_resolve(self):
+        from gaian_calendar._grid import monthcalendar
+        from gaian_calendar._parse import GaianParser, parse_many
+        from gaian_calendar.daterange import GaianDateRange
+
+        assert gaian_calendar.GaianDateRange is GaianDateRange
+        assert gaian_calendar.GaianParser is GaianParser
+        assert gaian_calendar.parse_many is parse_many
+        assert gaian_calendar.monthcalendar is monthcalendar
+
+    def test_dir_lists_lazy_names(self):
+        assert {"GaianDateRange", "parse_many", "monthcalendar"} <= set(dir(gaian_calendar))
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            gaian_calendar.no_such_name
@@ -1,6 +1,8 @@
 """Tests for GaianMonth and GaianWeekday."""
+import copy
+import pickle
 import pytest
-from gaian_calendar import GaianMonth, GaianWeekday
+from gaian_calendar import GaianDate, GaianMonth, GaianWeekday, _data
 
 
 class TestGaianMonth:
@@ -54,6 +56,17 @@ class TestGaianMonth:
         assert GaianMonth(1) < GaianMonth(2)
         assert GaianMonth(13) > GaianMonth(12)
 
+    def test_interned(self):
+        assert GaianMonth(3) is GaianMonth.AQUARIUS
+        assert GaianMonth.from_name("Horus") is GaianMonth.HORUS
+
+    def test_pickle_and_copy_keep_identity(self):
+        assert pickle.loads(pickle.dumps(GaianMonth(3))) is GaianMonth.AQUARIUS
+        assert copy.deepcopy(GaianMonth(3)) is GaianMonth.AQUARIUS
+
+    def test_gaian_date_accessor_is_interned(self):
+        assert GaianDate(12026, 14, 1).gaian_month is GaianMonth.HORUS
+
     def test_invalid_number(self):
         with pytest.raises(ValueError):
             GaianMonth(15)
@@ -101,8 +114,41 @@ class TestGaianWeekday:
     def test_comparison(self):
         assert GaianWeekday(1) < GaianWeekday(7)
 
+    def test_interned(self):
+        assert GaianWeekday(1) is GaianWeekday.MONDAY
+
+    def test_pickle_keeps_identity(self):
+        assert pickle.loads(pickle.dumps(GaianWeekday(7))) is GaianWeekday.SUNDAY
+
+    def test_gaian_date_accessor_is_interned(self):
+        assert GaianDate(12026, 3, 15).gaian_weekday is GaianWeekday.MONDAY
+
     def test_invalid_number(self):
         with pytest.raises(ValueError):
             GaianWeekday(8)
         with pytest.raises(ValueError):
             GaianWeekday(0)
+
+
+class TestMetadataTables:
+    def test_month_tables_mirror_dicts(self):
+        for m in _data.MONTHS:
+            n = m["number"]
+            assert _data.MONTH_TABLE[n]._asdict() == m
+            assert _data.MONTH_NAMES[n] == m["name"]
+            assert _data.MONTH_ABBREVS[n] == m["abbrev"]
+            assert _data.MONTH_SYMBOLS[n] == m["symbol"]
+
+    def test_weekday_tables_mirror_dicts(self):
+        for w in _data.WEEKDAYS:
+            n = w["number"]
+            assert _data.WEEKDAY_TABLE[n]._asdict() == w
+            assert _data.WEEKDAY_NAMES[n] == w["name"]
+            assert _data.WEEKDAY_ABBREVS[n] == w["abbrev"]
+            assert _data.WEEKDAY_SYMBOLS[n] == w["symbol"]
+
+    def test_day_words(self):
+        assert len(_data.ORDINALS) == len(_data.NUMBER_WORDS) == 29
+        assert _data.ORDINALS[1] == "1st" and _data.ORDINALS[12] == "12th"
+        assert _data.ORDINALS[22] == "22nd"
+        assert _data.NUMBER_WORDS[15] == _data.number_word(15) == "Fifteenth"
@@ -0,0 +1,108 @@
+"""Tests for the pandas .gaian accessor in _pandas.py."""
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from gaian_calendar import GaianDate, register_pandas_accessor
+
+register_pandas_accessor()
+
+
+@pytest.fixture
+def series():
+    values = pd.to_datetime(["2026-03-09", "2026-12-31", "2025-12-29"])
+    return pd.Series(values, index=["a", "b", "c"], name="when")
+
+
+@pytest.fixture
+def with_nat():
+    return pd.Series(pd.to_datetime(["2026-03-09", None]))
+
+
+class TestColumns:
+    def test_fields(self, series):
+        assert series.gaian.year.tolist() == [12026, 12026, 12026]
+        assert series.gaian.month.tolist() == [3, 14, 1]
+        assert series.gaian.day.tolist() == [15, 4, 1]
+        assert series.gaian.day_of_year.tolist() == [71, 368, 1]
+        assert series.gaian.day_of_week.tolist() == [1, 4, 1]
+
+    def test_names(self, series):
+        assert series.gaian.month_name.tolist() == ["Aquarius", "Horus", "Sagittarius"]
+        assert series.gaian.month_abbrev.tolist() == ["Aqu", "Hor", "Sag"]
+        assert series.gaian.weekday_symbol.tolist() == ["☽", "♃", "☽"]
+        assert series.gaian.weekday_name.tolist() == ["Monday", "Thursday", "Monday"]
+
+    def test_keeps_index_and_name(self, series):
+        result = series.gaian.year
+        assert result.index.tolist() == ["a", "b", "c"]
+        assert result.name == "when"
+
+    def test_matches_scalar(self):
+        s = pd.Series(pd.date_range("1999-12-01", periods=1500, freq="D"))
+        expected = [GaianDate.from_gregorian(d.date()) for d in s]
+        assert s.gaian.year.tolist() == [d.year for d in expected]
+        assert s.gaian.month.tolist() == [d.month for d in expected]
+        assert s.gaian.day.tolist() == [d.day for d in expected]
+        assert s.gaian.is_leap_year.tolist() == [d.is_leap_year for d in expected]
+        assert s.gaian.weekday_abbrev.tolist() == [d.weekday_abbrev for d in expected]
+
+    def test_times_are_floored(self):
+        s = pd.Series(pd.to_datetime(["2026-03-09 23:59"]))
+        assert s.gaian.day.tolist() == [15]
+
+    def test_tz_aware_uses_local_date(self):
+        s = pd.Series(pd.to_datetime(["2026-03-08 20:00"]).tz_localize("UTC").tz_convert("Asia/Tokyo"))
+        assert s.gaian.day.tolist() == [15]
+
+
+class TestMissing:
+    def test_numeric_become_nan(self, with_nat):
+        year = with_nat.gaian.year
+        assert year.dtype == "float64"
+        assert year[0] == 12026 and pd.isna(year[1])
+
+    def test_strings_and_bools(self, with_nat):
+        assert pd.isna(with_nat.gaian.month_name[1])
+        assert with_nat.gaian.is_leap_year.tolist() == [True, False]
+        assert pd.isna(with_nat.gaian.format("yyyy-MM-dd")[1])
+
+
+class TestFormatAndRoundTrip:
+    def test_format(self, series):
+        assert series.gaian.format("yyyy-MM-dd").tolist() == ["12026-03-15", "12026-14-04", "12026-01-01"]
+
+    def test_to_dates_and_back(self, series, with_nat):
+        dates = series.gaian.to_dates()
+        assert dates.tolist() == [GaianDate(12026, 3, 15), GaianDate(12026, 14, 4), GaianDate(12026, 1, 1)]
+        assert dates.gaian.month.tolist() == [3, 14, 1]
+        assert (dates.gaian.to_datetime() == series).all()
+        back = with_nat.gaian.to_dates()
+        assert back[1] is None
+        assert pd.isna(back.gaian.to_datetime()[1])
+
+    def test_to_array(self, series, with_nat):
+        assert series.gaian.to_array().tolist() == series.gaian.to_dates().tolist()
+        with pytest.raises(ValueError):
+            with_nat.gaian.to_array()
+
+
+class TestIndex:
+    def test_datetime_index(self):
+        index = pd.date_range("2026-03-09", periods=3, name="d")
+        month = index.gaian.month
+        assert isinstance(month, pd.Index) and month.name == "d"
+        assert index.gaian.format("d").tolist() == ["15", "16", "17"]
+        assert isinstance(index.gaian.to_dates().gaian.to_datetime(), pd.DatetimeIndex)
+
+
+class TestRejects:
+    def test_non_datetime(self):
+        assert not hasattr(pd.Series([1, 2]), "gaian")
+        assert not hasattr(pd.Series(["2026-01-01"], dtype=object), "gaian")
+
+    def test_out_of_range(self):
+        s = pd.Series([GaianDate(12026, 1, 1)], dtype=object)
+        assert s.gaian.year.tolist() == [12026]
+        with pytest.raises(ValueError):
+            pd.Series(pd.to_datetime(["2026-01-01"]).astype("datetime64[s]") - pd.Timedelta(days=800_000)).gaian.year
@@ -0,0 +1,72 @@
+"""Tests for convert_parallel in _parallel.py."""
+import pytest
+from array import array
+from datetime import date, timedelta
+from gaian_calendar import GaianDate, convert_parallel
+from gaian_calendar._codec import _TYPECODE
+
+DAYS = [date(1999, 12, 1) + timedelta(n * 3) for n in range(1_000)]
+EXPECTED = [GaianDate.from_gregorian(d) for d in DAYS]
+
+
+@pytest.fixture
+def dates_file(tmp_path):
+    path = tmp_path / "dates.txt"
+    path.write_text("".join(f"{d.isoformat()}\n" for d in DAYS))
+    return path
+
+
+class TestIterables:
+    def test_dates_in_process(self):
+        assert list(convert_parallel(DAYS, workers=1, chunk_size=64)) == EXPECTED
+
+    def test_iso_strings_with_workers(self):
+        strings = [d.isoformat() + "T12:00" for d in DAYS]
+        assert list(convert_parallel(strings, workers=2, chunk_size=97)) == EXPECTED
+
+    def test_packed(self):
+        chunks = list(convert_parallel(iter(DAYS), workers=1, chunk_size=300, packed=True))
+        assert [len(c) for c in chunks] == [300, 300, 300, 100]
+        assert all(isinstance(c, array) and c.typecode == _TYPECODE and c.itemsize == 4 for c in chunks)
+        assert [o for c in chunks for o in c] == [d.toordinal() for d in DAYS]
+
+    def test_empty(self):
+        assert list(convert_parallel([], workers=2)) == []
+
+
+class TestFiles:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 5_000])
+    def test_byte_ranges_cover_every_line_once(self, dates_file, chunk_size):
+        assert list(convert_parallel(dates_file, workers=1, chunk_size=chunk_size)) == EXPECTED
+
+    def test_workers_keep_order(self, dates_file):
+        assert list(convert_parallel(str(dates_file), workers=2, chunk_size=50)) == EXPECTED
+
+    def test_no_trailing_newline(self, tmp_path):
+        path = tmp_path / "d.txt"
+        path.write_text("2026-03-09\r\n2026-12-31")
+        assert list(convert_parallel(path, workers=1)) == [GaianDate(12026, 3, 15), GaianDate(12026, 14, 4)]
+
+
+class TestErrors:
+    def test_bad_item_is_named(self):
+        with pytest.raises(ValueError, match="item 2"):
+            list(convert_parallel(["2026-03-09", "2026-03-10", "nope"], workers=1))
+
+    def test_bad_type(self):
+        with pytest.raises(ValueError, match="item 0"):
+            list(convert_parallel([20260309], workers=1))
+
+    def test_error_from_worker(self):
+        with pytest.raises(ValueError, match="nope"):
+            list(convert_parallel(["2026-03-09"] * 10 + ["nope"], workers=2, chunk_size=3))
+
+    def test_bad_line_in_file(self, tmp_path):
+        path = tmp_path / "d.txt"
+        path.write_text("2026-03-09\n\n")
+        with pytest.raises(ValueError, match="line 2"):
+            list(convert_parallel(path, workers=1))
+
+    def test_chunk_size(self):
+        with pytest.raises(ValueError):
+            convert_parallel(DAYS, chunk_size=0)
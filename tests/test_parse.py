@@ -0,0 +1,171 @@
+"""Tests for the parsing engine in _parse.py."""
+import pytest
+from gaian_calendar import GaianDate, GaianParser, parse_many
+from gaian_calendar._format import _TOKENS
+from gaian_calendar._parse import compile_parser, parse_fields
+
+
+class TestParseFields:
+    def test_iso_fast_path(self):
+        assert parse_fields("12026-03-15") == (12026, 3, 15)
+
+    def test_iso_single_digit_fields(self):
+        assert parse_fields("12026-3-5") == (12026, 3, 5)
+
+    def test_slash(self):
+        assert parse_fields("03/15/12026") == (12026, 3, 15)
+
+    def test_named(self):
+        assert parse_fields("Horus 7, 12026") == (12026, 14, 7)
+
+    def test_named_abbrev_with_period(self):
+        assert parse_fields("Aqu. 15, 12026") == (12026, 3, 15)
+
+    def test_surrounding_whitespace(self):
+        assert parse_fields("  12026-03-15\n") == (12026, 3, 15)
+
+    def test_ge_suffix_on_numeric(self):
+        assert parse_fields("12026-03-15 GE") == (12026, 3, 15)
+
+    def test_only_ge_suffix_is_removed(self):
+        # The old rstrip(" GE") ate any trailing G/E/space characters
+        with pytest.raises(ValueError):
+            parse_fields("Aquarius 15, 12026 EEG")
+
+    def test_invalid_date_raises(self):
+        with pytest.raises(ValueError):
+            parse_fields("12025-14-01")  # Horus in non-leap year
+
+    def test_fast_path_validates(self):
+        with pytest.raises(ValueError):
+            parse_fields("12026-03-29")
+
+    def test_unknown_month_raises(self):
+        with pytest.raises(ValueError):
+            parse_fields("Martius 1, 12026")
+
+    def test_repeated_strings_hit_cache(self):
+        parse_fields.cache_clear()
+        parse_fields("Aries 2, 12026")
+        parse_fields("Aries 2, 12026")
+        assert parse_fields.cache_info().hits == 1
+
+
+class TestParse:
+    def test_parse_returns_gaian_date(self):
+        d = GaianDate.parse("Aquarius 15, 12026 GE")
+        assert d == GaianDate(12026, 3, 15)
+        assert d.toordinal() == GaianDate(12026, 3, 15).toordinal()
+
+
+class TestParseMany:
+    def test_mixed_shapes(self):
+        strings = ["12026-03-15", "3/15/12026", "Aquarius 15, 12026 GE"]
+        assert list(parse_many(strings)) == [GaianDate(12026, 3, 15)] * 3
+
+    def test_is_lazy(self):
+        result = parse_many(iter(["12026-01-01", "bad"]))
+        assert next(result) == GaianDate(12026, 1, 1)
+        with pytest.raises(ValueError):
+            next(result)
+
+    def test_coerce(self):
+        assert list(parse_many(["bad", "12026-01-01"], errors="coerce")) == [
+            None, GaianDate(12026, 1, 1),
+        ]
+
+    def test_bad_errors_argument(self):
+        with pytest.raises(ValueError):
+            parse_many([], errors="ignore")
+
+
+class TestStrptime:
+    def test_weekday_pattern(self):
+        d = GaianDate.strptime("Monday, Aquarius 15, 12026 GE", "WWWW, MMMM d, yyyy GE")
+        assert d == GaianDate(12026, 3, 15)
+
+    def test_day_of_year(self):
+        assert GaianDate.strptime("12026-071", "yyyy-DDD") == GaianDate(12026, 3, 15)
+
+    def test_day_of_year_horus(self):
+        assert GaianDate.strptime("12026-371", "yyyy-DDD") == GaianDate(12026, 14, 7)
+
+    def test_words_and_symbols(self):
+        d = GaianDate.strptime("Twenty-first of ♒, 12026", "dddd of MMM*, yyyy")
+        assert d == GaianDate(12026, 3, 21)
+
+    def test_ordinal_and_abbrev(self):
+        assert GaianDate.strptime("22nd Aqu 12026", "ddd MMM yyyy") == GaianDate(12026, 3, 22)
+
+    def test_names_case_insensitive(self):
+        assert GaianDate.strptime("aquarius 1 12026", "MMMM d yyyy") == GaianDate(12026, 3, 1)
+
+    def test_two_digit_year(self):
+        assert GaianDate.strptime("03/15/26", "MM/dd/yy") == GaianDate(12026, 3, 15)
+        assert GaianDate.strptime("01/01/99", "MM/dd/yy").year == 11999
+
+    def test_compact_numeric(self):
+        assert GaianDate.strptime("120260315", "yyyyMMdd") == GaianDate(12026, 3, 15)
+
+    def test_roundtrip_format(self):
+        pattern = "W WWW dddd (ddd) MMMM MMM MM DDD yyyy GE"
+        for month in (1, 7, 13, 14):
+            for day in (1, 7):
+                d = GaianDate(12026, month, day)
+                assert GaianDate.strptime(d.format(pattern), pattern) == d
+
+    @pytest.mark.parametrize("pattern", [f"{token} yyyy-MM-dd" for token in _TOKENS] + [
+        "yyyyMdd", "dMMyyyy", "yyyyDDDM/d", "dddMyyyy", "M/d/yy", "M''d yyyy",
+    ])
+    def test_roundtrip_every_token(self, pattern):
+        parser = GaianParser(pattern)
+        for year in (12025, 12026):
+            for month in range(1, 15 if year == 12026 else 14):
+                for day in range(1, 8 if month == 14 else 29):
+                    d = GaianDate(year, month, day)
+                    assert parser.parse(d.format(pattern)) == (year, month, day)
+
+    @pytest.mark.parametrize("pattern", ["Md yyyy", "yyyydM", "Mddd yyyy", "d1M yyyy", "d'0'M yyyy"])
+    def test_adjacent_unpadded_numbers_raise(self, pattern):
+        with pytest.raises(ValueError, match="run together"):
+            GaianParser(pattern)
+
+    def test_quoted_literals_roundtrip(self):
+        d = GaianDate(12026, 3, 15)
+        for pattern in ("'Day' d 'of' MMMM, yyyy", "yyyy'M'MM'd'dd", "d''MMM''yy 'at' 'WWWW'"):
+            assert GaianDate.strptime(d.format(pattern), pattern) == d
+        assert GaianDate.strptime("Day 15 of Aquarius, 12026", "'Day' d 'of' MMMM, yyyy") == d
+
+    def test_wrong_weekday_raises(self):
+        with pytest.raises(ValueError, match="Weekday"):
+            GaianDate.strptime("Tuesday, Aquarius 15, 12026", "WWWW, MMMM d, yyyy")
+
+    def test_conflicting_day_of_year_raises(self):
+        with pytest.raises(ValueError):
+            GaianDate.strptime("Aquarius 15, 12026 (072)", "MMMM d, yyyy (DDD)")
+
+    def test_wrong_ordinal_suffix_raises(self):
+        with pytest.raises(ValueError):
+            GaianDate.strptime("22th Aqu 12026", "ddd MMM yyyy")
+
+    def test_mismatch_raises(self):
+        with pytest.raises(ValueError, match="does not match"):
+            GaianDate.strptime("12026-03-15", "MMMM d, yyyy")
+
+    def test_invalid_date_raises(self):
+        with pytest.raises(ValueError, match="leap"):
+            GaianDate.strptime("12025-365", "yyyy-DDD")
+
+    def test_pattern_without_year_raises(self):
+        with pytest.raises(ValueError, match="year"):
+            GaianParser("MMMM d")
+
+    def test_pattern_without_day_raises(self):
+        with pytest.raises(ValueError):
+            GaianParser("MMMM yyyy")
+
+    def test_parser_is_reusable_and_cached(self):
+        parser = compile_parser("yyyy-DDD")
+        assert parser is compile_parser("yyyy-DDD")
+        assert parser.parse("12026-001") == (12026, 1, 1)
+        assert parser.parse("12025-364") == (12025, 13, 28)
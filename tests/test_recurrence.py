@@ -0,0 +1,201 @@
+"""Tests for GaianRule and GaianRuleSet."""
+import pytest
+import itertools
+from gaian_calendar import GaianDate, GaianMonth, GaianRule, GaianRuleSet, GaianWeekday, is_leap_year
+from gaian_calendar._convert import month_index
+
+START = GaianDate(12020, 1, 1)
+
+
+def _scan(start, stop, keep):
+    """Reference: every date from start to stop (inclusive) that keep() accepts."""
+    days = (GaianDate.fromordinal(o) for o in range(start.toordinal(), stop.toordinal() + 1))
+    return [d for d in days if keep(d)]
+
+
+class TestExpansion:
+    def test_every_wednesday(self):
+        rule = GaianRule("weekly", START, weekdays=[GaianWeekday.WEDNESDAY])
+        assert [d.day for d in itertools.islice(rule, 5)] == [3, 10, 17, 24, 3]
+        assert all(d.day_of_week == 3 for d in itertools.islice(rule, 500))
+
+    def test_fifteenth_of_every_month_skips_horus(self):
+        rule = GaianRule("monthly", START, days=[15])
+        stop = GaianDate(12030, 1, 1)
+        assert list(rule.between(START, stop)) == _scan(START, stop, lambda d: d.day == 15)
+        assert all(d.month != 14 for d in rule.between(START, stop))
+
+    def test_horus_1_in_leap_years(self):
+        rule = GaianRule("yearly", GaianDate(12020, 14, 1))
+        years = [d.year for d in itertools.islice(rule, 4)]
+        assert years == [12020, 12026, 12032, 12037]
+        assert all(is_leap_year(y) for y in years)
+
+    def test_defaults_come_from_start(self):
+        start = GaianDate(12026, 3, 10)
+        assert GaianRule("yearly", start)[1] == GaianDate(12027, 3, 10)
+        assert GaianRule("monthly", start)[1] == GaianDate(12026, 4, 10)
+        assert GaianRule("weekly", start)[1] == GaianDate(12026, 3, 17)
+        assert GaianRule("daily", start)[1] == GaianDate(12026, 3, 11)
+
+    def test_negative_days_count_from_month_end(self):
+        rule = GaianRule("monthly", GaianDate(12026, 13, 1), days=[-1])
+        assert list(itertools.islice(rule, 3)) == [
+            GaianDate(12026, 13, 28), GaianDate(12026, 14, 7), GaianDate(12027, 1, 28),
+        ]
+
+    def test_negative_day_of_year(self):
+        rule = GaianRule("yearly", GaianDate(12025, 1, 1), days_of_year=[-1])
+        assert list(itertools.islice(rule, 2)) == [GaianDate(12025, 13, 28), GaianDate(12026, 14, 7)]
+
+    def test_leap_filter(self):
+        common = GaianRule("yearly", START, months=[GaianMonth.ARIES], days=[1], leap=False)
+        assert not any(is_leap_year(d.year) for d in itertools.islice(common, 50))
+
+    def test_intervals(self):
+        start = GaianDate(12026, 13, 5)
+        assert list(itertools.islice(GaianRule("monthly", start, interval=2), 3)) == [
+            GaianDate(12026, 13, 5), GaianDate(12027, 1, 5), GaianDate(12027, 3, 5),
+        ]
+        assert [d.year for d in itertools.islice(GaianRule("yearly", start, interval=3), 3)] == \
+            [12026, 12029, 12032]
+        every_other_week = GaianRule("weekly", START, interval=2, weekdays=[1, 5])
+        assert [d.day for d in itertools.islice(every_other_week, 4)] == [1, 5, 15, 19]
+
+    def test_matches_scan(self):
+        start, stop = GaianDate(12025, 11, 9), GaianDate(12028, 2, 1)
+        rule = GaianRule("monthly", start, interval=4, days=[1, -3, 6], weekdays=[1, 6, 7])
+        first = month_index(start.year, start.month)
+
+        def keep(d):
+            return ((month_index(d.year, d.month) - first) % 4 == 0
+                    and d.day_of_week in (1, 6, 7)
+                    and (d.day in (1, 6) or d.day == (7 if d.month == 14 else 28) - 2))
+
+        assert list(rule.between(start, stop)) == _scan(start, stop, keep)
+
+
+class TestBounds:
+    def test_count(self):
+        rule = GaianRule("daily", START, count=10)
+        assert len(rule) == 10
+        assert list(rule)[-1] == GaianDate(12020, 1, 10)
+
+    def test_until_is_inclusive(self):
+        rule = GaianRule("weekly", START, until=GaianDate(12020, 2, 1))
+        assert list(rule)[-1] == GaianDate(12020, 2, 1)
+
+    def test_ends_with_supported_range(self):
+        rule = GaianRule("yearly", START)
+        assert rule[-1] == GaianDate(19999, 1, 1)
+        assert len(rule) == 19999 - 12020 + 1
+
+    def test_empty(self):
+        rule = GaianRule("monthly", START, days=[15], weekdays=[3])
+        assert len(rule) == 0 and not rule
+        assert list(rule) == [] and rule.after(START) is None
+
+
+class TestQueries:
+    rule = GaianRule("monthly", START, days=[1, 15])
+
+    def test_getitem(self):
+        assert self.rule[0] == START
+        assert self.rule[3] == GaianDate(12020, 2, 15)
+        assert self.rule[-1] == list(self.rule)[-1]
+        with pytest.raises(IndexError):
+            self.rule[len(self.rule)]
+
+    def test_getitem_matches_iteration(self):
+        for n, d in zip(range(0, 10_000, 37), itertools.islice(self.rule, 0, 10_000, 37)):
+            assert self.rule[n] == d
+
+    def test_after_and_before(self):
+        d = GaianDate(12020, 14, 3)
+        assert self.rule.after(d) == GaianDate(12021, 1, 1)
+        assert self.rule.before(d) == GaianDate(12020, 14, 1)
+        assert self.rule.after(GaianDate(12020, 3, 15)) == GaianDate(12020, 4, 1)
+        assert self.rule.after(GaianDate(12020, 3, 15), inclusive=True) == GaianDate(12020, 3, 15)
+        assert self.rule.before(START) is None
+
+    def test_contains_and_index(self):
+        assert GaianDate(15000, 7, 15) in self.rule
+        assert GaianDate(15000, 7, 16) not in self.rule
+        assert GaianDate(12010, 1, 1) not in self.rule  # before start
+        assert self.rule[self.rule.index(GaianDate(15000, 7, 15))] == GaianDate(15000, 7, 15)
+        with pytest.raises(ValueError):
+            self.rule.index(GaianDate(15000, 7, 16))
+
+
+class TestCombining:
+    def test_intersection_of_same_shape_is_a_rule(self):
+        fridays = GaianRule("weekly", START, weekdays=[5])
+        thirteenth = GaianRule("monthly", START, days=[19])
+        both = fridays & thirteenth
+        assert isinstance(both, GaianRule)
+        assert both[0] == GaianDate(12020, 1, 19)
+        assert len(both) == len(thirteenth)
+
+    def test_union_of_same_shape_is_a_rule(self):
+        either = GaianRule("monthly", START, days=[1]) | GaianRule("monthly", START, days=[8])
+        assert isinstance(either, GaianRule)
+        assert list(itertools.islice(either, 3)) == [
+            GaianDate(12020, 1, 1), GaianDate(12020, 1, 8), GaianDate(12020, 2, 1),
+        ]
+
+    def test_other_shapes_make_a_rule_set(self):
+        every_third_day = GaianRule("daily", START, interval=3)
+        every_other_month = GaianRule("monthly", START, interval=2, days=[1, 2, 3])
+        stop = GaianDate(12021, 1, 1)
+        a = set(every_third_day.between(START, stop))
+        b = set(every_other_month.between(START, stop))
+
+        both = every_third_day & every_other_month
+        assert isinstance(both, GaianRuleSet)
+        assert list(both.between(START, stop)) == sorted(a & b)
+        either = every_third_day | every_other_month
+        assert list(either.between(START, stop)) == sorted(a | b)
+        assert either.after(GaianDate(12020, 3, 1)) == GaianDate(12020, 3, 2)
+        assert either.before(GaianDate(12020, 3, 1)) == GaianDate(12020, 2, 27)
+        assert START in both and GaianDate(12020, 3, 1) not in both
+
+    def test_union_with_different_bounds(self):
+        a = GaianRule("monthly", START, days=[1], count=2)
+        b = GaianRule("monthly", START, days=[2])
+        assert list(itertools.islice(a | b, 4)) == [
+            GaianDate(12020, 1, 1), GaianDate(12020, 1, 2), GaianDate(12020, 2, 1), GaianDate(12020, 2, 2),
+        ]
+
+    def test_empty_rule_does_not_leak_into_combinations(self):
+        until = GaianDate(12026, 3, 28)
+        start = GaianDate(12026, 1, 1)
+        empty = GaianRule("weekly", start, weekdays=[1], count=0, until=until)
+        wednesdays = GaianRule("weekly", start, weekdays=[3], until=until)
+        assert len(empty) == 0
+        assert list(empty | wednesdays) == list(wednesdays)
+        assert list(empty & GaianRule("daily", start, until=until)) == []
+
+    def test_rule_sets_flatten(self):
+        rules = [GaianRule("daily", START, interval=n) for n in (2, 3, 5)]
+        combined = rules[0] & rules[1] & rules[2]
+        assert isinstance(combined, GaianRule)  # cycles combine over their lcm
+        assert combined[1] == GaianDate.fromordinal(START.toordinal() + 30)
+
+
+class TestValidation:
+    @pytest.mark.parametrize("kwargs", [
+        {"freq": "hourly"}, {"interval": 0}, {"days": [29]}, {"days": [0]},
+        {"months": [15]}, {"weekdays": [8]}, {"days_of_year": [372]}, {"count": -1},
+    ])
+    def test_invalid(self, kwargs):
+        kwargs = {"freq": "daily", **kwargs}
+        with pytest.raises(ValueError):
+            GaianRule(kwargs.pop("freq"), START, **kwargs)
+
+    def test_interval_with_calendar_filter(self):
+        with pytest.raises(ValueError):
+            GaianRule("daily", START, interval=2, months=[1])
+
+    def test_repr(self):
+        assert repr(GaianRule("monthly", START, days=[15], count=3)) == \
+            "GaianRule('monthly', GaianDate(12020, 1, 1), days=(15,), count=3)"
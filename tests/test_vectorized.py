@@ -0,0 +1,206 @@
+"""Tests for the NumPy bulk conversions in _vectorized.py."""
+import pytest
+from datetime import date, timedelta
+
+np = pytest.importorskip("numpy")
+
+from gaian_calendar import (
+    GaianDate,
+    GaianHolidays,
+    add_workdays,
+    add_workdays_array,
+    gregorian_to_gaian_array,
+    gaian_to_gregorian_array,
+    timestamps_to_gaian,
+    valid_date_mask,
+    validate_date_array,
+    workdays_between,
+    workdays_between_array,
+)
+from gaian_calendar._convert import gregorian_to_gaian, timestamp_days, validate_date
+
+
+# ---------------------------------------------------------------------------
+# Gregorian → Gaian
+# ---------------------------------------------------------------------------
+
+class TestGregorianToGaianArray:
+    def test_known_dates(self):
+        values = np.array(["2025-12-29", "2026-02-22", "2026-12-28", "2026-12-31"],
+                          dtype="datetime64[D]")
+        years, months, days = gregorian_to_gaian_array(values)
+        assert years.tolist() == [12026, 12026, 12026, 12026]
+        assert months.tolist() == [1, 2, 14, 14]
+        assert days.tolist() == [1, 28, 1, 4]
+
+    def test_matches_scalar_across_many_years(self):
+        start = date(1990, 1, 1)
+        greg = [start + timedelta(days=n) for n in range(0, 20_000, 3)]
+        years, months, days = gregorian_to_gaian_array(np.array(greg, dtype="datetime64[D]"))
+        got = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        assert got == [gregorian_to_gaian(d) for d in greg]
+
+    def test_full_date_range_bounds(self):
+        values = np.array([date.min, date.max], dtype="datetime64[D]")
+        years, months, days = gregorian_to_gaian_array(values)
+        assert years.tolist() == [10_001, 19_999]
+        assert (months[1], days[1]) == gregorian_to_gaian(date.max)[1:]
+
+    def test_epoch_day_integers(self):
+        epoch_days = np.array([0, date(2026, 2, 22).toordinal() - date(1970, 1, 1).toordinal()])
+        years, months, days = gregorian_to_gaian_array(epoch_days)
+        assert (years[0], months[0], days[0]) == gregorian_to_gaian(date(1970, 1, 1))
+        assert (years[1], months[1], days[1]) == (12026, 2, 28)
+
+    def test_sub_day_units_floor_to_day(self):
+        values = np.array(["1969-12-31T23:59:59"], dtype="datetime64[s]")
+        years, months, days = gregorian_to_gaian_array(values)
+        assert (years[0], months[0], days[0]) == gregorian_to_gaian(date(1969, 12, 31))
+
+    def test_shape_preserved(self):
+        values = np.arange(12, dtype=np.int64).reshape(3, 4)
+        years, _, _ = gregorian_to_gaian_array(values)
+        assert years.shape == (3, 4)
+
+    def test_structured(self):
+        values = np.array(["2026-12-28"], dtype="datetime64[D]")
+        records = gregorian_to_gaian_array(values, structured=True)
+        assert records.dtype.names == ("year", "month", "day")
+        assert records[0].tolist() == (12026, 14, 1)
+
+    def test_out_of_range_raises_with_indices(self):
+        values = np.array(["2026-01-01", "NaT", "12000-01-01"], dtype="datetime64[D]")
+        with pytest.raises(ValueError, match=r"indices \[1, 2\]"):
+            gregorian_to_gaian_array(values)
+
+
+class TestTimestampsToGaian:
+    def test_matches_scalar(self):
+        ts = np.arange(-10**9, 2 * 10**9, 7_777_777, dtype=np.int64)
+        for unit, scale in (("s", 1), ("ns", 10**9)):
+            for offset in (0, -5 * 3600, timedelta(hours=9, minutes=30)):
+                years, months, days = timestamps_to_gaian(ts * scale, offset, unit)
+                expected = [gregorian_to_gaian(date.fromordinal(timestamp_days(t, offset) + 719_163))
+                            for t in ts.tolist()]
+                assert list(zip(years.tolist(), months.tolist(), days.tolist())) == expected
+
+    def test_floats_floor(self):
+        years, months, days = timestamps_to_gaian([1_773_014_400.0, 1_773_014_399.5])
+        assert days.tolist() == [15, 14]
+
+    def test_structured(self):
+        assert timestamps_to_gaian([1_773_014_400], structured=True)[0].tolist() == (12026, 3, 15)
+
+    def test_rejects_datetime64(self):
+        with pytest.raises(TypeError):
+            timestamps_to_gaian(np.array(["2026-01-01"], dtype="datetime64[D]"))
+
+
+# ---------------------------------------------------------------------------
+# Gaian → Gregorian
+# ---------------------------------------------------------------------------
+
+class TestGaianToGregorianArray:
+    def test_known_dates(self):
+        result = gaian_to_gregorian_array([12026, 12026, 12026], [1, 3, 14], [1, 1, 1])
+        assert result.dtype == np.dtype("datetime64[D]")
+        assert result.tolist() == [date(2025, 12, 29), date(2026, 2, 23), date(2026, 12, 28)]
+
+    def test_roundtrip_full_range(self):
+        epoch_days = np.arange(date.min.toordinal(), date.max.toordinal() + 1, 11) - 719_163
+        years, months, days = gregorian_to_gaian_array(epoch_days)
+        back = gaian_to_gregorian_array(years, months, days)
+        assert (back.view(np.int64) == epoch_days).all()
+
+    def test_broadcasts_scalars(self):
+        result = gaian_to_gregorian_array(12026, 3, np.arange(1, 29))
+        assert result.shape == (28,)
+        assert result[0] == np.datetime64("2026-02-23")
+
+    def test_invalid_raises_with_indices(self):
+        with pytest.raises(ValueError, match=r"indices \[1, 3\].*leap"):
+            gaian_to_gregorian_array([12026, 12025, 12026, 12026], [3, 14, 14, 14], [1, 1, 7, 8])
+
+    def test_validate_false_skips_check(self):
+        result = gaian_to_gregorian_array([12026], [3], [29], validate=False)
+        assert result[0] == np.datetime64("2026-03-23")  # Pisces 1
+
+
+class TestValidDateMask:
+    def test_horus_only_in_leap_years(self):
+        assert valid_date_mask([12025, 12026], 14, 1).tolist() == [False, True]
+
+    def test_day_limits(self):
+        mask = valid_date_mask(12026, [3, 3, 3, 14, 14], [0, 28, 29, 7, 8])
+        assert mask.tolist() == [False, True, False, True, False]
+
+    def test_month_limits(self):
+        assert valid_date_mask(12026, [0, 1, 13, 15], 1).tolist() == [False, True, True, False]
+
+    def test_year_range(self):
+        assert valid_date_mask([10_000, 10_001, 19_999, 20_000], 1, 1).tolist() == [
+            False, True, True, False,
+        ]
+
+    def test_matches_scalar_validate_date(self):
+        years = np.repeat([12025, 12026], 15 * 30)
+        months = np.tile(np.repeat(np.arange(15), 30), 2)
+        days = np.tile(np.arange(30), 30)
+        mask = valid_date_mask(years, months, days)
+        for y, m, d, ok in zip(years.tolist(), months.tolist(), days.tolist(), mask.tolist()):
+            try:
+                validate_date(y, m, d)
+                expected = True
+            except ValueError:
+                expected = False
+            assert ok is expected, (y, m, d)
+
+    def test_validate_date_array_passes(self):
+        validate_date_array([12026, 12025], [14, 13], [7, 28])  # should not raise
+
+    def test_validate_date_array_raises(self):
+        with pytest.raises(ValueError, match=r"indices \[0\]"):
+            validate_date_array([12026], [3], [29])
+
+
+# ---------------------------------------------------------------------------
+# Workdays
+# ---------------------------------------------------------------------------
+
+_START = GaianDate(12026, 3, 1).toordinal()
+
+
+class TestWorkdayArrays:
+    start = _START
+    holidays = GaianHolidays(GaianDate.fromordinal(_START + n) for n in range(0, 400, 9))
+
+    def test_add_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        ordinals = self.start + rng.integers(0, 300, 500)
+        n = rng.integers(-50, 50, 500)
+        result = add_workdays_array(ordinals, n, self.holidays)
+        expected = [add_workdays(GaianDate.fromordinal(int(o)), int(k), self.holidays).toordinal()
+                    for o, k in zip(ordinals, n)]
+        assert result.tolist() == expected
+
+    def test_between_matches_scalar(self):
+        rng = np.random.default_rng(1)
+        a = self.start + rng.integers(0, 300, 500)
+        b = a + rng.integers(-100, 100, 500)
+        result = workdays_between_array(a, b, self.holidays)
+        expected = [workdays_between(GaianDate.fromordinal(int(x)), GaianDate.fromordinal(int(y)),
+                                     self.holidays) for x, y in zip(a, b)]
+        assert result.tolist() == expected
+
+    def test_broadcast_scalar_n(self):
+        thursday = self.start + 3
+        assert add_workdays_array([thursday, thursday + 4], 1).tolist() == [thursday + 4, thursday + 5]
+
+    def test_out_of_range(self):
+        first = GaianDate(10001, 1, 1).toordinal()
+        with pytest.raises(ValueError, match=r"indices \[1\]"):
+            add_workdays_array([first, first], [1, -1])
+
+    def test_rejects_non_integers(self):
+        with pytest.raises(TypeError):
+            add_workdays_array(np.array([1.5]), 1)
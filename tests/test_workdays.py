@@ -0,0 +1,102 @@
+"""Tests for workday arithmetic in _workdays.py."""
+import pytest
+import random
+from datetime import date, timedelta
+from gaian_calendar import GaianDate, GaianHolidays, GaianWeekday, add_workdays, is_workday, workdays_between
+
+MONDAY = GaianDate(12026, 3, 1)
+
+
+def _step(d, n, holidays=()):
+    """Reference: walk day by day."""
+    ordinal, step = d.toordinal(), 1 if n > 0 else -1
+
+    def workday(o):
+        g = GaianDate.fromordinal(o)
+        return not GaianWeekday(g.day_of_week).is_sabbath and g not in holidays
+
+    if n == 0:
+        while not workday(ordinal):
+            ordinal += 1
+    for _ in range(abs(n)):
+        ordinal += step
+        while not workday(ordinal):
+            ordinal += step
+    return GaianDate.fromordinal(ordinal)
+
+
+class TestIsWorkday:
+    def test_sabbath(self):
+        assert [is_workday(MONDAY + timedelta(i)) for i in range(7)] == \
+            [True] * 4 + [False] * 3
+
+    def test_holiday(self):
+        assert not is_workday(MONDAY, [MONDAY])
+        assert is_workday(MONDAY, GaianHolidays([GaianDate(12026, 3, 2)]))
+
+
+class TestAddWorkdays:
+    def test_over_the_sabbath(self):
+        thursday = GaianDate(12026, 3, 4)
+        assert add_workdays(thursday, 1) == GaianDate(12026, 3, 8)
+        assert add_workdays(GaianDate(12026, 3, 8), -1) == thursday
+
+    def test_zero_rolls_forward(self):
+        assert add_workdays(GaianDate(12026, 3, 6), 0) == GaianDate(12026, 3, 8)
+        assert add_workdays(MONDAY, 0) == MONDAY
+
+    def test_closed_form_over_long_spans(self):
+        # 4 workdays a week, every week, every year
+        assert add_workdays(MONDAY, 10_000) == MONDAY + timedelta(weeks=2_500)
+        assert workdays_between(MONDAY, GaianDate(12036, 3, 1)) == 4 * (
+            (GaianDate(12036, 3, 1).toordinal() - MONDAY.toordinal()) // 7)
+
+    def test_matches_day_by_day(self):
+        rng = random.Random(0)
+        holidays = [GaianDate.fromordinal(MONDAY.toordinal() + rng.randrange(600)) for _ in range(60)]
+        index = GaianHolidays(holidays)
+        for _ in range(300):
+            d = GaianDate.fromordinal(MONDAY.toordinal() + rng.randrange(100, 500))
+            n = rng.randint(-40, 40)
+            assert add_workdays(d, n) == _step(d, n)
+            assert add_workdays(d, n, index) == _step(d, n, set(holidays))
+
+    def test_holidays_are_skipped(self):
+        holidays = GaianHolidays([GaianDate(12026, 3, 2), GaianDate(12026, 3, 3)])
+        assert add_workdays(MONDAY, 1, holidays) == GaianDate(12026, 3, 4)
+        assert add_workdays(GaianDate(12026, 3, 4), -1, holidays) == MONDAY
+
+    def test_out_of_range(self):
+        with pytest.raises(ValueError):
+            add_workdays(GaianDate(10001, 1, 1), -1)
+        with pytest.raises(ValueError):
+            add_workdays(GaianDate(19999, 13, 1), 100)
+
+
+class TestWorkdaysBetween:
+    def test_half_open(self):
+        assert workdays_between(MONDAY, GaianDate(12026, 3, 8)) == 4
+        assert workdays_between(MONDAY, MONDAY) == 0
+        assert workdays_between(GaianDate(12026, 3, 8), MONDAY) == -4
+
+    def test_holidays(self):
+        holidays = [GaianDate(12026, 3, 2), GaianDate(12026, 3, 6)]  # the 6th is a sabbath
+        assert workdays_between(MONDAY, GaianDate(12026, 3, 8), holidays) == 3
+
+    def test_round_trip(self):
+        holidays = GaianHolidays([GaianDate(12026, 3, 10), GaianDate(12026, 4, 1)])
+        for n in range(-30, 31):
+            assert workdays_between(MONDAY, add_workdays(MONDAY, n, holidays), holidays) == n
+
+
+class TestGaianHolidays:
+    def test_sorted_unique_workdays_only(self):
+        holidays = GaianHolidays([GaianDate(12026, 3, 3), GaianDate(12026, 3, 2),
+                                  GaianDate(12026, 3, 2), GaianDate(12026, 3, 5)])
+        assert list(holidays) == [GaianDate(12026, 3, 2), GaianDate(12026, 3, 3)]
+        assert len(holidays) == 2
+
+    def test_accepts_gregorian_dates(self):
+        holidays = GaianHolidays([date(2026, 3, 2)])
+        assert GaianDate.from_gregorian(date(2026, 3, 2)) in holidays
+        assert "2026-03-02" not in holidays